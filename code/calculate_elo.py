@@ -41,9 +41,9 @@ from typing import Dict, Optional, Any, List, Tuple
 import duckdb
 
 try:
-	from .config import get_db_path
+	from .config import connect_db
 except ImportError:
-	from config import get_db_path
+	from config import connect_db
 
 try:
 	from tqdm.auto import tqdm  # type: ignore
@@ -595,7 +595,7 @@ def fetch_matches_ordered(conn: duckdb.DuckDBPyConnection, incremental: bool = T
 			  AND m.winner_name IS NOT NULL 
 			  AND m.loser_name IS NOT NULL
 			  AND m.elo_computed_at IS NULL
-			ORDER BY t.start_date NULLS LAST, m.event_id
+			ORDER BY t.start_date NULLS LAST, m.event_id, m.rowid
 			"""
 		).fetchall()
 	else:
@@ -610,7 +610,7 @@ def fetch_matches_ordered(conn: duckdb.DuckDBPyConnection, incremental: bool = T
 			FROM matches m
 			JOIN tournaments t ON t.event_id = m.event_id
 			WHERE COALESCE(m.bye, FALSE) = FALSE AND m.winner_name IS NOT NULL AND m.loser_name IS NOT NULL
-			ORDER BY t.start_date NULLS LAST, m.event_id
+			ORDER BY t.start_date NULLS LAST, m.event_id, m.rowid
 			"""
 		).fetchall()
 	# Sort within event explicitly by round order
@@ -626,7 +626,7 @@ def run(recalculate: bool = False) -> None:
 	logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 	log = logging.getLogger(__name__)
 
-	conn = duckdb.connect(str(get_db_path()))
+	conn = connect_db()
 	ensure_matches_elo_columns(conn)
 	ensure_wrestlers_table(conn)
 	ensure_wrestler_history_table(conn)
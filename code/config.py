@@ -8,13 +8,18 @@ Environment Variables:
     GOVERNING_BODY_ID: Numeric ID for TrackWrestling's gbId parameter (default: 38)
     GOVERNING_BODY_ACRONYM: Short identifier for DB names, etc. (default: NYSPHSAA)
     GOVERNING_BODY_NAME: Full display name (default: New York State Public High School Athletic Association)
+    DUCKDB_THREADS: DuckDB worker threads (default: CPU count)
+    DUCKDB_MEMORY_LIMIT: DuckDB memory cap before spilling to disk (default: DuckDB's own, 80% of RAM)
 """
 
 from __future__ import annotations
 
 import os
+import tempfile
 from pathlib import Path
 
+import duckdb
+
 # Attempt to load .env from project root
 try:
     from dotenv import load_dotenv
@@ -43,6 +48,18 @@ GOVERNING_BODY_NAME: str = os.getenv(
 )
 
 
+# ----- DuckDB Settings -----
+
+# Worker threads for DuckDB queries
+DUCKDB_THREADS: int = int(os.getenv("DUCKDB_THREADS", str(os.cpu_count() or 4)))
+if DUCKDB_THREADS < 1:
+    raise ValueError(f"DUCKDB_THREADS must be a positive integer, got {DUCKDB_THREADS}")
+
+# Memory cap; larger operations spill to a temp directory instead of swapping.
+# Unset leaves DuckDB's default in place
+DUCKDB_MEMORY_LIMIT: str | None = os.getenv("DUCKDB_MEMORY_LIMIT") or None
+
+
 # ----- Derived Values -----
 
 def get_db_filename() -> str:
@@ -59,3 +76,16 @@ def get_db_path() -> Path:
 # Convenience alias for backwards compatibility
 DB_PATH = get_db_path()
 
+
+def connect_db(read_only: bool = False) -> duckdb.DuckDBPyConnection:
+    """Open the governing body database with tuned DuckDB settings."""
+    # Passed as connect-time config so DuckDB validates the values itself
+    config: dict[str, str | int | bool] = {
+        "threads": DUCKDB_THREADS,
+        "temp_directory": str(Path(tempfile.gettempdir()) / "duckdb"),
+        # Appends don't need insertion order preserved; lets DuckDB parallelize more freely
+        "preserve_insertion_order": False,
+    }
+    if DUCKDB_MEMORY_LIMIT:
+        config["memory_limit"] = DUCKDB_MEMORY_LIMIT
+    return duckdb.connect(str(get_db_path()), read_only=read_only, config=config)
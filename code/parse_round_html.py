@@ -1,7 +1,7 @@
 """
 Parse saved Round Results HTML from tournament_rounds.raw_html into a matches table.
 
-- Iterates tournament_rounds where raw_html IS NOT NULL and parsed_ok is NULL/False
+- Iterates tournament_rounds with saved HTML (raw_html_zst, or legacy raw_html) and parsed_ok is NULL/False
 - For each row, parses the HTML DOM looking for <section class="tw-list">
     - Under this section, there will be a sequence of <h2> and <ul> elements.
     - Each <h2> text becomes weight_class for subsequent <ul> siblings until next <h2>.
@@ -18,18 +18,28 @@ Run with uv:
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 from typing import List, Optional, Dict, Any, Tuple
 import re
+import sys
 
 from bs4 import BeautifulSoup, Tag
 import duckdb
 from tqdm import tqdm
 
 try:
-    from .config import get_db_path
+    # Optional accelerator for match text extraction (pip install wrestling-stats[optional])
+    from selectolax.lexbor import LexborHTMLParser
 except ImportError:
-    from config import get_db_path
+    LexborHTMLParser = None
+
+try:
+    from .config import connect_db
+    from .shared_trackwrestling import compress_legacy_rounds, decompress_html, ensure_rounds_table
+except ImportError:
+    from config import connect_db
+    from shared_trackwrestling import compress_legacy_rounds, decompress_html, ensure_rounds_table
 
 
 def ensure_schema(conn: duckdb.DuckDBPyConnection) -> None:
@@ -92,7 +102,9 @@ def ensure_schema(conn: duckdb.DuckDBPyConnection) -> None:
             ALTER TABLE matches ADD COLUMN {name} {typ}
             """)
 
-    # tournament_rounds is created with full schema by the scraper shared module
+    # tournament_rounds is created with full schema by the scraper shared module;
+    # ensure it here too so older databases get the raw_html_zst column
+    ensure_rounds_table(conn)
 
 
 def fetch_unparsed_round_html(conn: duckdb.DuckDBPyConnection, reparse: bool = False) -> List[tuple]:
@@ -100,18 +112,19 @@ def fetch_unparsed_round_html(conn: duckdb.DuckDBPyConnection, reparse: bool = F
     if reparse:
         rows = conn.execute(
             """--sql
-            SELECT event_id, round_id, label, raw_html
+            SELECT event_id, round_id, label, raw_html, raw_html_zst
             FROM tournament_rounds
-            WHERE raw_html IS NOT NULL
+            WHERE raw_html IS NOT NULL OR raw_html_zst IS NOT NULL
             ORDER BY event_id, round_id
             """
         ).fetchall()
     else:
         rows = conn.execute(
             """--sql
-            SELECT event_id, round_id, label, raw_html
+            SELECT event_id, round_id, label, raw_html, raw_html_zst
             FROM tournament_rounds
-            WHERE raw_html IS NOT NULL AND COALESCE(parsed_ok, FALSE) = FALSE
+            WHERE (raw_html IS NOT NULL OR raw_html_zst IS NOT NULL)
+              AND COALESCE(parsed_ok, FALSE) = FALSE
             ORDER BY event_id, round_id
             """
         ).fetchall()
@@ -247,7 +260,8 @@ def parse_round_html(raw_html: str) -> List[tuple]:
                 # Get match summary HTML (inner HTML of the match cell)
                 match_html = match_cell.decode_contents()
                 if match_html and match_html.strip():
-                    results.append((weight_class, match_html))
+                    # A meet repeats the same dozen or so weights; share one string per weight
+                    results.append((sys.intern(weight_class), match_html))
         
         if results:  # If we found dual meet data, return it
             return results
@@ -263,7 +277,7 @@ def parse_round_html(raw_html: str) -> List[tuple]:
             continue
         tag = (child.name or "").lower()
         if tag == "h2":
-            current_weight = (child.get_text(" ", strip=True) or "").strip()
+            current_weight = sys.intern((child.get_text(" ", strip=True) or "").strip())
         elif tag == "ul" and current_weight:
             # Each <li> under this <ul> is a match
             lis = child.find_all("li", recursive=False)
@@ -285,13 +299,28 @@ def _normalize_text(s: str) -> str:
     return " ".join((s or "").replace("\xa0", " ").split())
 
 
+def _match_text(raw_li: str) -> str:
+    """Plain, whitespace-normalized text of one match's HTML.
+
+    Uses selectolax when installed, otherwise BeautifulSoup; text nodes are
+    joined with a space either way so the result is the same.
+    """
+    if LexborHTMLParser is not None:
+        body = LexborHTMLParser(raw_li).body
+        return _normalize_text(body.text(separator=" ") if body is not None else "")
+    return _normalize_text(BeautifulSoup(raw_li, "html.parser").get_text(" "))
+
+
+# 'Keyvon (kj) Riley' -> 'Keyvon Riley' (case-insensitive, flexible spacing)
+_KEYVON_KJ_RE = re.compile(r"Keyvon\s*\(\s*kj\s*\)\s*Riley", re.I)
+
+
 def _fix_known_issues(s: str) -> str:
     """Apply targeted cleanup rules to raw input text before parsing.
     Start with specific substitutions; extend as new issues are found.
     """
     try:
-        # Normalize 'Keyvon (kj) Riley' -> 'Keyvon Riley' (case-insensitive, flexible spacing)
-        s = re.sub(r"Keyvon\s*\(\s*kj\s*\)\s*Riley", "Keyvon Riley", s, flags=re.I)
+        s = _KEYVON_KJ_RE.sub("Keyvon Riley", s)
     except Exception:
         pass
     return s
@@ -337,13 +366,9 @@ TEAM_CONVERSIONS_RAW: List[Tuple[str, str]] = [
     (r"\s+Wrestling\s+Club\b", ""),
     (r"\s+Youth\s+Wrestling\b", ""),
     (r"\s+Wrestling\b", ""),
-    # Remove HS/Sr HS/Jr HS/Jr suffixes (apply after other specific conversions)
-    (r"\s+High\s+School\b", ""),
-    (r"\s+School\b", ""),
-    (r"\s+Sr\s+HS\b", ""),
-    (r"\s+Jr\s+HS\b", ""),
-    (r"\s+HS\b", ""),
-    (r"\s+Jr\b", ""),
+    # Remove High School/School/Sr HS/Jr HS/HS/Jr suffixes (apply after other specific conversions).
+    # One alternation, one pass; longer forms are listed first so "Jr HS" wins over "Jr"
+    (r"\s+(?:High\s+School|School|Sr\s+HS|Jr\s+HS|HS|Jr)\b", ""),
     # Remove dash followed by numbers (e.g., "Team-2" -> "Team")
     (r"-\d+$", ""),
     # Remove dash followed by a single letter (e.g., "Team-A" -> "Team", "Team- C" -> "Team")
@@ -394,6 +419,11 @@ def _extract_team_with_parens(text: str, start_pos: int) -> tuple[str, int]:
     return "", start_pos
 
 
+# Win-loss record after a team, e.g. "(Team) 17-21"
+_RECORD_RE = re.compile(r'^\d+-\d+')
+_RECORD_WITH_SPACE_RE = re.compile(r'^\d+-\d+\s*')
+
+
 def _parse_wrestler_team(text: str) -> tuple[Optional[str], Optional[str], int]:
     """Parse 'Name (Team) [record]' pattern, handling nested parens in team names.
     
@@ -404,8 +434,6 @@ def _parse_wrestler_team(text: str) -> tuple[Optional[str], Optional[str], int]:
     Returns:
         Tuple of (wrestler_name, team_name, end_position)
     """
-    import re as _re
-    
     # Find the LAST opening paren that has a matching closing paren
     # But stop if we encounter a record (e.g., "17-21") after a parenthetical group
     last_team_start = -1
@@ -424,7 +452,7 @@ def _parse_wrestler_team(text: str) -> tuple[Optional[str], Optional[str], int]:
                 
                 # Check if there's a record after this parenthetical
                 remaining = text[pos:].lstrip()
-                record_match = _re.match(r'^\d+-\d+', remaining)
+                record_match = _RECORD_RE.match(remaining)
                 if record_match:
                     # Found a record - this is definitely the team, stop searching
                     break
@@ -444,7 +472,7 @@ def _parse_wrestler_team(text: str) -> tuple[Optional[str], Optional[str], int]:
     
     # Skip optional record (e.g., "17-21") after the team
     remaining = text[end_pos:].lstrip()
-    record_match = _re.match(r'^\d+-\d+\s*', remaining)
+    record_match = _RECORD_WITH_SPACE_RE.match(remaining)
     if record_match:
         end_pos += len(text[end_pos:]) - len(remaining) + len(record_match.group(0))
     
@@ -465,8 +493,6 @@ def _parse_wrestler_team_first(text: str) -> tuple[Optional[str], Optional[str],
     Returns:
         Tuple of (wrestler_name, team_name, end_position)
     """
-    import re as _re
-    
     # Collect all parenthetical groups with their positions
     candidates = []
     pos = 0
@@ -477,7 +503,7 @@ def _parse_wrestler_team_first(text: str) -> tuple[Optional[str], Optional[str],
             if end_pos > pos:  # Successfully extracted
                 # Check if followed by a record
                 remaining_after = text[end_pos:].lstrip()
-                has_record = bool(_re.match(r'^\d+-\d+', remaining_after))
+                has_record = bool(_RECORD_RE.match(remaining_after))
                 
                 # Calculate heuristic score for being a team name
                 score = 0
@@ -526,13 +552,15 @@ def _parse_wrestler_team_first(text: str) -> tuple[Optional[str], Optional[str],
     
     # Skip optional record (e.g., "17-21") after the team
     remaining = text[end_pos:].lstrip()
-    record_match = _re.match(r'^\d+-\d+\s*', remaining)
+    record_match = _RECORD_WITH_SPACE_RE.match(remaining)
     if record_match:
         end_pos += len(text[end_pos:]) - len(remaining) + len(record_match.group(0))
     
     return wrestler_name, team_name, end_pos
 
 
+# The same wrestlers and teams appear in many different match lines
+@functools.lru_cache(maxsize=16384)
 def _normalize_person_name(name: Optional[str]) -> Optional[str]:
     if not name:
         return name
@@ -547,6 +575,7 @@ def _normalize_person_name(name: Optional[str]) -> Optional[str]:
     return " ".join(out.split())
 
 
+@functools.lru_cache(maxsize=16384)
 def _normalize_team_name(team: Optional[str]) -> Optional[str]:
     return _apply_conversions(team, TEAM_CONVERSIONS)
 
@@ -637,13 +666,144 @@ def _apply_name_team_conversions(out: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 
+# -----------------------------
+# Match text patterns
+# -----------------------------
+# Compiled once at import; parse_match_text tries them in this order.
+
+# Dual meet team score rows: just a number like '72.0' or '-3.0'
+_SCORE_ROW_RE = re.compile(r'^-?\d+\.?\d*$')
+
+# A (Team) and B (Team) DFF/DDQ
+_DOUBLE_FORFEIT_RE = re.compile(
+    r"^(?P<a>.+?) \((?P<ateam>.*?)\)(?:\s+\d+-\d+)?\s+and\s+(?P<b>.+?) \((?P<bteam>.*?)\)(?:\s+\d+-\d+)?\s+(?:\((?P<code>DFF|DDQ)\)|(?P<code2>DFF|DDQ))$",
+    re.I,
+)
+
+# Winner (Team) received a bye
+_BYE_RE = re.compile(r"^(?P<win>.+?) \((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+received a bye", re.I)
+
+# A (Team) vs B (Team), no decision yet
+_VS_RE = re.compile(
+    r"^(?P<a>.+?)\s+\((?P<ateam>.*?)\)(?:\s+\d+-\d+)?\s+vs\s+(?P<b>.+?)\s+\((?P<bteam>.*?)\)(?:\s+\d+-\d+)?",
+    re.I,
+)
+
+# Winner (Team) won in <code> by <dtype> over Loser (Team) ...
+_WON_IN_BY_RE = re.compile(
+    r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won in\s+(?P<code>[A-Za-z0-9-]+)\s+by\s+(?P<dtype>.+?)\s+over\s+"
+    r"(?P<lose>.+?)\s+\((?P<lteam>[^)]+)\)(?:\s+\d+-\d+)?\s*"
+    r"(?:\((?P<dcode_paren>.+?)(?:\s+\((?P<dtype_paren>[^)]+)\))?\s+(?:(?P<ftime_paren>\d+:\d+)|(?P<score_paren>\d+-\d+))\)|(?P<score>\d+-\d+))?$",
+    re.I,
+)
+
+# Winner (Team) won in <dtype> over Loser (Team) <code> <score|time>
+_WON_IN_RE = re.compile(
+    r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won in\s+(?P<dtype>.+?)\s+over\s+"
+    r"(?P<lose>.+?)\s+\((?P<lteam>.*?)\)(?:\s+\d+-\d+)?\s+"
+    r"(?:\((?P<dcode_paren>[A-Za-z0-9][A-Za-z0-9. -]*?)(?:\s+(?P<ftime_paren>\d+:\d+))?(?:\s+(?P<score_paren>\d+-\d+))?\)"
+    r"|(?P<dcode>(?![0-9]+-[0-9]+)[A-Za-z0-9-]+)(?:\s+\((?P<dnote>[^)]+)\))?(?:\s+(?P<score>\d+-\d+)|\s+(?P<ftime>\d+:\d+))?)$",
+    re.I,
+)
+
+# Code and score/time after the loser in the manual 'won by' parse
+_WON_BY_CODE_RE = re.compile(
+    r'^(?:\((?P<dcode_paren>[A-Za-z0-9][A-Za-z0-9. -]*?)(?:\s+(?P<ftime_paren>\d+:\d+))?(?:\s+\((?P<score_paren_nested>\d+-\d+)\)|(?:\s+(?P<score_paren>\d+-\d+)))?\)|(?P<dcode>(?![0-9]+-[0-9]+)[A-Za-z0-9-]+)(?:\s+\((?P<dnote>[^)]+)\))?(?:\s+(?P<score>\d+-\d+)|\s+(?P<ftime>\d+:\d+))?)$',
+)
+
+# Winner (Team) won by forfeit over () FF
+_FORFEIT_EMPTY_RE = re.compile(
+    r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won by\s+(?P<dtype>forfeit)\s+over\s+\(\)\s*(?P<dcode>[A-Za-z0-9.]+)?$",
+    re.I,
+)
+
+# Winner (Team) won by <dtype> over Loser (Team) <code> <score|time>
+_WON_BY_RE = re.compile(
+    r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won by\s+(?P<dtype>.+?)\s+over\s+"
+    r"(?P<lose>.+?)\s+\((?P<lteam>.*?)\)(?:\s+\d+-\d+)?\s+"
+    r"(?:\((?P<dcode_paren>[A-Za-z0-9][A-Za-z0-9. -]*?)(?:\s+(?P<ftime_paren>\d+:\d+))?(?:\s+\((?P<score_paren_nested>\d+-\d+)\)|(?:\s+(?P<score_paren>\d+-\d+)))?\)"
+    r"|(?P<dcode>(?![0-9]+-[0-9]+)[A-Za-z0-9-]+)(?:\s+\((?P<dnote>[^)]+)\))?(?:\s+(?P<score>\d+-\d+)|\s+(?P<ftime>\d+:\d+))?)$",
+    re.I,
+)
+
+# Code (Details) score/time after the loser in the manual 'over' parse
+_OVER_CODE_RE = re.compile(r'^([A-Za-z0-9-]+)(?:\s+\(([^)]+)\))?(?:\s+(\d+-\d+|\d+:\d+))?')
+
+# Winner (Team) over Loser (Team) <code> <score|time>
+_OVER_RE = re.compile(
+    r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+over\s+"
+    r"(?P<lose>.+?)\s+\((?P<lteam>.*?)\)(?:\s+\d+-\d+)?\s+"
+    r"(?P<dcode>[A-Za-z0-9-]+)(?:\s+(?P<score>\d+-\d+)|\s+(?P<ftime>\d+:\d+))?",
+    re.I,
+)
+
+# Code and score/time after the loser in the manual 'won over' parse
+_WON_OVER_CODE_RE = re.compile(r'^(\S+)(?:\s+(\d+-\d+|\d+:\d+))?')
+
+# Winner (Team) won over Loser (Team) <code> <score|time>
+_WON_OVER_RE = re.compile(
+    r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won over\s+"
+    r"(?P<lose>.+?)\s+\((?P<lteam>.*?)\)(?:\s+\d+-\d+)?\s+"
+    r"(?P<dcode>\S+)(?:\s+(?P<score>\d+-\d+)|\s+(?P<ftime>\d+:\d+))?",
+    re.I,
+)
+
+# decision_type for the codes seen after 'over'; any code containing FALL is
+# also a fall
+_OVER_DECISION_TYPES = {
+    "SV-1": "sudden victory",
+    "SV1": "sudden victory",
+    "PIN": "fall",
+    "MD": "major decision",
+    "MAJ": "major decision",
+    "TF": "tech fall",
+    "DEC": "decision",
+    "D": "decision",
+    "FORF": "forfeit",
+    "OT": "overtime",
+    "TB-1": "overtime",
+    "TB-2": "overtime",
+    "UTB": "overtime",
+}
+
+# decision_type for the codes seen after 'won over'
+_WON_OVER_DECISION_TYPES = {
+    "SV-1": "sudden victory",
+    "SV1": "sudden victory",
+    "MD": "major decision",
+    "TF": "tech fall",
+    "OT": "overtime",
+    "UTB": "ultimate tiebreaker",
+    "FALL": "fall",
+    "PIN": "fall",
+    "DEC": "decision",
+}
+
+# Winner (Team) won by <dtype> over Loser (Team), nothing after
+_WON_BY_MINIMAL_RE = re.compile(
+    r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won by\s+(?P<dtype>.+?)\s+over\s+(?P<lose>.+?)\s+\((?P<lteam>.*?)\)(?:\s+\d+-\d+)?",
+    re.I,
+)
+
+
 def parse_match_text(raw_text: str) -> Dict[str, Any]:
     """Parse a single match text line into structured fields.
     Returns keys: round_detail, winner_name, winner_team, decision_type,
     loser_name, loser_team, decision_type_code, winner_points, loser_points, fall_time, bye.
     """
-    import re as _re
+    # Cached results are shared between callers, so each call gets its own copy
+    return dict(_parse_match_text_cached(raw_text))
+
+
+def parse_match_text_many(texts: List[str]) -> List[Dict[str, Any]]:
+    """Parse a batch of match text lines; same results as parse_match_text on each."""
+    cached = _parse_match_text_cached
+    return [dict(cached(text)) for text in texts]
 
+
+# Byes, forfeits and score rows repeat across rounds and events
+@functools.lru_cache(maxsize=65536)
+def _parse_match_text_cached(raw_text: str) -> Dict[str, Any]:
     # First, fix known data issues, then normalize whitespace
     text = _fix_known_issues(raw_text)
     text = _normalize_text(text)
@@ -663,7 +823,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
 
     # Skip dual meet score summary rows (just team scores, no match data)
     # These appear as simple numbers like "72.0", "30.0", or adjustments like "-1.0", "-3.0", "-7.0"
-    if _re.match(r'^-?\d+\.?\d*$', text.strip()):
+    if _SCORE_ROW_RE.match(text.strip()):
         out["bye"] = True
         out["decision_type"] = "bye"
         out["decision_type_code"] = "SCORE"
@@ -684,16 +844,22 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
     else:
         rest = text
 
+    # Lower-cased once for the keyword checks that pick a format below. Each
+    # pattern is only tried when its literal keyword (e.g. " won by ") is
+    # present; the text is whitespace-normalized, so a plain substring check
+    # cannot rule out a line the pattern would match
+    rest_lower = rest.lower()
+
     # Double forfeit case (standalone text)
-    if rest.strip().lower() == "double forfeit":
+    if rest_lower.strip() == "double forfeit":
         out["decision_type"] = "bye"
         out["decision_type_code"] = "DFF"
         out["bye"] = True
         return out
 
     # DFF (double forfeit) or DDQ (double disqualification) case: "A (Team) and B (Team) DFF/DDQ"
-    if "dff" in rest.lower() or "ddq" in rest.lower():
-        m = _re.search(r"^(?P<a>.+?) \((?P<ateam>.*?)\)(?:\s+\d+-\d+)?\s+and\s+(?P<b>.+?) \((?P<bteam>.*?)\)(?:\s+\d+-\d+)?\s+(?:\((?P<code>DFF|DDQ)\)|(?P<code2>DFF|DDQ))$", rest, _re.I)
+    if "dff" in rest_lower or "ddq" in rest_lower:
+        m = _DOUBLE_FORFEIT_RE.search(rest)
         if m:
             # Store both participants; treat as a bye to skip Elo
             out["winner_name"] = m.group("a").strip()
@@ -706,8 +872,8 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
             return _apply_name_team_conversions(out)
 
     # Bye case
-    if "received a bye" in rest.lower():
-        m = _re.search(r"^(?P<win>.+?) \((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+received a bye", rest, _re.I)
+    if "received a bye" in rest_lower:
+        m = _BYE_RE.search(rest)
         if m:
             out["winner_name"] = m.group("win").strip()
             out["winner_team"] = m.group("wteam").strip()
@@ -717,7 +883,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
         return _apply_name_team_conversions(out)
 
     # "X vs Y" format (no decision yet, treat as bye)
-    m_vs = _re.search(r"^(?P<a>.+?)\s+\((?P<ateam>.*?)\)(?:\s+\d+-\d+)?\s+vs\s+(?P<b>.+?)\s+\((?P<bteam>.*?)\)(?:\s+\d+-\d+)?", rest, _re.I)
+    m_vs = _VS_RE.search(rest) if " vs " in rest_lower else None
     if m_vs:
         out["winner_name"] = m_vs.group("a").strip()
         out["winner_team"] = m_vs.group("ateam").strip()
@@ -732,13 +898,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
     # This handles cases like "Jax Engh (Team) won in SV-1 by fall over Nathan Taylor (Team) (SV-1 (Fall) 6:30)"
     # Also handles: "won in TB-3 by riding time over ... (TB-3 (RT) 2-2)"
     # The team name should not include trailing content - use [^)]+ to stop at first )
-    m_in_by = _re.search(
-        r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won in\s+(?P<code>[A-Za-z0-9-]+)\s+by\s+(?P<dtype>.+?)\s+over\s+"
-        r"(?P<lose>.+?)\s+\((?P<lteam>[^)]+)\)(?:\s+\d+-\d+)?\s*"
-        r"(?:\((?P<dcode_paren>.+?)(?:\s+\((?P<dtype_paren>[^)]+)\))?\s+(?:(?P<ftime_paren>\d+:\d+)|(?P<score_paren>\d+-\d+))\)|(?P<score>\d+-\d+))?$",
-        rest,
-        _re.I,
-    )
+    m_in_by = _WON_IN_BY_RE.search(rest) if " won in " in rest_lower else None
     if m_in_by:
         out["winner_name"] = m_in_by.group("win").strip()
         out["winner_team"] = m_in_by.group("wteam").strip()
@@ -778,14 +938,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
 
     # "Won in <type>" cases (e.g., sudden victory - 1, double overtime)
     # Handles both formats: "SV-1 16-14" and "(SV-1 16-14)" and "(2-OT 7-5)"
-    m_in = _re.search(
-        r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won in\s+(?P<dtype>.+?)\s+over\s+"
-        r"(?P<lose>.+?)\s+\((?P<lteam>.*?)\)(?:\s+\d+-\d+)?\s+"
-        r"(?:\((?P<dcode_paren>[A-Za-z0-9][A-Za-z0-9. -]*?)(?:\s+(?P<ftime_paren>\d+:\d+))?(?:\s+(?P<score_paren>\d+-\d+))?\)"
-        r"|(?P<dcode>(?![0-9]+-[0-9]+)[A-Za-z0-9-]+)(?:\s+\((?P<dnote>[^)]+)\))?(?:\s+(?P<score>\d+-\d+)|\s+(?P<ftime>\d+:\d+))?)$",
-        rest,
-        _re.I,
-    )
+    m_in = _WON_IN_RE.search(rest) if " won in " in rest_lower else None
     if m_in:
         out["winner_name"] = m_in.group("win").strip()
         out["winner_team"] = m_in.group("wteam").strip()
@@ -825,8 +978,8 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
 
     # "Won by" format with manual parsing to handle nicknames in parentheses
     # Try manual parsing first for "won by" format to handle names like "Bilegt (Billy) Arslan (Mclean)"
-    if " won by " in rest.lower() and " over " in rest.lower():
-        won_by_pos = rest.lower().find(" won by ")
+    if " won by " in rest_lower and " over " in rest_lower:
+        won_by_pos = rest_lower.find(" won by ")
         if won_by_pos > 0:
             # Parse winner (use LAST parens for team to handle nicknames)
             winner_text = rest[:won_by_pos]
@@ -851,10 +1004,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
                         
                         # Handle both parenthetical and non-parenthetical codes
                         # Patterns: (Code time (score)), (Code time score), (Code score), Code score, Code time
-                        code_match = _re.match(
-                            r'^(?:\((?P<dcode_paren>[A-Za-z0-9][A-Za-z0-9. -]*?)(?:\s+(?P<ftime_paren>\d+:\d+))?(?:\s+\((?P<score_paren_nested>\d+-\d+)\)|(?:\s+(?P<score_paren>\d+-\d+)))?\)|(?P<dcode>(?![0-9]+-[0-9]+)[A-Za-z0-9-]+)(?:\s+\((?P<dnote>[^)]+)\))?(?:\s+(?P<score>\d+-\d+)|\s+(?P<ftime>\d+:\d+))?)$',
-                            remaining
-                        )
+                        code_match = _WON_BY_CODE_RE.match(remaining)
                         
                         if code_match or not remaining:  # Match or no code at all
                             out["winner_name"] = winner_name
@@ -889,11 +1039,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
                             return _apply_name_team_conversions(out)
 
     # Special case: forfeit with empty loser name - "won by forfeit over () FF"
-    m_forfeit_empty = _re.search(
-        r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won by\s+(?P<dtype>forfeit)\s+over\s+\(\)\s*(?P<dcode>[A-Za-z0-9.]+)?$",
-        rest,
-        _re.I,
-    )
+    m_forfeit_empty = _FORFEIT_EMPTY_RE.search(rest) if " over ()" in rest_lower else None
     if m_forfeit_empty:
         out["winner_name"] = m_forfeit_empty.group("win").strip()
         out["winner_team"] = m_forfeit_empty.group("wteam").strip()
@@ -910,14 +1056,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
     # Also handles codes with spaces: (M. For.)
     # Also handles codes starting with numbers: (2-OT 7-5)
     # Note: Parenthetical codes must be checked first to avoid matching record "0-2" as decision code
-    m = _re.search(
-        r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won by\s+(?P<dtype>.+?)\s+over\s+"
-        r"(?P<lose>.+?)\s+\((?P<lteam>.*?)\)(?:\s+\d+-\d+)?\s+"
-        r"(?:\((?P<dcode_paren>[A-Za-z0-9][A-Za-z0-9. -]*?)(?:\s+(?P<ftime_paren>\d+:\d+))?(?:\s+\((?P<score_paren_nested>\d+-\d+)\)|(?:\s+(?P<score_paren>\d+-\d+)))?\)"
-        r"|(?P<dcode>(?![0-9]+-[0-9]+)[A-Za-z0-9-]+)(?:\s+\((?P<dnote>[^)]+)\))?(?:\s+(?P<score>\d+-\d+)|\s+(?P<ftime>\d+:\d+))?)$",
-        rest,
-        _re.I,
-    )
+    m = _WON_BY_RE.search(rest) if " won by " in rest_lower else None
     if m:
         out["winner_name"] = m.group("win").strip()
         out["winner_team"] = m.group("wteam").strip()
@@ -952,8 +1091,8 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
     # Dual meet simplified format: Winner (Team) over Loser (Team) <Decision> <score|time>
     # This format omits "won by" and just uses "over"
     # Try manual parsing first to handle nested parentheses in team names
-    if " over " in rest.lower():
-        over_pos = rest.lower().find(" over ")
+    if " over " in rest_lower:
+        over_pos = rest_lower.find(" over ")
         if over_pos > 0:
             # Parse winner (use FIRST parens since decision code might have parens too)
             winner_text = rest[:over_pos]
@@ -971,7 +1110,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
                     
                     # Try to extract decision code with optional parenthetical details and score/time
                     # Pattern: Code (Details) time/score OR Code time/score
-                    code_match = _re.match(r'^([A-Za-z0-9-]+)(?:\s+\(([^)]+)\))?(?:\s+(\d+-\d+|\d+:\d+))?', remaining)
+                    code_match = _OVER_CODE_RE.match(remaining)
                     if code_match:
                         out["winner_name"] = winner_name
                         out["winner_team"] = winner_team or ""
@@ -996,21 +1135,11 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
                                 out["decision_type"] = "tech fall"
                             else:
                                 out["decision_type"] = paren_detail.lower()
-                        elif code_up in ("SV-1", "SV1"):
-                            out["decision_type"] = "sudden victory"
-                        elif "FALL" in code_up or code_up == "PIN":
+                        elif "FALL" in code_up:
                             out["decision_type"] = "fall"
-                        elif code_up in ("MD", "MAJ"):
-                            out["decision_type"] = "major decision"
-                        elif code_up == "TF":
-                            out["decision_type"] = "tech fall"
-                        elif code_up in ("DEC", "D"):
-                            out["decision_type"] = "decision"
-                        elif code_up == "FORF":
-                            out["decision_type"] = "forfeit"
-                        elif code_up in ("OT", "TB-1", "TB-2", "UTB"):
-                            out["decision_type"] = "overtime"
-                        
+                        elif code_up in _OVER_DECISION_TYPES:
+                            out["decision_type"] = _OVER_DECISION_TYPES[code_up]
+
                         # Capture score or fall time
                         if code_match.group(3):
                             if ':' in code_match.group(3):
@@ -1029,13 +1158,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
                         return _apply_name_team_conversions(out)
     
     # Fallback to regex for simple cases without nested parens
-    m_simple = _re.search(
-        r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+over\s+"
-        r"(?P<lose>.+?)\s+\((?P<lteam>.*?)\)(?:\s+\d+-\d+)?\s+"
-        r"(?P<dcode>[A-Za-z0-9-]+)(?:\s+(?P<score>\d+-\d+)|\s+(?P<ftime>\d+:\d+))?",
-        rest,
-        _re.I,
-    )
+    m_simple = _OVER_RE.search(rest) if " over " in rest_lower else None
     if m_simple:
         out["winner_name"] = m_simple.group("win").strip()
         out["winner_team"] = m_simple.group("wteam").strip()
@@ -1045,21 +1168,11 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
         
         # Infer decision_type from code
         code_up = out["decision_type_code"].upper()
-        if code_up in ("SV-1", "SV1"):
-            out["decision_type"] = "sudden victory"
-        elif "FALL" in code_up or code_up == "PIN":
+        if "FALL" in code_up:
             out["decision_type"] = "fall"
-        elif code_up in ("MD", "MAJ"):
-            out["decision_type"] = "major decision"
-        elif code_up == "TF":
-            out["decision_type"] = "tech fall"
-        elif code_up in ("DEC", "D"):
-            out["decision_type"] = "decision"
-        elif code_up == "FORF":
-            out["decision_type"] = "forfeit"
-        elif code_up in ("OT", "TB-1", "UTB"):
-            out["decision_type"] = "overtime"
-        
+        elif code_up in _OVER_DECISION_TYPES:
+            out["decision_type"] = _OVER_DECISION_TYPES[code_up]
+
         # Capture score or fall time
         score = m_simple.group("score")
         ftime = m_simple.group("ftime")
@@ -1077,8 +1190,8 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
     # Variant: Winner (Team) won over Loser (Team) <CODE> <score|time>
     # Some entries omit the explicit decision phrase; we still capture code and numbers.
     # Try manual parsing first to handle nested parentheses in team names
-    if " won over " in rest.lower():
-        won_over_pos = rest.lower().find(" won over ")
+    if " won over " in rest_lower:
+        won_over_pos = rest_lower.find(" won over ")
         if won_over_pos > 0:
             # Parse winner (use FIRST parens to avoid confusion with decision code parens)
             winner_text = rest[:won_over_pos]
@@ -1094,7 +1207,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
                     remaining = after_won_over[loser_end:].lstrip()
                     
                     # Try to extract decision code and optional score/time
-                    code_match = _re.match(r'^(\S+)(?:\s+(\d+-\d+|\d+:\d+))?', remaining)
+                    code_match = _WON_OVER_CODE_RE.match(remaining)
                     if code_match:
                         out["winner_name"] = winner_name
                         out["winner_team"] = winner_team or ""
@@ -1104,17 +1217,9 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
                         
                         # Infer a decision_type from common codes when possible
                         code_up = out["decision_type_code"].upper()
-                        if code_up in ("SV-1", "SV1"):
-                            out["decision_type"] = "sudden victory"
-                        elif code_up in ("MD", "TF", "OT", "UTB"):
-                            # We'll map these broadly; detailed type can still be read from code
-                            mapping = {"MD": "major decision", "TF": "tech fall", "OT": "overtime", "UTB": "ultimate tiebreaker"}
-                            out["decision_type"] = mapping.get(code_up, None)
-                        elif code_up in ("FALL", "PIN"):
-                            out["decision_type"] = "fall"
-                        elif code_up == "DEC":
-                            out["decision_type"] = "decision"
-                        
+                        if code_up in _WON_OVER_DECISION_TYPES:
+                            out["decision_type"] = _WON_OVER_DECISION_TYPES[code_up]
+
                         # Capture score or fall time
                         if code_match.group(2):
                             if ':' in code_match.group(2):
@@ -1133,13 +1238,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
                         return _apply_name_team_conversions(out)
     
     # Fallback to regex for simple cases without nested parens
-    m_over = _re.search(
-        r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won over\s+"
-        r"(?P<lose>.+?)\s+\((?P<lteam>.*?)\)(?:\s+\d+-\d+)?\s+"
-        r"(?P<dcode>\S+)(?:\s+(?P<score>\d+-\d+)|\s+(?P<ftime>\d+:\d+))?",
-        rest,
-        _re.I,
-    )
+    m_over = _WON_OVER_RE.search(rest) if " won over " in rest_lower else None
     if m_over:
         out["winner_name"] = m_over.group("win").strip()
         out["winner_team"] = m_over.group("wteam").strip()
@@ -1148,16 +1247,8 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
         out["decision_type_code"] = m_over.group("dcode").strip()
         # Infer a decision_type from common codes when possible
         code_up = out["decision_type_code"].upper()
-        if code_up in ("SV-1", "SV1"):
-            out["decision_type"] = "sudden victory"
-        elif code_up in ("MD", "TF", "OT", "UTB"):
-            # We'll map these broadly; detailed type can still be read from code
-            mapping = {"MD": "major decision", "TF": "tech fall", "OT": "overtime", "UTB": "ultimate tiebreaker"}
-            out["decision_type"] = mapping.get(code_up, None)
-        elif code_up in ("FALL", "PIN"):
-            out["decision_type"] = "fall"
-        elif code_up == "DEC":
-            out["decision_type"] = "decision"
+        if code_up in _WON_OVER_DECISION_TYPES:
+            out["decision_type"] = _WON_OVER_DECISION_TYPES[code_up]
         # Capture score or fall time
         score = m_over.group("score")
         ftime = m_over.group("ftime")
@@ -1173,7 +1264,7 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
         return _apply_name_team_conversions(out)
 
     # Fallback minimal parse without code/score
-    m2 = _re.search(r"^(?P<win>.+?)\s+\((?P<wteam>.*?)\)(?:\s+\d+-\d+)?\s+won by\s+(?P<dtype>.+?)\s+over\s+(?P<lose>.+?)\s+\((?P<lteam>.*?)\)(?:\s+\d+-\d+)?", rest, _re.I)
+    m2 = _WON_BY_MINIMAL_RE.search(rest) if " won by " in rest_lower else None
     if m2:
         out["winner_name"] = m2.group("win").strip()
         out["winner_team"] = m2.group("wteam").strip()
@@ -1185,6 +1276,9 @@ def parse_match_text(raw_text: str) -> Dict[str, Any]:
     return _apply_name_team_conversions(out)
 
 
+parse_match_text.cache_clear = _parse_match_text_cached.cache_clear  # type: ignore[attr-defined]
+
+
 def run(reparse: bool = False) -> None:
     # Custom logging handler that uses tqdm.write to avoid interfering with progress bar
     class TqdmLoggingHandler(logging.Handler):
@@ -1201,9 +1295,14 @@ def run(reparse: bool = False) -> None:
     handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
     logger.addHandler(handler)
 
-    conn = duckdb.connect(str(get_db_path()))
+    conn = connect_db()
     ensure_schema(conn)
 
+    # One-time upgrade: compress rounds saved before raw_html_zst existed
+    converted = compress_legacy_rounds(conn)
+    if converted:
+        logger.info("Compressed HTML for %d legacy rounds", converted)
+
     rows = fetch_unparsed_round_html(conn, reparse=reparse)
     if not rows:
         logger.info("No unparsed round HTML found.")
@@ -1218,13 +1317,15 @@ def run(reparse: bool = False) -> None:
 
     logger.info("Parsing %d rounds...", len(rows))
     
-    for event_id, round_id, label, raw_html in tqdm(rows, desc="Parsing rounds", unit="round"):
+    for event_id, round_id, label, raw_html, raw_html_zst in tqdm(rows, desc="Parsing rounds", unit="round"):
         try:
+            if raw_html_zst is not None:
+                raw_html = decompress_html(raw_html_zst)
             items: List[Tuple[str, str]] = parse_round_html(raw_html)
             saved = 0
             for weight_class, raw_li in items:
                 # Extract plain text for structured parsing
-                txt = _normalize_text(BeautifulSoup(raw_li, "html.parser").get_text(" "))
+                txt = _match_text(raw_li)
                 fields = parse_match_text(txt)
                 row = {
                     "event_id": event_id,
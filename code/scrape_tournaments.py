@@ -22,6 +22,7 @@ CLI examples (run with uv):
 - uv run code.scrape_tournaments --start-date 09/01/2024 --end-date 06/30/2025
 - uv run code.scrape_tournaments --lookback-weeks 2  # Last 2 weeks
 - uv run code.scrape_tournaments --lookback-weeks 4 --max-tournaments 25  # Last 4 weeks, limit 25 tournaments
+- uv run code.scrape_tournaments --lookback-weeks 4 --workers 4  # Scrape 4 events at a time
 """
 
 from __future__ import annotations
@@ -29,11 +30,14 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+import queue
 import re
+import threading
 import time
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import duckdb
 import httpx
@@ -41,12 +45,18 @@ from bs4 import BeautifulSoup
 
 # Import from package modules
 try:
-    from .shared_trackwrestling import ensure_rounds_table, parse_rounds
-    from .config import get_db_path, GOVERNING_BODY_ACRONYM, GOVERNING_BODY_ID
+    from .shared_trackwrestling import (
+        ensure_rounds_table, extract_results_fragment, find_selector_frame, parse_rounds,
+        reset_session_cache, upsert_rounds, wait_for_selector_frame,
+    )
+    from .config import connect_db, get_db_path, GOVERNING_BODY_ACRONYM, GOVERNING_BODY_ID
 except ImportError:
     # Fallback for direct script execution
-    from shared_trackwrestling import ensure_rounds_table, parse_rounds
-    from config import get_db_path, GOVERNING_BODY_ACRONYM, GOVERNING_BODY_ID
+    from shared_trackwrestling import (
+        ensure_rounds_table, extract_results_fragment, find_selector_frame, parse_rounds,
+        reset_session_cache, upsert_rounds, wait_for_selector_frame,
+    )
+    from config import connect_db, get_db_path, GOVERNING_BODY_ACRONYM, GOVERNING_BODY_ID
 
 
 logger = logging.getLogger(__name__)
@@ -110,11 +120,54 @@ EXCLUDED_TOURNAMENT_IDS = [
     "938862132", #'Bert Ernst Memorial
 ]
 
+# Elements that show a dual meet results page is loaded (chart links or bout selector)
+DUAL_MEET_CONTENT_SELECTOR = "ul.top-links li.top-link a[href*='chartId='], select#boutNumberBox"
+_DUAL_MEET_PAGE_RE = re.compile(r"/(DualMeet\w*\.jsp)")
+
+# Resource types never needed for scraping; aborted at the network layer.
+# Stylesheets are kept since link visibility checks depend on layout.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+# Third-party hosts (consent manager, analytics, ads) aborted regardless of type
+BLOCKED_URL_PARTS = (
+    "osano",
+    "google-analytics",
+    "googletagmanager",
+    "doubleclick",
+    "googlesyndication",
+)
+
+# Cookie consent dialog buttons (Osano)
+COOKIE_BUTTON_SELECTOR = (
+    "button:has-text('Accept'), "
+    "button:has-text('Dismiss'), "
+    "button.osano-cm-accept, "
+    "button.osano-cm-dialog__close"
+)
+
+# Open a fresh page after this many events to bound per-page memory growth
+PAGE_RECYCLE_INTERVAL = 20
+
+# Browser storage state saved next to the database between runs
+STORAGE_STATE_FILENAME = "playwright_state.json"
+# Cookies cleared between events: everything except the Osano consent cookies
+_SESSION_COOKIE_RE = re.compile(r"^(?!osano)")
+
+# Tournament listing pages fetched at once during discovery
+DISCOVERY_CONCURRENCY = 4
+
+# Finished events whose rounds are saved together in one transaction
+COMMIT_INTERVAL = 50
+
 def _get_timestamp() -> str:
     """Generate TIM parameter (milliseconds since epoch)."""
     return str(int(time.time() * 1000))
 
 
+def _session_query(event_id: str) -> str:
+    """Build the TIM/session/tournament query string shared by an event's URLs."""
+    return f"TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}&tournamentId={event_id}"
+
+
 # ============================================================================
 # Data Models
 # ============================================================================
@@ -130,6 +183,8 @@ class Tournament:
     venue_name: Optional[str] = None
     city: Optional[str] = None
     state: Optional[str] = None
+    start_date_obj: Optional[date] = None  # start_date parsed once at discovery
+    year: Optional[int] = None  # From name, falling back to start_date
 
     @property
     def event_type_path(self) -> str:
@@ -147,28 +202,12 @@ class Tournament:
 # ============================================================================
 
 def ensure_db(conn: duckdb.DuckDBPyConnection) -> None:
-    """Ensure the tournaments table exists."""
-    conn.execute(
-        """--sql
-        CREATE TABLE IF NOT EXISTS tournaments (
-            event_id TEXT PRIMARY KEY,
-            name TEXT,
-            year INTEGER,
-            start_date DATE,
-            end_date DATE,
-            address TEXT,
-            venue TEXT,
-            street TEXT,
-            city TEXT,
-            state TEXT,
-            postal_code TEXT,
-            event_type_id INTEGER,
-            event_type_name TEXT,
-            first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """
-    )
-    # Backfill: add event_type columns if missing (for existing databases)
+    """
+    Ensure the tournaments table exists.
+
+    Checks the catalog first so an up-to-date database costs a single
+    read-only query instead of DDL on every run.
+    """
     cols = set(
         r[0]
         for r in conn.execute(
@@ -179,6 +218,31 @@ def ensure_db(conn: duckdb.DuckDBPyConnection) -> None:
             """
         ).fetchall()
     )
+    if not cols:
+        conn.execute(
+            """--sql
+            CREATE TABLE IF NOT EXISTS tournaments (
+                event_id TEXT PRIMARY KEY,
+                name TEXT,
+                year INTEGER,
+                start_date DATE,
+                end_date DATE,
+                address TEXT,
+                venue TEXT,
+                street TEXT,
+                city TEXT,
+                state TEXT,
+                postal_code TEXT,
+                event_type_id INTEGER,
+                event_type_name TEXT,
+                discovered_path TEXT,
+                first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            """
+        )
+        return
+
+    # Backfill: add newer columns if missing (for existing databases)
     if "event_type_id" not in cols:
         conn.execute("""--sql
         ALTER TABLE tournaments ADD COLUMN event_type_id INTEGER
@@ -187,6 +251,10 @@ def ensure_db(conn: duckdb.DuckDBPyConnection) -> None:
         conn.execute("""--sql
         ALTER TABLE tournaments ADD COLUMN event_type_name TEXT
         """)
+    if "discovered_path" not in cols:
+        conn.execute("""--sql
+        ALTER TABLE tournaments ADD COLUMN discovered_path TEXT
+        """)
 
 
 def upsert_tournament(
@@ -223,6 +291,16 @@ def upsert_tournament(
     )
 
 
+def set_discovered_path(conn: duckdb.DuckDBPyConnection, event_id: str, type_path: str) -> None:
+    """Remember the URL path segment that successfully served an event's results."""
+    conn.execute(
+        """--sql
+        UPDATE tournaments SET discovered_path = ? WHERE event_id = ?
+        """,
+        [type_path, event_id],
+    )
+
+
 def cleanup_orphaned_tournaments(conn: duckdb.DuckDBPyConnection) -> int:
     """
     Delete tournaments that have no rounds or no matches.
@@ -312,15 +390,28 @@ def cleanup_orphaned_tournaments(conn: duckdb.DuckDBPyConnection) -> int:
 # HTTP Tournament Discovery
 # ============================================================================
 
+_WHITESPACE_RE = re.compile(r"\s+")
+# MM/DD - MM/DD/YYYY
+_DATE_SPAN_SAME_YEAR_RE = re.compile(r"^(\d{1,2}/\d{1,2})\s*-\s*(\d{1,2}/\d{1,2}/(\d{4}))$")
+# MM/DD/YYYY - MM/DD/YYYY
+_DATE_SPAN_RE = re.compile(r"^(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})$")
+# Single date MM/DD/YYYY
+_SINGLE_DATE_RE = re.compile(r"^(\d{1,2}/\d{1,2}/\d{4})$")
+# "City, ST" on the last venue line
+_CITY_STATE_RE = re.compile(r"^([^,]+),\s*([A-Z]{2})")
+# Pagination text like "1 - 30 of 160"
+_PAGINATION_RE = re.compile(r"(\d+)\s*-\s*(\d+)\s+of\s+(\d+)")
+
+
 def _parse_date_range(text: str) -> Tuple[Optional[str], Optional[str]]:
     """Parse date range text to ISO format dates."""
     if not text:
         return None, None
 
-    text = re.sub(r"\s+", " ", text.strip())
+    text = _WHITESPACE_RE.sub(" ", text.strip())
 
     # MM/DD - MM/DD/YYYY
-    m = re.match(r"^(\d{1,2}/\d{1,2})\s*-\s*(\d{1,2}/\d{1,2}/(\d{4}))$", text)
+    m = _DATE_SPAN_SAME_YEAR_RE.match(text)
     if m:
         year = m.group(3)
         start_parts = m.group(1).split("/")
@@ -330,7 +421,7 @@ def _parse_date_range(text: str) -> Tuple[Optional[str], Optional[str]]:
         return start, end
 
     # MM/DD/YYYY - MM/DD/YYYY
-    m = re.match(r"^(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})$", text)
+    m = _DATE_SPAN_RE.match(text)
     if m:
         s = m.group(1).split("/")
         e = m.group(2).split("/")
@@ -340,7 +431,7 @@ def _parse_date_range(text: str) -> Tuple[Optional[str], Optional[str]]:
         )
 
     # Single date MM/DD/YYYY
-    m = re.match(r"^(\d{1,2}/\d{1,2}/\d{4})$", text)
+    m = _SINGLE_DATE_RE.match(text)
     if m:
         parts = m.group(1).split("/")
         iso = f"{parts[2]}-{parts[0].zfill(2)}-{parts[1].zfill(2)}"
@@ -359,24 +450,34 @@ def _parse_venue(text: str) -> Tuple[Optional[str], Optional[str], Optional[str]
     city = state = None
 
     if len(lines) > 1:
-        m = re.match(r"^([^,]+),\s*([A-Z]{2})", lines[-1])
+        m = _CITY_STATE_RE.match(lines[-1])
         if m:
             city, state = m.group(1).strip(), m.group(2)
 
     return venue_name, city, state
 
 
+# Tournament anchors carry eventSelected(eventId, 'name', eventType, ...) in href or onclick
+EVENT_ANCHOR_SELECTOR = 'a[href*="eventSelected"], a[onclick*="eventSelected"]'
+_EVENT_SELECTED_RE = re.compile(r"eventSelected\((\d+),\s*'([^']*)',\s*(\d+)")
+
+
+def _as_soup(doc: "str | BeautifulSoup") -> BeautifulSoup:
+    """Parse HTML unless it is already a BeautifulSoup document."""
+    return doc if isinstance(doc, BeautifulSoup) else BeautifulSoup(doc, "html.parser")
+
+
 def _parse_tournament_item(li) -> Optional[Tournament]:
     """Parse a single tournament list item from BeautifulSoup."""
     # Find anchor with eventSelected call
-    anchor = li.select_one('a[href*="eventSelected"], a[onclick*="eventSelected"]')
+    anchor = li.select_one(EVENT_ANCHOR_SELECTOR)
     if not anchor:
         return None
 
     href = anchor.get("href", "") or anchor.get("onclick", "")
 
     # Extract: eventSelected(eventId, 'name', eventType, ...)
-    match = re.search(r"eventSelected\((\d+),\s*'([^']*)',\s*(\d+)", href)
+    match = _EVENT_SELECTED_RE.search(href)
     if not match:
         return None
 
@@ -397,6 +498,17 @@ def _parse_tournament_item(li) -> Optional[Tournament]:
         venue_text = venue_span.get_text(separator="\n")
         venue_name, city, state = _parse_venue(venue_text)
 
+    # Parse start date and year once so callers can compare directly
+    start_date_obj = None
+    if start_date:
+        try:
+            start_date_obj = date.fromisoformat(start_date)
+        except ValueError:
+            pass
+    year = event_year_from_name(name) if name else None
+    if year is None and start_date_obj:
+        year = start_date_obj.year
+
     return Tournament(
         event_id=event_id,
         name=name,
@@ -406,12 +518,14 @@ def _parse_tournament_item(li) -> Optional[Tournament]:
         venue_name=venue_name,
         city=city,
         state=state,
+        start_date_obj=start_date_obj,
+        year=year,
     )
 
 
-def _parse_tournament_list(html: str) -> List[Tournament]:
-    """Parse tournament list from HTML response."""
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_tournament_list(html: "str | BeautifulSoup") -> List[Tournament]:
+    """Parse tournament list from an HTML response (or its already-parsed soup)."""
+    soup = _as_soup(html)
     tournaments = []
 
     for li in soup.select(".tournament-ul > li"):
@@ -426,9 +540,9 @@ def _parse_tournament_list(html: str) -> List[Tournament]:
     return tournaments
 
 
-def _parse_pagination_info(html: str) -> Tuple[int, int, int]:
+def _parse_pagination_info(html: "str | BeautifulSoup") -> Tuple[int, int, int]:
     """
-    Parse pagination info from HTML response.
+    Parse pagination info from an HTML response (or its already-parsed soup).
     
     Looks for pattern like "1 - 30 aof 160" in dataGridNextPrev div.
     
@@ -436,7 +550,7 @@ def _parse_pagination_info(html: str) -> Tuple[int, int, int]:
         Tuple of (start_index, end_index, total_count)
         Returns (0, 0, 0) if no pagination info found.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _as_soup(html)
     
     # Look for the pagination div
     pagination_div = soup.select_one(".dataGridNextPrev")
@@ -447,7 +561,7 @@ def _parse_pagination_info(html: str) -> Tuple[int, int, int]:
     for span in pagination_div.find_all("span"):
         text = span.get_text(strip=True)
         # Match pattern like "1 - 30 of 160"
-        match = re.match(r"(\d+)\s*-\s*(\d+)\s+of\s+(\d+)", text)
+        match = _PAGINATION_RE.match(text)
         if match:
             start_idx = int(match.group(1))
             end_idx = int(match.group(2))
@@ -475,7 +589,7 @@ async def discover_tournaments_async(
     """
     url = f"{BASE_URL}/Login.jsp"
     all_tournaments: List[Tournament] = []
-    page_index = 0  # TrackWrestling uses 0-based page index
+    page_count = 1
     # TrackWrestling returns ~30 results per page
 
     async with httpx.AsyncClient(
@@ -486,7 +600,10 @@ async def discover_tournaments_async(
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         },
     ) as client:
-        while True:
+        semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+        async def fetch_page(page_index: int) -> Tuple[List[Tournament], Tuple[int, int, int]]:
+            # page_index is TrackWrestling's 0-based tournamentIndex
             params = {
                 "TIM": _get_timestamp(),
                 "twSessionId": GENERIC_SESSION_ID,
@@ -503,43 +620,52 @@ async def discover_tournaments_async(
                 "city": "",
                 "camps": "false",
             }
-
-            try:
+            async with semaphore:
                 response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                # Parse tournaments from this page
-                page_tournaments = _parse_tournament_list(response.text)
-                
-                # Parse pagination info
-                start_idx, end_idx, total_count = _parse_pagination_info(response.text)
-                
-                if page_tournaments:
-                    all_tournaments.extend(page_tournaments)
-                    logger.debug(
-                        "Page %d: found %d tournaments (showing %d-%d of %d)",
-                        page_index, len(page_tournaments), start_idx, end_idx, total_count
-                    )
-                
-                # Check if there are more pages
-                # If no pagination info found, or we've reached the last page, stop
-                if total_count == 0 or end_idx >= total_count or not page_tournaments:
-                    break
-                
-                # Move to next page
-                page_index += 1
-                
-                # Safety limit to prevent infinite loops
-                if page_index > 100:
-                    logger.warning(f"{Colors.YELLOW}Reached page limit (100), stopping pagination{Colors.RESET}")
-                    break
-                    
-            except httpx.HTTPStatusError as e:
-                logger.error("HTTP error discovering tournaments (page %d): %s", page_index, e)
-                break
-            except Exception as e:
-                logger.error("Error discovering tournaments (page %d): %s", page_index, e)
-                break
+            response.raise_for_status()
+
+            # Parse the page once; tournaments and pagination read the same soup
+            soup = BeautifulSoup(response.text, "html.parser")
+            page_tournaments = _parse_tournament_list(soup)
+            pagination = _parse_pagination_info(soup)
+            logger.debug(
+                "Page %d: found %d tournaments (showing %d-%d of %d)",
+                page_index, len(page_tournaments), *pagination
+            )
+            return page_tournaments, pagination
+
+        # The first page tells us how many pages there are; the rest are then
+        # fetched concurrently instead of one after another
+        try:
+            page_tournaments, (start_idx, end_idx, total_count) = await fetch_page(0)
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error discovering tournaments (page 0): %s", e)
+            page_tournaments, total_count = [], 0
+        except Exception as e:
+            logger.error("Error discovering tournaments (page 0): %s", e)
+            page_tournaments, total_count = [], 0
+        all_tournaments.extend(page_tournaments)
+
+        # If no pagination info found, or the first page was the last, stop
+        if page_tournaments and total_count and end_idx < total_count:
+            page_size = max(end_idx - start_idx + 1, 1)
+            page_count = -(-total_count // page_size)
+
+            # Safety limit to prevent runaway pagination
+            if page_count > 101:
+                logger.warning(f"{Colors.YELLOW}Reached page limit (100), stopping pagination{Colors.RESET}")
+                page_count = 101
+
+            results = await asyncio.gather(
+                *(fetch_page(i) for i in range(1, page_count)), return_exceptions=True
+            )
+            for page_index, result in enumerate(results, start=1):
+                if isinstance(result, httpx.HTTPStatusError):
+                    logger.error("HTTP error discovering tournaments (page %d): %s", page_index, result)
+                elif isinstance(result, Exception):
+                    logger.error("Error discovering tournaments (page %d): %s", page_index, result)
+                else:
+                    all_tournaments.extend(result[0])
 
     # Deduplicate by event_id (in case of any overlap)
     seen_ids = set()
@@ -551,7 +677,7 @@ async def discover_tournaments_async(
 
     logger.info(
         "Discovered %d tournaments across %d pages (gbId=%s, dates=%s to %s)",
-        len(unique_tournaments), page_index + 1, governing_body_id, start_date, end_date
+        len(unique_tournaments), page_count, governing_body_id, start_date, end_date
     )
     return unique_tournaments
 
@@ -565,91 +691,833 @@ def discover_tournaments(start_date: str, end_date: str) -> List[Tournament]:
 # URL Building
 # ============================================================================
 
-def build_session_urls(event_id: str, event_type: int) -> Tuple[str, str]:
+def build_session_urls(
+    event_id: str,
+    event_type: int,
+    type_path: Optional[str] = None,
+    session_query: Optional[str] = None,
+) -> Tuple[str, str]:
     """
     Build URLs to access a tournament's Round Results page.
 
+    Args:
+        event_id: TrackWrestling tournament ID
+        event_type: Tournament type (1-5)
+        type_path: URL path segment override (e.g. a previously discovered path)
+        session_query: Precomputed query from _session_query (shared across an event's URLs)
+
     Returns:
         Tuple of (verify_password_url, round_results_url)
 
     The VerifyPassword.jsp call establishes the tournament session (viewer access),
     then RoundResults.jsp can be accessed directly.
     """
-    type_path = TOURNAMENT_TYPE_PATHS.get(event_type, "opentournaments")
-    timestamp = _get_timestamp()
+    type_path = type_path or TOURNAMENT_TYPE_PATHS.get(event_type, "opentournaments")
+    query = session_query or _session_query(event_id)
 
     # VerifyPassword.jsp establishes tournament session (viewer login, no credentials)
     verify_url = (
         f"{BASE_URL}/{type_path}/VerifyPassword.jsp"
-        f"?TIM={timestamp}&twSessionId={GENERIC_SESSION_ID}&tournamentId={event_id}"
-        f"&userType=viewer&userName=&password="
+        f"?{query}&userType=viewer&userName=&password="
     )
 
     # RoundResults page
-    round_results_url = (
-        f"{BASE_URL}/{type_path}/RoundResults.jsp"
-        f"?TIM={timestamp}&twSessionId={GENERIC_SESSION_ID}&tournamentId={event_id}"
-        f"&displayFormatBox=1"
-    )
+    round_results_url = f"{BASE_URL}/{type_path}/RoundResults.jsp?{query}&displayFormatBox=1"
 
     return verify_url, round_results_url
 
 
-def _get_selector_options(page, selector_id: str) -> List[Tuple[str, str]]:
+# Collects dual meet chart links and bout options from the document and its
+# same-origin frames in one pass. Like the frame scans it replaces, the first
+# frame with chart links / a bout selector wins.
+_DUAL_MEET_STRUCTURE_JS = """
+() => {
+    const out = {charts: null, bouts: null};
+    const visit = (doc) => {
+        if (!out.charts) {
+            const charts = Array.from(doc.querySelectorAll("ul.top-links li.top-link a[href*='chartId=']"))
+                .map(a => {
+                    const href = a.getAttribute('href') || '';
+                    const m = href.match(/chartId=(\\d+)/);
+                    return [a.innerText, href, m ? m[1] : null];
+                })
+                .filter(([text, href, id]) => text && id);
+            if (charts.length) out.charts = charts;
+        }
+        if (!out.bouts) {
+            const sel = doc.querySelector('select#boutNumberBox');
+            if (sel) {
+                out.bouts = Array.from(sel.querySelectorAll('option[value]'))
+                    .map(o => [o.value, (o.innerText || o.textContent || '').trim()])
+                    .filter(([value, label]) => value && !label.toLowerCase().includes('select'));
+            }
+        }
+        for (const el of doc.querySelectorAll('iframe, frame')) {
+            let child = null;
+            try { child = el.contentDocument; } catch (e) {}
+            if (child) visit(child);
+        }
+    };
+    visit(document);
+    return {charts: out.charts || [], bouts: out.bouts || []};
+}
+"""
+
+
+def _extract_dual_meet_structure(page, wait_for_bouts: bool = False) -> Dict[str, list]:
     """
-    Generic helper to extract options from a select element.
-    Returns list of (value, label) tuples.
-    Checks both main page and frames.
+    Extract dual meet chart links and bout options in a single round-trip.
+
+    Returns {"charts": [(name, href, chart_id), ...], "bouts": [(value, label), ...]}.
+    With wait_for_bouts, waits briefly for a bout selector if none is present yet.
     """
-    def _extract_from_select(sel_loc) -> List[Tuple[str, str]]:
-        options = sel_loc.locator("option[value]")
-        cnt = options.count()
-        out: List[Tuple[str, str]] = []
-        for i in range(cnt):
-            value = options.nth(i).get_attribute("value") or ""
-            if not value or value == "":
-                continue
-            label = (options.nth(i).inner_text() or "").strip()
-            # Skip placeholder options
-            if "select" in label.lower():
-                continue
-            out.append((value, label))
-        return out
+    try:
+        result = page.evaluate(_DUAL_MEET_STRUCTURE_JS)
+    except Exception as e:
+        logger.debug("Failed to extract dual meet structure: %s", e)
+        result = {"charts": [], "bouts": []}
+
+    if wait_for_bouts and not result["bouts"]:
+        if wait_for_selector_frame(page, "select#boutNumberBox", timeout=2000) is not None:
+            return _extract_dual_meet_structure(page)
+
+    return {
+        "charts": [tuple(c) for c in result["charts"]],
+        "bouts": [tuple(b) for b in result["bouts"]],
+    }
+
+
+# Returns the cleaned outerHTML of the results containers in a frame, or null.
+# Only these nodes are needed by parse_round_html, so scripts, styles and the
+# rest of the page are dropped in-browser before crossing the IPC boundary.
+# Containers left over from the previous round/bout (see _MARK_RESULTS_STALE_JS)
+# are skipped.
+_RESULTS_HTML_JS = """
+() => {
+    const nodes = Array.from(document.querySelectorAll(
+        'section.tw-list:not([data-ws-stale]), table.tw-table:not([data-ws-stale])'
+    ));
+    if (!nodes.length) return null;
+    return nodes
+        .filter(n => !nodes.some(o => o !== n && o.contains(n)))
+        .map(n => {
+            const c = n.cloneNode(true);
+            c.querySelectorAll('script, style, link, svg').forEach(e => e.remove());
+            return c.outerHTML;
+        })
+        .join('\\n');
+}
+"""
 
-    # Check all frames
-    for fr in [page] + list(page.frames):
+
+def _capture_results_html(page) -> str:
+    """
+    Capture the results HTML (section.tw-list / table.tw-table) for the current view.
+
+    Finds the frame holding results containers and returns just those nodes.
+    Otherwise cuts the same containers out of the #pageContent subtree (or the
+    whole page content when there is none), keeping that markup only if it
+    has no results containers.
+
+    The frame that last yielded results is remembered on the page and tried
+    first, since it stays the same across rounds/bouts of an event.
+    """
+    cached = getattr(page, "_tw_results_frame", None)
+    if cached is not None and not cached.is_detached():
         try:
-            sel = fr.locator(f"select#{selector_id}")
-            if sel.count() > 0:
-                return _extract_from_select(sel)
+            html = cached.evaluate(_RESULTS_HTML_JS)
         except Exception:
-            continue
+            html = None
+        if html:
+            logger.debug("Found data in cached frame (%d chars)", len(html))
+            return html
+
+    fr = find_selector_frame(page, "section.tw-list, table.tw-table")
+    if fr is not None:
+        try:
+            html = fr.evaluate(_RESULTS_HTML_JS)
+        except Exception:
+            html = None
+        if html:
+            page._tw_results_frame = page.main_frame if fr is page else fr
+            logger.debug("Found data in frame (%d chars)", len(html))
+            return html
+
+    # Serializing just #pageContent avoids shipping the whole document over CDP
+    html = None
+    fr = find_selector_frame(page, "#pageContent")
+    if fr is not None:
+        try:
+            html = fr.eval_on_selector("#pageContent", "el => el.outerHTML")
+        except Exception:
+            html = None
+    if not html:
+        html = page.content()
+    fragment = extract_results_fragment(html)
+    if fragment:
+        logger.debug("Extracted results fragment from page content (%d of %d chars)", len(fragment), len(html))
+        return fragment
+    logger.debug("Using captured page content (%d chars)", len(html))
+    return html
+
+
+# Tags the results containers currently on screen (in every same-origin frame)
+# and remembers each document's results text, so a later check can tell freshly
+# rendered results from the previous round's.
+_MARK_RESULTS_STALE_JS = """
+() => {
+    const visit = (doc) => {
+        const nodes = doc.querySelectorAll('section.tw-list, table.tw-table');
+        nodes.forEach(n => n.setAttribute('data-ws-stale', '1'));
+        doc.__wsResultsText = Array.from(nodes, n => n.textContent).join('\\n');
+        for (const el of doc.querySelectorAll('iframe, frame')) {
+            let child = null;
+            try { child = el.contentDocument; } catch (e) {}
+            if (child) visit(child);
+        }
+    };
+    visit(document);
+}
+"""
+
+# New results are either containers without the stale tag (a new document or
+# newly inserted nodes) or tagged containers whose text changed (the site
+# re-rendered the round inside the same node). The latter are untagged so
+# _RESULTS_HTML_JS captures them.
+_HAS_FRESH_RESULTS_JS = """
+() => {
+    const visit = (doc) => {
+        if (doc.querySelector('section.tw-list:not([data-ws-stale]), table.tw-table:not([data-ws-stale])')) return true;
+        const nodes = doc.querySelectorAll('section.tw-list, table.tw-table');
+        if (nodes.length && doc.__wsResultsText !== undefined) {
+            // Empty text is a container cleared mid-render, not the new round yet
+            const text = Array.from(nodes, n => n.textContent).join('\\n');
+            if (text.trim() && text !== doc.__wsResultsText) {
+                nodes.forEach(n => n.removeAttribute('data-ws-stale'));
+                return true;
+            }
+        }
+        for (const el of doc.querySelectorAll('iframe, frame')) {
+            let child = null;
+            try { child = el.contentDocument; } catch (e) {}
+            if (child && visit(child)) return true;
+        }
+        return false;
+    };
+    return visit(document);
+}
+"""
+
+
+def _show_round(page, rounds_frame, rid: str) -> bool:
+    """
+    Select a round in an already-loaded Round Results view and click Go.
 
-    # Try with wait
+    Returns True once results newer than the previously shown round have
+    rendered, so the caller never captures a stale round under a new id.
+    """
     try:
-        for fr in [page] + list(page.frames):
-            try:
-                sel = fr.locator(f"select#{selector_id}")
-                sel.wait_for(timeout=2000)
-                return _extract_from_select(sel)
-            except Exception:
-                continue
+        page.evaluate(_MARK_RESULTS_STALE_JS)
+    except Exception:
+        pass
+
+    rounds_frame.locator("select#roundIdBox").select_option(value=rid)
+
+    go_btn = rounds_frame.locator(
+        'input[type="button"][value="Go"][onclick*="viewSchedule"], '
+        'input[type="button"][value="Go"]'
+    ).first
+    if go_btn.count() > 0:
+        go_btn.click()
+
+    # Waits for the new round's results DOM itself; networkidle rarely settles
+    # on these pages (ads/keepalive requests) so it mostly just burned the timeout
+    try:
+        page.wait_for_function(_HAS_FRESH_RESULTS_JS, timeout=5000)
+        return True
+    except Exception:
+        return False
+
+
+def _dismiss_cookie_banner(page) -> None:
+    """
+    Dismiss the cookie consent dialog if it is showing.
+
+    Waits for the dialog to actually close (returning as soon as it does)
+    rather than sleeping a fixed interval after the click.
+    """
+    try:
+        cookie_button = page.locator(COOKIE_BUTTON_SELECTOR)
+        if cookie_button.count() > 0:
+            cookie_button.first.click()
+            cookie_button.first.wait_for(state="hidden", timeout=1000)
+    except Exception:
+        pass  # Cookie dialog may not appear, or closed by other means
+
+
+def _route_without_heavy_resources(route) -> None:
+    """Playwright route handler that aborts images, fonts, media and third-party trackers."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _open_chart(page, link_frame, link_selector: str, chart_id: str) -> None:
+    """
+    Click a dual meet chart link and wait for the frame it loads.
+
+    Waits for the navigation to the chart's URL and that document's DOM,
+    rather than for network idle. Falls back to a network settle if no
+    matching navigation is seen. Raises if the link itself can't be clicked.
+    """
+    clicked = False
+    try:
+        with page.expect_event(
+            "framenavigated",
+            predicate=lambda fr: f"chartId={chart_id}" in (fr.url or ""),
+            timeout=5000,
+        ) as nav:
+            link_frame.locator(link_selector).first.click(timeout=5000)
+            clicked = True
+        nav.value.wait_for_load_state("domcontentloaded", timeout=5000)
+        return
+    except Exception as e:
+        if not clicked:
+            raise
+        logger.debug("No chart frame navigation for chart %s: %s", chart_id, e)
+
+    try:
+        page.wait_for_load_state("networkidle", timeout=3000)
+    except Exception:
+        pass  # networkidle may timeout due to ads
+
+
+def _select_bout(page, bout_frame, bout_id: str) -> bool:
+    """
+    Select a bout and wait for its detail frame to load the new results.
+
+    Selecting a bout reloads the DualMeetDetail.jsp frame: wait for that
+    navigation's DOM, then for results newer than the previously shown bout
+    (same stale marker as _show_round). Returns False if no fresh results
+    render, so the caller never captures a stale bout under a new id.
+    """
+    try:
+        page.evaluate(_MARK_RESULTS_STALE_JS)
     except Exception:
         pass
 
-    return []
+    try:
+        with page.expect_event(
+            "framenavigated",
+            predicate=lambda fr: "DualMeetDetail.jsp" in (fr.url or ""),
+            timeout=5000,
+        ) as nav:
+            bout_frame.locator("select#boutNumberBox").select_option(value=bout_id)
+        nav.value.wait_for_load_state("domcontentloaded", timeout=5000)
+    except Exception as e:
+        logger.debug("No detail frame navigation for bout %s: %s", bout_id, e)
+
+    try:
+        page.wait_for_function(_HAS_FRESH_RESULTS_JS, timeout=5000)
+        return True
+    except Exception:
+        return False
 
 
 # ============================================================================
 # Utility Helpers
 # ============================================================================
 
+_EVENT_YEAR_RE = re.compile(r"(20\d{2})")
+
+
 def event_year_from_name(name: str) -> Optional[int]:
     """Extract year from tournament name."""
-    m = re.search(r"(20\d{2})", name)
+    m = _EVENT_YEAR_RE.search(name)
     return int(m.group(1)) if m else None
 
 
+# ============================================================================
+# Event Scraping
+# ============================================================================
+
+def _scrape_event(
+    page,
+    t: Tournament,
+    pending_rounds: List[Tuple[str, str, str, str]],
+    type_path_cache: Dict[int, str],
+    dual_meet_entry_cache: Dict[int, str],
+) -> Tuple[bool, Optional[str]]:
+    """
+    Scrape all rounds (or dual meet bouts) for one tournament.
+
+    Captured (event_id, round_id, label, raw_html) rows are appended to
+    pending_rounds as they are read, so the caller can still save a partial
+    capture if this raises.
+
+    Returns:
+        Tuple of (succeeded, discovered_path). discovered_path is the URL path
+        that served the Round Results view, or None for dual meets / failures.
+    """
+    # Results frame remembered by _capture_results_html is per event
+    page._tw_results_frame = None
+
+    # One TIM/session query per event, reused by every URL below
+    session_query = _session_query(t.event_id)
+    tournament_url = f"{BASE_URL}/{t.event_type_path}/MainFrame.jsp?{session_query}"
+
+    # Build URLs for session establishment, preferring a path known to work
+    working_path = type_path_cache.get(t.event_type) or t.event_type_path
+    verify_url, round_results_url = build_session_urls(
+        t.event_id, t.event_type, working_path, session_query
+    )
+
+    # Step 1: Establish session via VerifyPassword.jsp
+    logger.debug("Establishing session: %s", verify_url)
+    page.goto(verify_url, wait_until="load", timeout=20000)
+    # Wait for any redirects to settle (networkidle may timeout due to ads).
+    # Unlike the pages below there is no target element to wait on here.
+    try:
+        page.wait_for_load_state("networkidle", timeout=5000)
+    except Exception:
+        pass
+
+    # Dismiss cookie consent dialog if present
+    _dismiss_cookie_banner(page)
+
+    # Step 2: For team tournaments (type 3), skip RoundResults.jsp as it doesn't exist
+    # Go directly to dual meet handling
+    is_team_tournament = (t.event_type == 3)
+    round_selector_found = False
+    is_dual_meet = False
+    dual_meet_loaded = False
+
+    if is_team_tournament:
+        logger.debug("Team tournament detected, skipping RoundResults.jsp")
+        type_path = TOURNAMENT_TYPE_PATHS.get(t.event_type, "teamtournaments")
+
+        # Jump straight to the dual meet page found for an earlier event of this type
+        entry_page = dual_meet_entry_cache.get(t.event_type)
+        if entry_page:
+            try:
+                page.goto(
+                    f"{BASE_URL}/{type_path}/{entry_page}?{session_query}",
+                    wait_until="load", timeout=15000,
+                )
+                dual_meet_loaded = wait_for_selector_frame(
+                    page, DUAL_MEET_CONTENT_SELECTOR, timeout=5000
+                ) is not None
+            except Exception as e:
+                logger.debug("Failed to load %s directly: %s", entry_page, e)
+            if not dual_meet_loaded:
+                dual_meet_entry_cache.pop(t.event_type, None)
+
+        if not dual_meet_loaded:
+            # Navigate to MainFrame to access dual meet results
+            main_url = f"{BASE_URL}/{type_path}/MainFrame.jsp?{session_query}"
+            try:
+                # "load" already covers the frameset's child frames
+                page.goto(main_url, wait_until="load", timeout=15000)
+            except Exception as e:
+                logger.debug("Failed to load main frame: %s", e)
+        is_dual_meet = True  # Assume dual meet format for team tournaments
+    else:
+        # Step 2: Navigate to RoundResults (for non-team tournaments)
+        logger.debug("Loading round results: %s", round_results_url)
+        page.goto(round_results_url, wait_until="load", timeout=15000)
+
+        # Wait for the round selector (standard tournaments)
+        round_selector_found = wait_for_selector_frame(
+            page, "select#roundIdBox", timeout=3000
+        ) is not None
+
+    # Try alternative tournament types if needed (only for non-team tournaments)
+    if not round_selector_found and not is_team_tournament:
+        logger.debug("Round selector not found, trying alternative types...")
+        for alt_path in TOURNAMENT_TYPE_PATHS.values():
+            if alt_path == working_path:
+                continue
+
+            alt_verify, alt_results = build_session_urls(
+                t.event_id, t.event_type, alt_path, session_query
+            )
+
+            try:
+                page.goto(alt_verify, wait_until="load", timeout=10000)
+                try:
+                    page.wait_for_load_state("networkidle", timeout=3000)
+                except Exception:
+                    pass  # networkidle may timeout due to ads
+                page.goto(alt_results, wait_until="load", timeout=10000)
+                alt_rounds_frame = wait_for_selector_frame(
+                    page, "select#roundIdBox", timeout=3000
+                )
+
+                # Dismiss cookie consent dialog if present
+                _dismiss_cookie_banner(page)
+
+                if alt_rounds_frame is not None:
+                    round_selector_found = True
+                    round_results_url = alt_results
+                    working_path = alt_path
+                    logger.info("Found round selector with path: %s", alt_path)
+                    break
+            except Exception as e:
+                logger.debug("Failed with %s: %s", alt_path, e)
+                continue
+
+    # If still no round selector, try Dual Meet Results (for team tournaments)
+    if not round_selector_found and not dual_meet_loaded:
+        logger.debug("No round selector found, checking for dual meet format...")
+
+        # Navigate to main frame to find dual meet navigation
+        # (team tournaments already loaded it above)
+        if not is_team_tournament:
+            type_path = TOURNAMENT_TYPE_PATHS.get(t.event_type, "teamtournaments")
+            main_url = f"{BASE_URL}/{type_path}/MainFrame.jsp?{session_query}"
+            try:
+                page.goto(main_url, wait_until="load", timeout=15000)
+            except Exception as e:
+                logger.debug("Failed to load main frame: %s", e)
+
+        # Try to navigate to dual meet results
+        for fr in [page] + list(page.frames):
+            # Click Results link if available
+            try:
+                results_link = fr.locator('a:has-text("Results")').first
+                if results_link.count() > 0:
+                    results_link.click(timeout=3000)
+                    time.sleep(0.2)
+            except Exception:
+                pass
+
+            # Click dual meet link
+            for link_text in ['Dual Meets', 'Dual Meet', 'Match Results', 'Duals']:
+                try:
+                    link = fr.locator(f'a:has-text("{link_text}")').first
+                    if link.count() > 0 and link.is_visible():
+                        logger.debug("Clicking dual meet link: %s", link_text)
+                        link.click(timeout=5000)
+                        wait_for_selector_frame(page, DUAL_MEET_CONTENT_SELECTOR, timeout=5000)
+                        is_dual_meet = True
+                        break
+                except Exception:
+                    continue
+            if is_dual_meet:
+                break
+
+        # Remember which dual meet page the links led to for later events of this type
+        if is_dual_meet and t.event_type not in dual_meet_entry_cache:
+            for fr in page.frames:
+                m = _DUAL_MEET_PAGE_RE.search(fr.url or "")
+                if m:
+                    dual_meet_entry_cache[t.event_type] = m.group(1)
+                    logger.debug("Caching dual meet entry page: %s", m.group(1))
+                    break
+
+    if not round_selector_found and not is_dual_meet:
+        logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | no round/bout selector found | {tournament_url}{Colors.RESET}")
+        return False, None
+
+    # Handle dual meet tournaments
+    if is_dual_meet:
+        saved_count = 0
+
+        # First, find all chart/bracket links (segment-track buttons)
+        # Team tournaments have multiple charts/pools that need to be clicked first
+        # These are in <ul class="top-links"> with <li class="top-link"> containing <a> with href to DualMeetWizard.jsp?chartId=
+        structure = _extract_dual_meet_structure(page)
+        chart_links = structure["charts"]
+
+        # If we found chart links, we need to iterate through them
+        # Otherwise, try to get bouts directly
+        if chart_links:
+            logger.debug("Found %d chart/bracket links for team tournament", len(chart_links))
+
+            for chart_name, chart_href, chart_id in chart_links:
+                logger.debug("Processing chart: %s", chart_name)
+
+                # Click the chart link by finding it in the top-links list
+                # (chartId comes from hrefs like "DualMeetWizard.jsp?TIM=...&chartId=250162132")
+                chart_clicked = False
+                link_selector = f"ul.top-links li.top-link a[href*='chartId={chart_id}']"
+                try:
+                    link_frame = find_selector_frame(page, link_selector)
+                    if link_frame is not None:
+                        _open_chart(page, link_frame, link_selector, chart_id)
+                        chart_clicked = True
+                except Exception:
+                    pass
+
+                if not chart_clicked:
+                    logger.debug("Failed to click chart link: %s", chart_name)
+                    continue
+
+                # Now get bouts for this chart
+                bouts = _extract_dual_meet_structure(page, wait_for_bouts=True)["bouts"]
+                if not bouts:
+                    logger.debug("No bouts found for chart: %s", chart_name)
+                    continue
+
+                logger.debug("Found %d bouts for chart %s", len(bouts), chart_name)
+
+                # Process bouts for this chart
+                for bout_id, bout_label in bouts:
+                    try:
+                        # Find frame with bout selector
+                        bout_frame = find_selector_frame(page, "select#boutNumberBox")
+
+                        if not bout_frame:
+                            logger.debug("Could not find bout selector for %s", bout_id)
+                            continue
+
+                        # Select the bout and wait for the detail frame
+                        if not _select_bout(page, bout_frame, bout_id):
+                            logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | bout {bout_id} skipped, results never rendered{Colors.RESET}")
+                            continue
+
+                        # Capture just the results markup
+                        raw_html = _capture_results_html(page)
+
+                        # Save to database with chart-specific round_id
+                        round_id = f"{chart_name}_{bout_label}".replace(" ", "_")
+                        pending_rounds.append((t.event_id, round_id, bout_label, raw_html))
+                        saved_count += 1
+
+                    except Exception as e:
+                        logger.debug("Error processing bout %s: %s", bout_id, e)
+                        continue
+
+            if saved_count > 0:
+                logger.info("[event] %s | saved %d bouts across %d charts", 
+                          t.event_id, saved_count, len(chart_links))
+            else:
+                logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | no bouts saved | {tournament_url}{Colors.RESET}")
+            return saved_count > 0, None
+
+        # No chart links found, try direct bout access
+        bouts = (
+            structure["bouts"]
+            or _extract_dual_meet_structure(page, wait_for_bouts=True)["bouts"]
+        )
+        if not bouts:
+            logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | no bouts found in selector | {tournament_url}{Colors.RESET}")
+            return False, None
+
+        logger.debug("Found %d bouts for dual meet %s", len(bouts), t.event_id)
+
+        # Iterate through each bout and save raw HTML
+        for bout_id, bout_label in bouts:
+            try:
+                # Find frame with bout selector
+                bout_frame = find_selector_frame(page, "select#boutNumberBox")
+
+                if not bout_frame:
+                    logger.debug("Could not find bout selector for %s", bout_id)
+                    continue
+
+                # Select the bout and wait for the detail frame
+                # (DualMeetDetail.jsp) to navigate
+                if not _select_bout(page, bout_frame, bout_id):
+                    logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | bout {bout_id} skipped, results never rendered{Colors.RESET}")
+                    continue
+
+                # Capture just the results markup (table.tw-table or section.tw-list)
+                # Parser expects to find these elements in the HTML
+                raw_html = _capture_results_html(page)
+
+                # Queue for saving (flushed once per event)
+                pending_rounds.append((t.event_id, bout_id, bout_label, raw_html))
+                saved_count += 1
+                logger.debug("Saved bout %s: %s", bout_id, bout_label)
+
+            except Exception as e:
+                logger.debug("Error saving bout %s: %s", bout_id, e)
+                continue
+
+        if saved_count > 0:
+            logger.info(
+                "[event] %s | %s | succeeded (saved %d bouts)",
+                t.event_id, t.name, saved_count
+            )
+        else:
+            logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | {t.name} | no bouts saved | {tournament_url}{Colors.RESET}")
+        return saved_count > 0, None
+
+    # Parse rounds from selector (standard tournament flow)
+    rounds = parse_rounds(page)
+    if not rounds:
+        logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | no rounds found | {tournament_url}{Colors.RESET}")
+        return False, None
+
+    # Scrape each round
+    saved_count = 0
+    # The view parse_rounds just read is reused for the first round
+    rounds_frame = find_selector_frame(page, "select#roundIdBox")
+    for rid, label in rounds:
+        try:
+            # Select the round in place, keeping the loaded view between rounds
+            shown = False
+            if rounds_frame is not None:
+                try:
+                    shown = _show_round(page, rounds_frame, rid)
+                except Exception as e:
+                    logger.debug("In-place selection failed for round %s: %s", rid, e)
+
+            if not shown:
+                # Fall back to re-navigating to a clean Round Results view
+                page.goto(round_results_url, wait_until="load", timeout=15000)
+                rounds_frame = wait_for_selector_frame(page, "select#roundIdBox", timeout=3000)
+
+                # Dismiss cookie consent dialog if present
+                _dismiss_cookie_banner(page)
+
+                if not rounds_frame:
+                    continue
+
+                if not _show_round(page, rounds_frame, rid):
+                    # Whatever is on screen is not this round; don't save it under rid
+                    logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | round {rid} skipped, results never rendered{Colors.RESET}")
+                    continue
+
+            # Capture just the results markup (section.tw-list)
+            # Parser expects to find this element in the HTML
+            raw_html = _capture_results_html(page)
+
+            # Queue for saving (flushed once per event)
+            pending_rounds.append((t.event_id, rid, label, raw_html))
+            saved_count += 1
+            logger.debug("Saved round %s: %s", rid, label)
+
+        except Exception as e:
+            logger.debug("Error saving round %s: %s", rid, e)
+            continue
+
+    if saved_count > 0:
+        type_path_cache[t.event_type] = working_path
+        logger.info(
+            "[event] %s | %s | succeeded (saved %d rounds)",
+            t.event_id, t.name, saved_count
+        )
+        return True, working_path
+
+    logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | {t.name} | no rounds saved | {tournament_url}{Colors.RESET}")
+    return False, None
+
+
+def _scrape_worker(
+    jobs: "queue.Queue[Tuple[int, Tournament]]",
+    results: "queue.Queue[Tuple[Tournament, bool, Optional[str], List[Tuple[str, str, str, str]]]]",
+    headless: bool,
+    total: int,
+    type_path_cache: Dict[int, str],
+    dual_meet_entry_cache: Dict[int, str],
+    storage_state_path: Path,
+    save_storage_state: bool,
+) -> None:
+    """
+    Pull tournaments off the job queue and scrape them with a private browser.
+
+    The Playwright sync API is bound to the thread that started it, so each
+    worker owns its own browser, context and page. Results are handed back to
+    the main thread, which does all DuckDB writes.
+
+    The context starts from the storage state saved by the previous run (cookie
+    consent etc.); with save_storage_state, it is written back on clean exit.
+    """
+    from playwright.sync_api import sync_playwright
+
+    try:
+        with sync_playwright() as pw:
+            browser = pw.chromium.launch(headless=headless)
+            context = browser.new_context(
+                storage_state=str(storage_state_path) if storage_state_path.exists() else None
+            )
+            context.route("**/*", _route_without_heavy_resources)
+            page = context.new_page()
+            handled = 0
+
+            while True:
+                try:
+                    index, t = jobs.get_nowait()
+                except queue.Empty:
+                    break
+
+                handled += 1
+                succeeded, discovered_path = False, None
+                # Captured (event_id, round_id, label, raw_html) rows, saved in one batch
+                pending_rounds: List[Tuple[str, str, str, str]] = []
+                logger.info(
+                    "[event %d/%d] Processing %s: %s (type=%d)",
+                    index, total, t.event_id, t.name, t.event_type
+                )
+
+                try:
+                    # Reset session state between tournaments; periodically swap in a
+                    # fresh page so long runs don't accumulate frames/resources
+                    # (consent cookies are kept so the banner doesn't come back every event)
+                    context.clear_cookies(name=_SESSION_COOKIE_RE)
+                    reset_session_cache(context)
+                    if handled % PAGE_RECYCLE_INTERVAL == 0:
+                        page.close()
+                        page = context.new_page()
+
+                    succeeded, discovered_path = _scrape_event(
+                        page, t, pending_rounds,
+                        type_path_cache, dual_meet_entry_cache,
+                    )
+                except Exception as e:
+                    logger.error(f"{Colors.RED}[event] {t.event_id} | {t.name} | error: {e}{Colors.RESET}")
+                finally:
+                    results.put((t, succeeded, discovered_path, pending_rounds))
+
+            if save_storage_state:
+                try:
+                    context.storage_state(path=str(storage_state_path))
+                except Exception as e:
+                    logger.debug("Failed to save browser storage state: %s", e)
+            browser.close()
+    except Exception as e:
+        logger.error(f"{Colors.RED}[worker] {threading.current_thread().name} | browser error: {e}{Colors.RESET}")
+
+
+def _save_scraped_events(
+    db: duckdb.DuckDBPyConnection,
+    batch: List[Tuple[Tournament, Optional[str], List[Tuple[str, str, str, str]]]],
+) -> None:
+    """
+    Save captured rounds and discovered paths for a batch of events in one transaction.
+
+    If the batch fails, it is rolled back and retried one event at a time so a
+    single bad event doesn't lose the others.
+    """
+    if not batch:
+        return
+    db.begin()
+    try:
+        for t, discovered_path, pending_rounds in batch:
+            upsert_rounds(db, pending_rounds)
+            if discovered_path:
+                set_discovered_path(db, t.event_id, discovered_path)
+        db.commit()
+        return
+    except Exception as e:
+        db.rollback()
+        logger.debug("Batch save failed, retrying per event: %s", e)
+
+    for t, discovered_path, pending_rounds in batch:
+        try:
+            upsert_rounds(db, pending_rounds)
+            if discovered_path:
+                set_discovered_path(db, t.event_id, discovered_path)
+        except Exception as e:
+            logger.error(f"{Colors.RED}[event] {t.event_id} | failed to save rounds: {e}{Colors.RESET}")
+
+
 # ============================================================================
 # Main Scraper
 # ============================================================================
@@ -662,9 +1530,6 @@ def run_scraper(args: argparse.Namespace) -> None:
     2. Filter to eligible events (past events without complete rounds)
     3. For each event: establish session via VerifyPassword.jsp, scrape rounds
     """
-    from datetime import datetime
-    from playwright.sync_api import sync_playwright
-
     start_time = time.time()
 
     # 1. Discover tournaments via HTTP
@@ -684,7 +1549,9 @@ def run_scraper(args: argparse.Namespace) -> None:
     # 2. Open DuckDB and ensure tables exist
     db_path = get_db_path()
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    db = duckdb.connect(str(db_path))
+    db = connect_db()
+    # Scrape writes are many small upserts; checkpoint the WAL in large steps
+    db.execute("SET checkpoint_threshold = '1GB'")
     ensure_db(db)
     ensure_rounds_table(db)
 
@@ -694,20 +1561,14 @@ def run_scraper(args: argparse.Namespace) -> None:
     logger.info("=" * 80)
     cleanup_orphaned_tournaments(db)
 
-    # Upsert all discovered tournaments
+    # Upsert all discovered tournaments (one transaction rather than a commit per row)
+    db.begin()
     for t in discovered:
-        year = event_year_from_name(t.name) if t.name else None
-        if year is None and t.start_date:
-            try:
-                year = int(t.start_date.split("-")[0])
-            except (ValueError, IndexError):
-                pass
-
         upsert_tournament(
             db,
             event_id=t.event_id,
             name=t.name,
-            year=year,
+            year=t.year,
             start_date=t.start_date,
             end_date=t.end_date,
             venue=t.venue_name,
@@ -717,12 +1578,23 @@ def run_scraper(args: argparse.Namespace) -> None:
             event_type_name=t.event_type_name,
         )
 
+    db.commit()
     logger.info("Upserted %d tournament records", len(discovered))
 
     # 3. Determine which tournaments need round scraping
     today = date.today()
     eligible_events: List[Tournament] = []
 
+    # Events that already have rounds, read in one scan instead of per event
+    scraped_event_ids = {
+        r[0]
+        for r in db.execute(
+            """--sql
+            SELECT DISTINCT event_id FROM tournament_rounds
+            """
+        ).fetchall()
+    }
+
     for t in discovered:
         # Skip excluded tournaments
         if t.event_id in EXCLUDED_TOURNAMENT_IDS:
@@ -730,26 +1602,14 @@ def run_scraper(args: argparse.Namespace) -> None:
             continue
         
         # Skip future events
-        if t.start_date:
-            try:
-                event_start = datetime.strptime(t.start_date, "%Y-%m-%d").date()
-                if event_start > today:
-                    logger.debug("Skipping future event %s (%s) - starts %s",
-                                t.event_id, t.name, t.start_date)
-                    continue
-            except ValueError:
-                pass
+        if t.start_date_obj and t.start_date_obj > today:
+            logger.debug("Skipping future event %s (%s) - starts %s",
+                        t.event_id, t.name, t.start_date)
+            continue
 
         # Check if we already have rounds for this event
-        existing = db.execute(
-            """--sql
-            SELECT COUNT(*) FROM tournament_rounds WHERE event_id = ?
-            """,
-            [t.event_id],
-        ).fetchone()
-
-        if existing and existing[0] > 0:
-            logger.debug("Skipping event %s - already has %d rounds", t.event_id, existing[0])
+        if t.event_id in scraped_event_ids:
+            logger.debug("Skipping event %s - already has rounds", t.event_id)
             continue
 
         eligible_events.append(t)
@@ -767,563 +1627,79 @@ def run_scraper(args: argparse.Namespace) -> None:
         db.close()
         return
 
-    # 4. Scrape rounds using Playwright
+    # 4. Scrape rounds using Playwright, one browser per worker thread
     overall_events = 0
     overall_succeeded = 0
     overall_skipped = 0
-
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(headless=not args.show)
-        page = browser.new_page()
-
-        for t in eligible_events:
-            overall_events += 1
-            logger.info(
-                "[event %d/%d] Processing %s: %s (type=%d)",
-                overall_events, len(eligible_events), t.event_id, t.name, t.event_type
-            )
-
+    # event_type -> URL path that worked for an earlier event, seeded from the
+    # most recently seen event of each type that saved rounds in a previous run
+    type_path_cache: Dict[int, str] = dict(
+        db.execute(
+            """--sql
+            SELECT event_type_id, arg_max(discovered_path, first_seen)
+            FROM tournaments
+            WHERE discovered_path IS NOT NULL AND event_type_id IS NOT NULL
+            GROUP BY event_type_id
+            """
+        ).fetchall()
+    )
+    # event_type -> dual meet page (e.g. DualMeetWizard.jsp) reached via MainFrame links
+    dual_meet_entry_cache: Dict[int, str] = {}
+
+    # Browser storage (cookies/localStorage) carried between runs; only the
+    # first worker writes it back so concurrent workers don't race on the file
+    storage_state_path = db_path.parent / STORAGE_STATE_FILENAME
+
+    jobs: "queue.Queue[Tuple[int, Tournament]]" = queue.Queue()
+    for index, t in enumerate(eligible_events, start=1):
+        jobs.put((index, t))
+    results: "queue.Queue[Tuple[Tournament, bool, Optional[str], List[Tuple[str, str, str, str]]]]" = queue.Queue()
+
+    workers = [
+        threading.Thread(
+            target=_scrape_worker,
+            args=(
+                jobs, results, not args.show, len(eligible_events),
+                type_path_cache, dual_meet_entry_cache,
+                storage_state_path, n == 0,
+            ),
+            name=f"scraper-{n + 1}",
+            daemon=True,
+        )
+        for n in range(max(1, min(args.workers, len(eligible_events))))
+    ]
+    for w in workers:
+        w.start()
+
+    # DuckDB writes stay on this thread; workers only scrape. Finished events are
+    # saved COMMIT_INTERVAL at a time, one transaction per batch.
+    unsaved: List[Tuple[Tournament, Optional[str], List[Tuple[str, str, str, str]]]] = []
+    # Whatever is still unsaved is written even if the loop is interrupted
+    # (Ctrl-C or an error), so finished events aren't lost
+    try:
+        while overall_events < len(eligible_events):
             try:
-                # Reset page state between tournaments to prevent navigation conflicts
-                try:
-                    page.goto("about:blank", wait_until="domcontentloaded", timeout=5000)
-                except Exception:
-                    pass
-
-                # Build URLs for session establishment
-                verify_url, round_results_url = build_session_urls(t.event_id, t.event_type)
-
-                # Step 1: Establish session via VerifyPassword.jsp
-                logger.debug("Establishing session: %s", verify_url)
-                page.goto(verify_url, wait_until="load", timeout=20000)
-                # Wait for any redirects to settle (networkidle may timeout due to ads)
-                try:
-                    page.wait_for_load_state("networkidle", timeout=5000)
-                except Exception:
-                    pass
-
-                # Dismiss cookie consent dialog if present
-                try:
-                    cookie_button = page.locator(
-                        "button:has-text('Accept'), "
-                        "button:has-text('Dismiss'), "
-                        "button.osano-cm-accept, "
-                        "button.osano-cm-dialog__close"
-                    )
-                    if cookie_button.count() > 0:
-                        cookie_button.first.click()
-                        time.sleep(0.5)
-                except Exception:
-                    pass  # Cookie dialog may not appear
-
-                # Step 2: For team tournaments (type 3), skip RoundResults.jsp as it doesn't exist
-                # Go directly to dual meet handling
-                is_team_tournament = (t.event_type == 3)
-                round_selector_found = False
-                is_dual_meet = False
-
-                if is_team_tournament:
-                    logger.debug("Team tournament detected, skipping RoundResults.jsp")
-                    # Navigate to MainFrame to access dual meet results
-                    type_path = TOURNAMENT_TYPE_PATHS.get(t.event_type, "teamtournaments")
-                    main_url = (
-                        f"{BASE_URL}/{type_path}/MainFrame.jsp"
-                        f"?TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}"
-                        f"&tournamentId={t.event_id}"
-                    )
-                    try:
-                        page.goto(main_url, wait_until="load", timeout=15000)
-                        try:
-                            page.wait_for_load_state("networkidle", timeout=5000)
-                        except Exception:
-                            pass
-                    except Exception as e:
-                        logger.debug("Failed to load main frame: %s", e)
-                    is_dual_meet = True  # Assume dual meet format for team tournaments
-                else:
-                    # Step 2: Navigate to RoundResults (for non-team tournaments)
-                    logger.debug("Loading round results: %s", round_results_url)
-                    page.goto(round_results_url, wait_until="load", timeout=15000)
-                    # Wait for any redirects to settle (networkidle may timeout due to ads)
-                    try:
-                        page.wait_for_load_state("networkidle", timeout=5000)
-                    except Exception:
-                        pass
-
-                    # Check for round selector (standard tournaments)
-                    for fr in [page] + list(page.frames):
-                        try:
-                            if fr.locator("select#roundIdBox").count() > 0:
-                                round_selector_found = True
-                                break
-                        except Exception:
-                            continue
-
-                # Try alternative tournament types if needed (only for non-team tournaments)
-                if not round_selector_found and not is_team_tournament:
-                    logger.debug("Round selector not found, trying alternative types...")
-                    for alt_type, alt_path in TOURNAMENT_TYPE_PATHS.items():
-                        if alt_type == t.event_type:
-                            continue
-
-                        alt_verify = (
-                            f"{BASE_URL}/{alt_path}/VerifyPassword.jsp"
-                            f"?TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}"
-                            f"&tournamentId={t.event_id}&userType=viewer&userName=&password="
-                        )
-                        alt_results = (
-                            f"{BASE_URL}/{alt_path}/RoundResults.jsp"
-                            f"?TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}"
-                            f"&tournamentId={t.event_id}&displayFormatBox=1"
-                        )
-
-                        try:
-                            page.goto(alt_verify, wait_until="load", timeout=10000)
-                            try:
-                                page.wait_for_load_state("networkidle", timeout=3000)
-                            except Exception:
-                                pass  # networkidle may timeout due to ads
-                            page.goto(alt_results, wait_until="load", timeout=10000)
-                            try:
-                                page.wait_for_load_state("networkidle", timeout=3000)
-                            except Exception:
-                                pass  # networkidle may timeout due to ads
-
-                            # Dismiss cookie consent dialog if present
-                            try:
-                                cookie_button = page.locator(
-                                    "button:has-text('Accept'), "
-                                    "button:has-text('Dismiss'), "
-                                    "button.osano-cm-accept, "
-                                    "button.osano-cm-dialog__close"
-                                )
-                                if cookie_button.count() > 0:
-                                    cookie_button.first.click()
-                                    time.sleep(0.3)
-                            except Exception:
-                                pass
-
-                            for fr in [page] + list(page.frames):
-                                try:
-                                    if fr.locator("select#roundIdBox").count() > 0:
-                                        round_selector_found = True
-                                        round_results_url = alt_results
-                                        logger.info("Found round selector with path: %s", alt_path)
-                                        break
-                                except Exception:
-                                    continue
-
-                            if round_selector_found:
-                                break
-                        except Exception as e:
-                            logger.debug("Failed with %s: %s", alt_path, e)
-                            continue
-
-                # If still no round selector, try Dual Meet Results (for team tournaments)
-                if not round_selector_found:
-                    logger.debug("No round selector found, checking for dual meet format...")
-                    
-                    # Navigate to main frame to find dual meet navigation
-                    type_path = TOURNAMENT_TYPE_PATHS.get(t.event_type, "teamtournaments")
-                    main_url = (
-                        f"{BASE_URL}/{type_path}/MainFrame.jsp"
-                        f"?TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}"
-                        f"&tournamentId={t.event_id}"
-                    )
-                    try:
-                        page.goto(main_url, wait_until="load", timeout=15000)
-                        try:
-                            page.wait_for_load_state("networkidle", timeout=5000)
-                        except Exception:
-                            pass  # networkidle may timeout due to ads
-                    except Exception as e:
-                        logger.debug("Failed to load main frame: %s", e)
-                    
-                    # Try to navigate to dual meet results
-                    for fr in [page] + list(page.frames):
-                        # Click Results link if available
-                        try:
-                            results_link = fr.locator('a:has-text("Results")').first
-                            if results_link.count() > 0:
-                                results_link.click(timeout=3000)
-                                time.sleep(0.2)
-                        except Exception:
-                            pass
-                        
-                        # Click dual meet link
-                        for link_text in ['Dual Meets', 'Dual Meet', 'Match Results', 'Duals']:
-                            try:
-                                link = fr.locator(f'a:has-text("{link_text}")').first
-                                if link.count() > 0 and link.is_visible():
-                                    logger.debug("Clicking dual meet link: %s", link_text)
-                                    link.click(timeout=5000)
-                                    try:
-                                        page.wait_for_load_state("networkidle", timeout=5000)
-                                    except Exception:
-                                        pass  # networkidle may timeout due to ads
-                                    is_dual_meet = True
-                                    break
-                            except Exception:
-                                continue
-                        if is_dual_meet:
-                            break
-
-                if not round_selector_found and not is_dual_meet:
-                    type_path = TOURNAMENT_TYPE_PATHS.get(t.event_type, "opentournaments")
-                    tournament_url = f"{BASE_URL}/{type_path}/MainFrame.jsp?TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}&tournamentId={t.event_id}"
-                    logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | no round/bout selector found | {tournament_url}{Colors.RESET}")
-                    overall_skipped += 1
-                    continue
-
-                # Handle dual meet tournaments
-                if is_dual_meet:
-                    saved_count = 0
-                    
-                    # First, find all chart/bracket links (segment-track buttons)
-                    # Team tournaments have multiple charts/pools that need to be clicked first
-                    # These are in <ul class="top-links"> with <li class="top-link"> containing <a> with href to DualMeetWizard.jsp?chartId=
-                    chart_links = []
-                    for fr in [page] + list(page.frames):
-                        try:
-                            # Look for links within top-links list that have chartId parameter
-                            links = fr.locator("ul.top-links li.top-link a[href*='chartId=']").all()
-                            if links:
-                                for link in links:
-                                    try:
-                                        href = link.get_attribute("href")
-                                        text = link.inner_text()
-                                        if href and text and 'chartId=' in href:
-                                            chart_links.append((text, href))
-                                    except Exception:
-                                        continue
-                                if chart_links:
-                                    break
-                        except Exception:
-                            continue
-                    
-                    # If we found chart links, we need to iterate through them
-                    # Otherwise, try to get bouts directly
-                    if chart_links:
-                        logger.debug("Found %d chart/bracket links for team tournament", len(chart_links))
-                        
-                        for chart_name, chart_href in chart_links:
-                            logger.debug("Processing chart: %s", chart_name)
-                            
-                            # Click the chart link by finding it in the top-links list
-                            chart_clicked = False
-                            for fr in [page] + list(page.frames):
-                                try:
-                                    # Match by href containing the chartId parameter
-                                    # Extract chartId from href like "DualMeetWizard.jsp?TIM=...&chartId=250162132"
-                                    chart_id_match = re.search(r'chartId=(\d+)', chart_href)
-                                    if chart_id_match:
-                                        chart_id = chart_id_match.group(1)
-                                        link = fr.locator(f"ul.top-links li.top-link a[href*='chartId={chart_id}']").first
-                                        if link.count() > 0:
-                                            link.click(timeout=5000)
-                                            try:
-                                                page.wait_for_load_state("networkidle", timeout=3000)
-                                            except Exception:
-                                                pass
-                                            chart_clicked = True
-                                            break
-                                except Exception:
-                                    continue
-                            
-                            if not chart_clicked:
-                                logger.debug("Failed to click chart link: %s", chart_name)
-                                continue
-                            
-                            # Now get bouts for this chart
-                            bouts = _get_selector_options(page, "boutNumberBox")
-                            if not bouts:
-                                logger.debug("No bouts found for chart: %s", chart_name)
-                                continue
-                            
-                            logger.debug("Found %d bouts for chart %s", len(bouts), chart_name)
-                            
-                            # Process bouts for this chart
-                            for bout_id, bout_label in bouts:
-                                try:
-                                    # Find frame with bout selector
-                                    bout_frame = None
-                                    for fr in [page] + list(page.frames):
-                                        try:
-                                            if fr.locator("select#boutNumberBox").count() > 0:
-                                                bout_frame = fr
-                                                break
-                                        except Exception:
-                                            continue
-                                    
-                                    if not bout_frame:
-                                        logger.debug("Could not find bout selector for %s", bout_id)
-                                        continue
-                                    
-                                    # Select the bout
-                                    bout_frame.locator("select#boutNumberBox").select_option(value=bout_id)
-                                    try:
-                                        page.wait_for_load_state("networkidle", timeout=3000)
-                                    except Exception:
-                                        pass
-                                    
-                                    # Wait for content frame to load
-                                    time.sleep(0.5)
-                                    
-                                    # Find frame with the actual data
-                                    raw_html = None
-                                    for fr in page.frames:
-                                        try:
-                                            if (fr.locator("table.tw-table").count() > 0 or 
-                                                fr.locator("section.tw-list").count() > 0):
-                                                raw_html = fr.content()
-                                                logger.debug("Found data in frame (%d chars)", len(raw_html))
-                                                break
-                                        except Exception:
-                                            continue
-                                    
-                                    if not raw_html:
-                                        raw_html = page.content()
-                                        logger.debug("Using full page content (%d chars)", len(raw_html))
-                                    
-                                    # Save to database with chart-specific round_id
-                                    round_id = f"{chart_name}_{bout_label}".replace(" ", "_")
-                                    db.execute(
-                                        """--sql
-                                        INSERT INTO tournament_rounds (event_id, round_id, label, raw_html)
-                                        VALUES (?, ?, ?, ?)
-                                        ON CONFLICT (event_id, round_id) DO UPDATE SET
-                                            label = EXCLUDED.label,
-                                            raw_html = EXCLUDED.raw_html
-                                        """,
-                                        [t.event_id, round_id, bout_label, raw_html],
-                                    )
-                                    saved_count += 1
-                                    
-                                except Exception as e:
-                                    logger.debug("Error processing bout %s: %s", bout_id, e)
-                                    continue
-                        
-                        if saved_count > 0:
-                            logger.info("[event] %s | saved %d bouts across %d charts", 
-                                      t.event_id, saved_count, len(chart_links))
-                            overall_succeeded += 1
-                        else:
-                            type_path = TOURNAMENT_TYPE_PATHS.get(t.event_type, "opentournaments")
-                            tournament_url = f"{BASE_URL}/{type_path}/MainFrame.jsp?TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}&tournamentId={t.event_id}"
-                            logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | no bouts saved | {tournament_url}{Colors.RESET}")
-                            overall_skipped += 1
-                        continue
-                    
-                    # No chart links found, try direct bout access
-                    bouts = _get_selector_options(page, "boutNumberBox")
-                    if not bouts:
-                        type_path = TOURNAMENT_TYPE_PATHS.get(t.event_type, "opentournaments")
-                        tournament_url = f"{BASE_URL}/{type_path}/MainFrame.jsp?TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}&tournamentId={t.event_id}"
-                        logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | no bouts found in selector | {tournament_url}{Colors.RESET}")
-                        overall_skipped += 1
-                        continue
-                    
-                    logger.debug("Found %d bouts for dual meet %s", len(bouts), t.event_id)
-                    
-                    # Iterate through each bout and save raw HTML
-                    for bout_id, bout_label in bouts:
-                        try:
-                            # Find frame with bout selector
-                            bout_frame = None
-                            for fr in [page] + list(page.frames):
-                                try:
-                                    if fr.locator("select#boutNumberBox").count() > 0:
-                                        bout_frame = fr
-                                        break
-                                except Exception:
-                                    continue
-                            
-                            if not bout_frame:
-                                logger.debug("Could not find bout selector for %s", bout_id)
-                                continue
-                            
-                            # Select the bout
-                            bout_frame.locator("select#boutNumberBox").select_option(value=bout_id)
-                            try:
-                                page.wait_for_load_state("networkidle", timeout=3000)
-                            except Exception:
-                                pass  # networkidle may timeout due to ads
-                            
-                            # Wait for content frame to load (DualMeetDetail.jsp or similar)
-                            time.sleep(0.5)  # Give frame time to populate
-                            
-                            # Find frame with the actual data (table.tw-table or section.tw-list)
-                            # Parser expects to find these elements in the HTML
-                            raw_html = None
-                            for fr in page.frames:
-                                try:
-                                    # Check if this frame has the data elements
-                                    if (fr.locator("table.tw-table").count() > 0 or 
-                                        fr.locator("section.tw-list").count() > 0):
-                                        raw_html = fr.content()
-                                        logger.debug("Found data in frame (%d chars)", len(raw_html))
-                                        break
-                                except Exception:
-                                    continue
-                            
-                            # Fallback to full page if no frame found
-                            if not raw_html:
-                                raw_html = page.content()
-                                logger.debug("Using full page content (%d chars)", len(raw_html))
-                            
-                            # Save to database
-                            db.execute(
-                                """--sql
-                                INSERT INTO tournament_rounds (event_id, round_id, label, raw_html)
-                                VALUES (?, ?, ?, ?)
-                                ON CONFLICT (event_id, round_id) DO UPDATE SET
-                                    label = EXCLUDED.label,
-                                    raw_html = EXCLUDED.raw_html
-                                """,
-                                [t.event_id, bout_id, bout_label, raw_html],
-                            )
-                            saved_count += 1
-                            logger.debug("Saved bout %s: %s", bout_id, bout_label)
-                            
-                        except Exception as e:
-                            logger.debug("Error saving bout %s: %s", bout_id, e)
-                            continue
-                    
-                    if saved_count > 0:
-                        overall_succeeded += 1
-                        logger.info(
-                            "[event] %s | %s | succeeded (saved %d bouts)",
-                            t.event_id, t.name, saved_count
-                        )
-                    else:
-                        overall_skipped += 1
-                        type_path = TOURNAMENT_TYPE_PATHS.get(t.event_type, "opentournaments")
-                        tournament_url = f"{BASE_URL}/{type_path}/MainFrame.jsp?TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}&tournamentId={t.event_id}"
-                        logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | {t.name} | no bouts saved | {tournament_url}{Colors.RESET}")
-                    continue  # Move to next tournament
-
-                # Parse rounds from selector (standard tournament flow)
-                rounds = parse_rounds(page)
-                if not rounds:
-                    type_path = TOURNAMENT_TYPE_PATHS.get(t.event_type, "opentournaments")
-                    tournament_url = f"{BASE_URL}/{type_path}/MainFrame.jsp?TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}&tournamentId={t.event_id}"
-                    logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | no rounds found | {tournament_url}{Colors.RESET}")
-                    overall_skipped += 1
-                    continue
-
-                # Scrape each round
-                saved_count = 0
-                for rid, label in rounds:
-                    # Skip "All Rounds" aggregate
-                    if (label or "").strip().lower() == "all rounds" or rid in (None, "", "0"):
-                        continue
-
-                    try:
-                        # Re-navigate for each round to maintain page state
-                        page.goto(round_results_url, wait_until="load", timeout=15000)
-                        try:
-                            page.wait_for_load_state("networkidle", timeout=3000)
-                        except Exception:
-                            # networkidle can timeout due to ads, but page is usually loaded
-                            pass
-
-                        # Dismiss cookie consent dialog if present
-                        try:
-                            cookie_button = page.locator(
-                                "button:has-text('Accept'), "
-                                "button:has-text('Dismiss'), "
-                                "button.osano-cm-accept, "
-                                "button.osano-cm-dialog__close"
-                            )
-                            if cookie_button.count() > 0:
-                                cookie_button.first.click()
-                                time.sleep(0.3)
-                        except Exception:
-                            pass
-
-                        # Find round selector frame
-                        rounds_frame = None
-                        for fr in [page] + list(page.frames):
-                            try:
-                                if fr.locator("select#roundIdBox").count() > 0:
-                                    rounds_frame = fr
-                                    break
-                            except Exception:
-                                continue
-
-                        if not rounds_frame:
-                            continue
-
-                        # Select round and click Go
-                        rounds_frame.locator("select#roundIdBox").select_option(value=rid)
-                        time.sleep(0.1)
-
-                        go_btn = rounds_frame.locator(
-                            'input[type="button"][value="Go"][onclick*="viewSchedule"], '
-                            'input[type="button"][value="Go"]'
-                        ).first
-                        if go_btn.count() > 0:
-                            go_btn.click()
-                            try:
-                                page.wait_for_load_state("networkidle", timeout=2000)
-                            except Exception:
-                                # networkidle can timeout due to ads, but page is usually loaded
-                                pass
-
-                        # Find frame with the actual data (section.tw-list)
-                        # Parser expects to find this element in the HTML
-                        raw_html = None
-                        for fr in page.frames:
-                            try:
-                                # Check if this frame has the data elements
-                                if (fr.locator("section.tw-list").count() > 0 or
-                                    fr.locator("table.tw-table").count() > 0):
-                                    raw_html = fr.content()
-                                    logger.debug("Found data in frame (%d chars)", len(raw_html))
-                                    break
-                            except Exception:
-                                continue
-                        
-                        # Fallback to full page if no frame found
-                        if not raw_html:
-                            raw_html = page.content()
-                            logger.debug("Using full page content (%d chars)", len(raw_html))
-
-                        # Save to database
-                        db.execute(
-                            """--sql
-                            INSERT INTO tournament_rounds (event_id, round_id, label, raw_html)
-                            VALUES (?, ?, ?, ?)
-                            ON CONFLICT (event_id, round_id) DO UPDATE SET
-                                label = EXCLUDED.label,
-                                raw_html = EXCLUDED.raw_html
-                            """,
-                            [t.event_id, rid, label, raw_html],
-                        )
-                        saved_count += 1
-                        logger.debug("Saved round %s: %s", rid, label)
-
-                    except Exception as e:
-                        logger.debug("Error saving round %s: %s", rid, e)
-                        continue
-
-                if saved_count > 0:
-                    overall_succeeded += 1
-                    logger.info(
-                        "[event] %s | %s | succeeded (saved %d rounds)",
-                        t.event_id, t.name, saved_count
-                    )
-                else:
-                    overall_skipped += 1
-                    type_path = TOURNAMENT_TYPE_PATHS.get(t.event_type, "opentournaments")
-                    tournament_url = f"{BASE_URL}/{type_path}/MainFrame.jsp?TIM={_get_timestamp()}&twSessionId={GENERIC_SESSION_ID}&tournamentId={t.event_id}"
-                    logger.warning(f"{Colors.YELLOW}[event] {t.event_id} | {t.name} | no rounds saved | {tournament_url}{Colors.RESET}")
+                t, succeeded, discovered_path, pending_rounds = results.get(timeout=1.0)
+            except queue.Empty:
+                if not any(w.is_alive() for w in workers) and results.empty():
+                    break
+                continue
 
-            except Exception as e:
+            overall_events += 1
+            if succeeded:
+                overall_succeeded += 1
+            else:
                 overall_skipped += 1
-                logger.error(f"{Colors.RED}[event] {t.event_id} | {t.name} | error: {e}{Colors.RESET}")
 
-        browser.close()
+            unsaved.append((t, discovered_path, pending_rounds))
+            if len(unsaved) >= COMMIT_INTERVAL:
+                _save_scraped_events(db, unsaved)
+                unsaved = []
+    finally:
+        _save_scraped_events(db, unsaved)
+
+    for w in workers:
+        w.join()
 
     db.close()
 
@@ -1372,6 +1748,12 @@ def build_argparser() -> argparse.ArgumentParser:
         default=None,
         help="Limit number of tournaments to scrape",
     )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of tournaments to scrape concurrently, each in its own browser (default: 1)",
+    )
     p.add_argument(
         "--show",
         action="store_true",
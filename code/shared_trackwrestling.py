@@ -3,7 +3,8 @@ Shared utilities for TrackWrestling scraping.
 
 This module provides:
 - Database helpers for tournament rounds table
-- HTML validation utilities
+- zstd compression helpers for stored round HTML
+- HTML validation and results-fragment extraction utilities
 - Playwright helpers for round scraping (round selection, navigation within events)
 
 Note: Tournament discovery is now handled via HTTP requests in scrape_tournaments.py.
@@ -14,11 +15,17 @@ from __future__ import annotations
 
 import re
 import logging
-from urllib.parse import urlparse, parse_qs, urlencode
-import time
+from urllib.parse import urlparse, parse_qsl, urlencode
 from typing import List, Optional, Tuple, Any
 
 import duckdb
+import zstandard as zstd
+
+try:
+    # Optional accelerator for HTML validation (pip install wrestling-stats[optional])
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 # Module logger
 logger = logging.getLogger(__name__)
@@ -28,6 +35,78 @@ logger = logging.getLogger(__name__)
 # HTML Validation
 # ============================================================================
 
+_RE_PAGE_CONTENT = re.compile(r'<div[^>]+id=["\']pageContent["\']', re.I)
+_RE_TW_LIST = re.compile(r'<section[^>]+class=["\'][^"\']*(tw-list|tw\-list)[^"\'\/]*["\']', re.I)
+_RE_RESULTS_TABLE = re.compile(r'<(table|div)[^>]+id=["\']?(resultsTable|bracketsTable|results)["\']?', re.I)
+_RE_TW_LIST_SECTION = re.compile(
+    r'<section[^>]+class=["\'][^"\']*(tw-list|tw\-list)[^"\'\/]*["\'][^>]*>(.*?)</section>', re.I | re.S
+)
+# Literal markers checked before falling back to the regexes above
+_PAGE_CONTENT_MARKERS = ('id="pageContent"', "id='pageContent'")
+_TW_LIST_MARKERS = ('<section class="tw-list', "<section class='tw-list")
+_RESULTS_TABLE_MARKERS = (
+    'id="resultsTable"', 'id="bracketsTable"', 'id="results"',
+    "id='resultsTable'", "id='bracketsTable'", "id='results'",
+)
+
+# Common error messages, as one alternation so the HTML is scanned once
+_RE_ERRORS = re.compile(
+    r'(page\s+not\s+found|error\s+occurred|access\s+denied|session\s+expired|invalid\s+request)',
+    re.I,
+)
+
+
+def _has_marker(html: str, markers: Tuple[str, ...], pattern: re.Pattern) -> bool:
+    """Return True if any literal marker is in html, else fall back to the regex."""
+    return any(m in html for m in markers) or bool(pattern.search(html))
+
+
+def _find_tw_list(html: str) -> int:
+    """Return the offset of the first tw-list <section> tag, or -1 if there is none."""
+    hits = [i for i in (html.find(m) for m in _TW_LIST_MARKERS) if i >= 0]
+    if hits:
+        return min(hits)
+    m = _RE_TW_LIST.search(html)
+    return m.start() if m else -1
+
+
+def _html_structure(html: str) -> Tuple[bool, bool, bool, bool]:
+    """
+    Answer the structural questions validate_round_html asks about a page.
+
+    Returns (has_page_content, has_tw_list, has_results_table, tw_list_empty).
+    Uses a single selectolax parse when it is installed, otherwise literal
+    substring tests with regex fallbacks.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        tw_list = tree.css_first('section.tw-list')
+        return (
+            tree.css_first('#pageContent') is not None,
+            tw_list is not None,
+            tree.css_first(
+                'table#resultsTable, table#bracketsTable, table#results, '
+                'div#resultsTable, div#bracketsTable, div#results'
+            ) is not None,
+            tw_list is not None and tw_list.css_first('h2, li') is None,
+        )
+
+    has_page_content = _has_marker(html, _PAGE_CONTENT_MARKERS, _RE_PAGE_CONTENT)
+    tw_list_pos = _find_tw_list(html)
+    has_results_table = _has_marker(html, _RESULTS_TABLE_MARKERS, _RE_RESULTS_TABLE)
+
+    # Check if the tw-list section has weight classes (h2) or matches (li),
+    # matching in place at the tag already found rather than rescanning from the top
+    tw_list_empty = False
+    if tw_list_pos >= 0:
+        tw_list_match = _RE_TW_LIST_SECTION.match(html, tw_list_pos)
+        if tw_list_match:
+            section_content = tw_list_match.group(2)
+            tw_list_empty = not ('<h2' in section_content or '<li' in section_content)
+
+    return has_page_content, tw_list_pos >= 0, has_results_table, tw_list_empty
+
+
 def validate_round_html(html: Optional[str], event_id: str, label: str) -> Tuple[bool, str]:
     """
     Validate captured round HTML to detect incomplete page loads.
@@ -44,9 +123,7 @@ def validate_round_html(html: Optional[str], event_id: str, label: str) -> Tuple
         return False, f"HTML too short ({len(html)} bytes)"
     
     # Check for required content structures
-    has_page_content = bool(re.search(r'<div[^>]+id=["\']pageContent["\']', html, re.I))
-    has_tw_list = bool(re.search(r'<section[^>]+class=["\'][^"\']*(tw-list|tw\-list)[^"\'\/]*["\']', html, re.I))
-    has_results_table = bool(re.search(r'<(table|div)[^>]+id=["\']?(resultsTable|bracketsTable|results)["\']?', html, re.I))
+    has_page_content, has_tw_list, has_results_table, tw_list_empty = _html_structure(html)
     
     # Check for cookie consent/error pages (Osano cookie manager)
     # Only reject if it ONLY has osano content and no actual page content
@@ -58,50 +135,165 @@ def validate_round_html(html: Optional[str], event_id: str, label: str) -> Tuple
         return False, "missing expected content structures (pageContent, tw-list, or results table)"
     
     # Check for common error messages
-    error_patterns = [
-        r'page\s+not\s+found',
-        r'error\s+occurred',
-        r'access\s+denied',
-        r'session\s+expired',
-        r'invalid\s+request',
-    ]
-    for pattern in error_patterns:
-        if re.search(pattern, html, re.I):
-            return False, f"contains error message: {pattern}"
+    m = _RE_ERRORS.search(html)
+    if m:
+        return False, f"contains error message: {m.group(1)}"
     
     # Additional validation: if we have tw-list, check if it has actual content
-    if has_tw_list:
-        # Extract the tw-list section and check if it has weight classes (h2) or matches (li)
-        tw_list_match = re.search(r'<section[^>]+class=["\'][^"\']*(tw-list|tw\-list)[^"\'\/]*["\'][^>]*>(.*?)</section>', html, re.I | re.S)
-        if tw_list_match:
-            section_content = tw_list_match.group(1)
-            has_h2 = '<h2' in section_content
-            has_li = '<li' in section_content
-            if not (has_h2 or has_li):
-                return False, "tw-list section exists but appears empty"
+    if tw_list_empty:
+        return False, "tw-list section exists but appears empty"
     
     return True, "ok"
 
 
+# ============================================================================
+# HTML Compression
+# ============================================================================
+
+# Round HTML compresses ~10x; level 3 is close to peak ratio at high speed
+_HTML_COMPRESSOR = zstd.ZstdCompressor(level=3)
+_HTML_DECOMPRESSOR = zstd.ZstdDecompressor()
+
+
+def compress_html(html: str) -> bytes:
+    """Compress captured HTML for storage in tournament_rounds.raw_html_zst."""
+    return _HTML_COMPRESSOR.compress(html.encode("utf-8"))
+
+
+def decompress_html(blob: Optional[bytes]) -> Optional[str]:
+    """Decompress HTML stored in tournament_rounds.raw_html_zst."""
+    if blob is None:
+        return None
+    return _HTML_DECOMPRESSOR.decompress(bytes(blob)).decode("utf-8")
+
+
+# ============================================================================
+# HTML Fragments
+# ============================================================================
+
+# Containers parse_round_html reads; everything else on a page is chrome
+RESULTS_FRAGMENT_SELECTOR = 'section.tw-list, table.tw-table, #resultsTable, #bracketsTable, #results'
+
+
+def extract_results_fragment(html: str) -> Optional[str]:
+    """
+    Return just the results containers from a full page's HTML, or None if
+    the page has none.
+
+    Nested matches are dropped so each container appears once. Uses
+    selectolax when installed, otherwise BeautifulSoup.
+    """
+    if LexborHTMLParser is not None:
+        nodes = LexborHTMLParser(html).css(RESULTS_FRAGMENT_SELECTOR)
+        seen = {n.mem_id for n in nodes}
+        outer = []
+        for n in nodes:
+            p = n.parent
+            while p is not None and p.mem_id not in seen:
+                p = p.parent
+            if p is None:
+                outer.append(n.html)
+    else:
+        from bs4 import BeautifulSoup
+
+        nodes = BeautifulSoup(html, "html.parser").select(RESULTS_FRAGMENT_SELECTOR)
+        seen = {id(n) for n in nodes}
+        outer = [str(n) for n in nodes if not any(id(p) in seen for p in n.parents)]
+    return "\n".join(outer) or None
+
+
 # ============================================================================
 # Database Helpers
 # ============================================================================
 
 def ensure_rounds_table(conn: duckdb.DuckDBPyConnection) -> None:
-    """Ensure the tournament_rounds table exists."""
-    conn.execute(
-        """--sql
-        CREATE TABLE IF NOT EXISTS tournament_rounds (
-            event_id TEXT,
-            round_id TEXT,
-            label TEXT,
-            raw_html TEXT,
-            parsed_ok BOOLEAN,
-            first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (event_id, round_id)
-        );
-        """
+    """
+    Ensure the tournament_rounds table exists.
+
+    New rows store zstd-compressed HTML in raw_html_zst; raw_html (TEXT) is
+    only populated for rows captured before compression was introduced.
+    Checks the catalog first so an up-to-date database costs a single
+    read-only query instead of DDL on every run.
+    """
+    cols = set(
+        r[0]
+        for r in conn.execute(
+            """--sql
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name = 'tournament_rounds'
+            """
+        ).fetchall()
     )
+    if not cols:
+        conn.execute(
+            """--sql
+            CREATE TABLE IF NOT EXISTS tournament_rounds (
+                event_id TEXT,
+                round_id TEXT,
+                label TEXT,
+                raw_html TEXT,
+                raw_html_zst BLOB,
+                parsed_ok BOOLEAN,
+                first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (event_id, round_id)
+            );
+            """
+        )
+        return
+
+    # Backfill: add compressed HTML column if missing (for existing databases)
+    if "raw_html_zst" not in cols:
+        conn.execute("""--sql
+        ALTER TABLE tournament_rounds ADD COLUMN raw_html_zst BLOB
+        """)
+
+
+def compress_legacy_rounds(conn: duckdb.DuckDBPyConnection, batch_size: int = 500) -> int:
+    """
+    Move uncompressed raw_html (rows captured before raw_html_zst existed)
+    into raw_html_zst, clearing the TEXT copy.
+
+    Returns the number of rows converted.
+    """
+    converted = 0
+    while True:
+        rows = conn.execute(
+            """--sql
+            SELECT event_id, round_id, raw_html
+            FROM tournament_rounds
+            WHERE raw_html IS NOT NULL AND raw_html_zst IS NULL
+            LIMIT ?
+            """,
+            [batch_size],
+        ).fetchall()
+        if not rows:
+            return converted
+        conn.executemany(
+            """--sql
+            UPDATE tournament_rounds
+            SET raw_html_zst = ?, raw_html = NULL
+            WHERE event_id = ? AND round_id = ?
+            """,
+            [(compress_html(raw_html), event_id, round_id) for event_id, round_id, raw_html in rows],
+        )
+        converted += len(rows)
+
+
+def get_round_html(conn: duckdb.DuckDBPyConnection, event_id: str, round_id: str) -> Optional[str]:
+    """Return the captured HTML for a round (compressed or legacy), or None."""
+    row = conn.execute(
+        """--sql
+        SELECT raw_html, raw_html_zst
+        FROM tournament_rounds
+        WHERE event_id = ? AND round_id = ?
+        """,
+        [event_id, round_id],
+    ).fetchone()
+    if row is None:
+        return None
+    raw_html, raw_html_zst = row
+    return decompress_html(raw_html_zst) if raw_html_zst is not None else raw_html
 
 
 def upsert_round(
@@ -120,7 +312,7 @@ def upsert_round(
         event_id: Tournament event ID
         round_id: Round identifier
         label: Human-readable round label
-        raw_html: Optional captured HTML content
+        raw_html: Optional captured HTML content (stored zstd-compressed)
         validation_failed: If True, sets parsed_ok = FALSE to prevent parsing attempts
     """
     if raw_html is None:
@@ -134,21 +326,181 @@ def upsert_round(
             """,
             [event_id, round_id, label, False if validation_failed else None],
         )
+    elif not validation_failed:
+        upsert_rounds(conn, [(event_id, round_id, label, raw_html)])
     else:
-        parsed_ok_value = False if validation_failed else None
         conn.execute(
             """--sql
-            INSERT INTO tournament_rounds AS tr (event_id, round_id, label, raw_html, parsed_ok)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT INTO tournament_rounds AS tr (event_id, round_id, label, raw_html, raw_html_zst, parsed_ok)
+            VALUES (?, ?, ?, NULL, ?, ?)
             ON CONFLICT (event_id, round_id) DO UPDATE SET
                 label = EXCLUDED.label,
-                raw_html = EXCLUDED.raw_html,
-                parsed_ok = COALESCE(EXCLUDED.parsed_ok, tr.parsed_ok)
+                raw_html = NULL,
+                raw_html_zst = EXCLUDED.raw_html_zst,
+                parsed_ok = EXCLUDED.parsed_ok
             """,
-            [event_id, round_id, label, raw_html, parsed_ok_value],
+            [event_id, round_id, label, compress_html(raw_html), False],
         )
 
 
+def upsert_rounds(
+    conn: duckdb.DuckDBPyConnection,
+    rows: List[Tuple[str, str, str, str]],
+) -> int:
+    """
+    Insert or update captured HTML for many rounds at once.
+
+    The whole batch is bound as a single list parameter, unnested in SQL and
+    merged into tournament_rounds with one INSERT ... SELECT ... ON CONFLICT,
+    so DuckDB plans and scans it once instead of once per row. If a round
+    appears more than once, the last row wins.
+
+    Args:
+        conn: DuckDB connection
+        rows: (event_id, round_id, label, raw_html) tuples
+
+    Returns:
+        Number of rows merged
+    """
+    if not rows:
+        return 0
+    batch = [
+        {
+            "seq": seq,
+            "event_id": event_id,
+            "round_id": round_id,
+            "label": label,
+            "raw_html_zst": compress_html(raw_html),
+        }
+        for seq, (event_id, round_id, label, raw_html) in enumerate(rows)
+    ]
+    conn.execute(
+        """--sql
+        INSERT INTO tournament_rounds (event_id, round_id, label, raw_html, raw_html_zst)
+        SELECT event_id, round_id, label, NULL, raw_html_zst
+        FROM (SELECT UNNEST($batch, recursive := true))
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY event_id, round_id ORDER BY seq DESC) = 1
+        ON CONFLICT (event_id, round_id) DO UPDATE SET
+            label = EXCLUDED.label,
+            raw_html = NULL,
+            raw_html_zst = EXCLUDED.raw_html_zst
+        """,
+        {"batch": batch},
+    )
+    return len(rows)
+
+
+# ============================================================================
+# Playwright Helpers - Frame Lookup
+# ============================================================================
+
+# Walks the document and its same-origin (i)frames in-browser, returning the
+# chain of {name, url} hops to the first document matching the selector
+# ([] for the top document) or null if none match.
+_FIND_SELECTOR_FRAME_JS = """
+(selector) => {
+    const search = (doc, path) => {
+        if (doc.querySelector(selector)) return path;
+        for (const el of doc.querySelectorAll('iframe, frame')) {
+            let child = null;
+            try { child = el.contentDocument; } catch (e) {}
+            if (!child) continue;
+            const found = search(child, path.concat([{name: el.name || '', url: child.location.href}]));
+            if (found) return found;
+        }
+        return null;
+    };
+    return search(document, []);
+}
+"""
+
+
+def _frame_has_selector(fr: Any, selector: str) -> bool:
+    """Return True if selector matches an element in this page/frame."""
+    try:
+        return fr.locator(selector).count() > 0
+    except Exception:
+        return False
+
+
+def _unreadable_frames(page: Any) -> List[Any]:
+    """
+    Return the frames the in-browser walk cannot see into.
+
+    Those are cross-origin frames, whose contentDocument is not readable
+    from the top document.
+    """
+    top = urlparse(page.url or "")
+    frames = []
+    for fr in page.frames:
+        if fr is page.main_frame:
+            continue
+        url = urlparse(fr.url or "")
+        # about:blank/srcdoc frames inherit the parent's origin
+        if url.scheme in ("http", "https") and (url.scheme, url.netloc) != (top.scheme, top.netloc):
+            frames.append(fr)
+    return frames
+
+
+def find_selector_frame(page: Any, selector: str) -> Optional[Any]:
+    """
+    Find the page or frame containing an element matching selector.
+
+    Uses a single in-browser walk across same-origin frames instead of one
+    locator count() round-trip per frame; cross-origin frames, which the walk
+    can't read, are probed individually only when the walk finds nothing.
+    Returns the page itself for the top document, the matching frame, or
+    None if no frame has the selector.
+    """
+    try:
+        path = page.evaluate(_FIND_SELECTOR_FRAME_JS, selector)
+    except Exception as e:
+        logger.debug("Frame walk failed for %s: %s", selector, e)
+        path = False
+
+    if path is None:
+        for fr in _unreadable_frames(page):
+            if _frame_has_selector(fr, selector):
+                return fr
+        return None
+    if path == []:
+        return page
+    if path:
+        target = path[-1]
+        # Several frames can share a URL (and have no name), so confirm the
+        # candidate actually holds the selector
+        for fr in page.frames:
+            if (
+                fr.url == target["url"]
+                and (not target["name"] or fr.name == target["name"])
+                and _frame_has_selector(fr, selector)
+            ):
+                return fr
+
+    # Fall back to probing each frame (e.g. evaluate failed mid-navigation)
+    for fr in [page] + list(page.frames):
+        if _frame_has_selector(fr, selector):
+            return fr
+    return None
+
+
+def wait_for_selector_frame(page: Any, selector: str, timeout: int = 5000) -> Optional[Any]:
+    """
+    Wait until selector appears in the page or any same-origin frame.
+
+    Returns the matching page/frame (see find_selector_frame). On timeout,
+    cross-origin frames get one last probe before returning None.
+    """
+    try:
+        page.wait_for_function(_FIND_SELECTOR_FRAME_JS, arg=selector, timeout=timeout)
+    except Exception:
+        for fr in _unreadable_frames(page):
+            if _frame_has_selector(fr, selector):
+                return fr
+        return None
+    return find_selector_frame(page, selector)
+
+
 # ============================================================================
 # Playwright Helpers - Modal Management
 # ============================================================================
@@ -161,7 +513,6 @@ def close_any_modals(page: Any) -> None:
         if close_button.count() > 0 and close_button.is_visible():
             logger.debug("Closing open modal")
             close_button.click()
-            time.sleep(0.1)
     except Exception:
         pass
     # Also try calling hideModal() directly
@@ -175,41 +526,23 @@ def close_any_modals(page: Any) -> None:
 # Playwright Helpers - Tournament Type Detection
 # ============================================================================
 
+_TOURNAMENT_TYPE_PATHS = ('teamtournaments', 'predefinedtournaments', 'opentournaments')
+
+
 def detect_tournament_type(page: Any) -> Optional[str]:
-    """Detect tournament type from current page URL and content."""
+    """
+    Detect tournament type from the page and frame URLs.
+
+    Frame URLs change under MainFrame.jsp while page.url stays put, so every
+    call rescans them; it's a plain string scan, no browser round-trip.
+    """
     try:
-        current_url = getattr(page, 'url', '') or ''
-        
-        # Check URL path first
-        if '/teamtournaments/' in current_url:
-            return 'teamtournaments'
-        elif '/predefinedtournaments/' in current_url:
-            return 'predefinedtournaments'
-        elif '/opentournaments/' in current_url:
-            return 'opentournaments'
-        
-        # Check all frames for tournament type indicators
-        for fr in [page] + list(page.frames):
-            try:
-                frame_url = getattr(fr, 'url', '') or ''
-                if '/teamtournaments/' in frame_url:
-                    return 'teamtournaments'
-                elif '/predefinedtournaments/' in frame_url:
-                    return 'predefinedtournaments'
-                elif '/opentournaments/' in frame_url:
-                    return 'opentournaments'
-                
-                # Check for tournament type in page content
-                content = fr.content()
-                if 'teamtournaments' in content:
-                    return 'teamtournaments'
-                elif 'predefinedtournaments' in content:
-                    return 'predefinedtournaments'
-            except Exception:
-                continue
-        
-        # Default to opentournaments if no specific type detected
-        return 'opentournaments'
+        urls = [getattr(page, 'url', '') or ''] + [getattr(fr, 'url', '') or '' for fr in page.frames]
+        for url in urls:
+            found = next((t for t in _TOURNAMENT_TYPE_PATHS if f'/{t}/' in url), None)
+            if found:
+                return found
+        return 'opentournaments'  # Default if no specific type detected
     except Exception:
         return None
 
@@ -218,6 +551,62 @@ def detect_tournament_type(page: Any) -> Optional[str]:
 # Playwright Helpers - Round Results Navigation
 # ============================================================================
 
+_RE_SESSION = re.compile(r'twSessionId=(?P<sid>[A-Za-z0-9]+)|TIM=(?P<tim>\d+)')
+
+# Returns the raw href of every anchor carrying session params, in one round-trip
+_SESSION_HREFS_JS = """
+() => Array.from(document.querySelectorAll('a[href*="twSessionId="]'))
+    .map(a => a.getAttribute('href') || '')
+"""
+
+
+# twSessionId -> RoundResults path type that worked for it (process-wide)
+_SESSION_PATH_CACHE: dict[str, str] = {}
+
+# Navigation links that lead to Round Results, limited to visible ones
+_ROUND_RESULTS_LINK_SELECTOR = (
+    'a:has-text("Round Results"), '
+    'a:has-text("Rounds"), '
+    'a[href*="RoundResults"], '
+    'li:has-text("Round Results") a '
+    '>> visible=true'
+)
+
+
+def _has_round_selector(page: Any) -> bool:
+    """
+    Return True if select#roundIdBox is in the page or any frame.
+
+    The frame it was last found in is remembered on the page and checked
+    first; the in-browser walk over all frames only runs on a miss.
+    """
+    last_frame = getattr(page, '_tw_round_frame', None)
+    if last_frame is not None:
+        try:
+            if not last_frame.is_detached() and last_frame.locator("select#roundIdBox").count() > 0:
+                return True
+        except Exception:
+            pass
+    fr = find_selector_frame(page, "select#roundIdBox")
+    if fr is None:
+        return False
+    page._tw_round_frame = page.main_frame if fr is page else fr
+    return True
+
+
+def reset_session_cache(context: Any) -> None:
+    """
+    Forget the TIM/twSessionId goto_round_results cached on a browser context.
+
+    Call wherever the session cookies are cleared (e.g. between events), so
+    a later RoundResults.jsp fallback can't reuse the previous event's session.
+    """
+    try:
+        context._tw_session = None
+    except Exception:
+        pass
+
+
 def goto_round_results(page: Any) -> bool:
     """
     Navigate to the Round Results page within an event.
@@ -243,13 +632,9 @@ def goto_round_results(page: Any) -> bool:
                     logger.debug("navigated to RoundResults; url=%s", getattr(page, 'url', None))
                     
                     # Verify we got the round selector
-                    for fr in [page] + list(page.frames):
-                        try:
-                            if fr.locator("select#roundIdBox").count() > 0:
-                                logger.debug("verified round selector present")
-                                return True
-                        except Exception:
-                            continue
+                    if _has_round_selector(page):
+                        logger.debug("verified round selector present")
+                        return True
                     logger.debug("navigated but no round selector found")
                 except Exception as e:
                     logger.debug("navigation via href failed: %s", e)
@@ -259,12 +644,8 @@ def goto_round_results(page: Any) -> bool:
                 logger.debug("clicked RoundResults anchor; url=%s", getattr(page, 'url', None))
                 
                 # Verify round selector
-                for fr in [page] + list(page.frames):
-                    try:
-                        if fr.locator("select#roundIdBox").count() > 0:
-                            return True
-                    except Exception:
-                        continue
+                if _has_round_selector(page):
+                    return True
             except Exception as e:
                 logger.debug("clicking RoundResults failed: %s", e)
     except Exception as e:
@@ -272,29 +653,22 @@ def goto_round_results(page: Any) -> bool:
     
     # 2) Search frames for anchor and navigate using its href (preserves session params)
     try:
-        for fr in page.frames:
-            try:
-                l2 = fr.locator('a[href*="RoundResults.jsp"]').first
-                c2 = l2.count()
-                if c2 > 0:
-                    href = l2.get_attribute('href')
-                    if href:
-                        try:
-                            logger.debug("navigating (frame) to RoundResults via href: %s", href)
-                            page.goto(href, wait_until="domcontentloaded", timeout=8000)
-                            logger.debug("navigated to Round Results (frame href); url=%s", getattr(page, 'url', None))
-                            return True
-                        except Exception:
-                            pass
-                    try:
-                        logger.debug("clicking RoundResults anchor in frame")
-                        l2.click(timeout=4000)
-                        logger.debug("clicked RoundResults in frame; url=%s", getattr(page, 'url', None))
-                        return True
-                    except Exception:
-                        continue
-            except Exception:
-                continue
+        fr = find_selector_frame(page, 'a[href*="RoundResults.jsp"]')
+        if fr is not None:
+            l2 = fr.locator('a[href*="RoundResults.jsp"]').first
+            href = l2.get_attribute('href')
+            if href:
+                try:
+                    logger.debug("navigating (frame) to RoundResults via href: %s", href)
+                    page.goto(href, wait_until="domcontentloaded", timeout=8000)
+                    logger.debug("navigated to Round Results (frame href); url=%s", getattr(page, 'url', None))
+                    return True
+                except Exception:
+                    pass
+            logger.debug("clicking RoundResults anchor in frame")
+            l2.click(timeout=4000)
+            logger.debug("clicked RoundResults in frame; url=%s", getattr(page, 'url', None))
+            return True
     except Exception:
         pass
     
@@ -309,23 +683,31 @@ def goto_round_results(page: Any) -> bool:
     
     # 4) Session-aware fallback: construct RoundResults URL with TIM and twSessionId
     def _extract_from_url(u: str) -> Tuple[Optional[str], Optional[str]]:
+        # Stops at the first TIM and twSessionId instead of parsing every param
+        tim = sid = None
         try:
-            q = parse_qs(urlparse(u).query)
-            sid = (q.get("twSessionId", [None])[0])
-            tim = (q.get("TIM", [None])[0])
-            return tim, sid
+            for key, value in parse_qsl(urlparse(u).query):
+                if key == "TIM" and tim is None:
+                    tim = value
+                elif key == "twSessionId" and sid is None:
+                    sid = value
+                if tim and sid:
+                    break
         except Exception:
             return None, None
+        return tim, sid
 
     def _extract_from_string(s: str) -> Tuple[Optional[str], Optional[str]]:
-        try:
-            sid_m = re.search(r"twSessionId=([A-Za-z0-9]+)", s)
-            tim_m = re.search(r"TIM=(\d+)", s)
-            sid = sid_m.group(1) if sid_m else None
-            tim = tim_m.group(1) if tim_m else None
-            return tim, sid
-        except Exception:
-            return None, None
+        # One scan picks up the first TIM and first twSessionId, in either order
+        tim = sid = None
+        for m in _RE_SESSION.finditer(s):
+            if m.lastgroup == 'sid':
+                sid = sid or m.group('sid')
+            else:
+                tim = tim or m.group('tim')
+            if tim and sid:
+                break
+        return tim, sid
 
     def _collect_session(page_obj: Any) -> Tuple[Optional[str], Optional[str]]:
         # 1) Try current page URL
@@ -334,8 +716,7 @@ def goto_round_results(page: Any) -> bool:
             return tim, sid
         # 2) Try any anchors on page containing session params
         try:
-            for a in page_obj.locator('a[href*="twSessionId="]').element_handles():
-                href = a.get_attribute('href') or ''
+            for href in page_obj.evaluate(_SESSION_HREFS_JS):
                 tim, sid = _extract_from_string(href)
                 if tim and sid:
                     return tim, sid
@@ -351,8 +732,7 @@ def goto_round_results(page: Any) -> bool:
                 except Exception:
                     pass
                 try:
-                    for a in fr.locator('a[href*="twSessionId="]').element_handles():
-                        href = a.get_attribute('href') or ''
+                    for href in fr.evaluate(_SESSION_HREFS_JS):
                         tim, sid = _extract_from_string(href)
                         if tim and sid:
                             return tim, sid
@@ -375,8 +755,17 @@ def goto_round_results(page: Any) -> bool:
         except Exception:
             return None, None
 
-    tim, sid = _collect_session(page)
+    # Session params stay valid until the context's session cookies are cleared
+    # (see reset_session_cache), so reuse the ones found earlier instead of
+    # walking every frame and anchor again
+    cached_session = getattr(page.context, '_tw_session', None)
+    tim, sid = cached_session or _collect_session(page)
     if tim and sid:
+        if not cached_session:
+            try:
+                page.context._tw_session = (tim, sid)
+            except Exception:
+                pass
         logger.debug("collected session params: TIM=%s, twSessionId=%s...", tim, sid[:10] if sid else None)
         
         # Detect tournament type from current page
@@ -390,6 +779,11 @@ def goto_round_results(page: Any) -> bool:
             paths_to_try = ['/predefinedtournaments/', '/teamtournaments/', '/opentournaments/']
         else:
             paths_to_try = ['/opentournaments/', '/teamtournaments/', '/predefinedtournaments/']
+
+        # Try the path that already worked for this session first
+        cached_path = _SESSION_PATH_CACHE.get(sid)
+        if cached_path:
+            paths_to_try = [cached_path] + [p for p in paths_to_try if p != cached_path]
         
         for path_type in paths_to_try:
             try:
@@ -400,19 +794,9 @@ def goto_round_results(page: Any) -> bool:
                 logger.debug("navigated to RoundResults with session; url=%s", getattr(page, 'url', None))
                 
                 # Check if we got a valid page with round selector
-                time.sleep(0.4)
-                has_rounds = False
-                for fr in [page] + list(page.frames):
-                    try:
-                        if fr.locator("select#roundIdBox").count() > 0:
-                            has_rounds = True
-                            logger.debug("found round selector in %s", "main page" if fr == page else "frame")
-                            break
-                    except Exception:
-                        continue
-                
-                if has_rounds:
+                if wait_for_selector_frame(page, "select#roundIdBox", timeout=1500) is not None:
                     logger.debug("SUCCESS: found round selector with path type: %s", path_type)
+                    _SESSION_PATH_CACHE[sid] = path_type
                     return True
                 else:
                     logger.debug("no round selector found with path type: %s, trying next", path_type)
@@ -421,44 +805,27 @@ def goto_round_results(page: Any) -> bool:
                 continue
         
         logger.warning("failed navigating to session RoundResults URL with all path types (TIM=%s)", tim)
+        # The session may have expired; collect it fresh next time
+        reset_session_cache(page.context)
     else:
         logger.warning("unable to determine session params (TIM=%s, sid=%s) for Round Results navigation", tim, sid)
     
     # Final fallback: try to find Round Results link from current page menu/navigation
     logger.debug("attempting final fallback: searching for Round Results in navigation menu")
     try:
-        # Look for navigation menus or tabs
+        # Look for navigation menus or tabs: one combined selector per frame,
+        # resolved once, instead of probing each selector with count()
         for fr in [page] + list(page.frames):
             try:
-                # Try various selectors for Round Results links
-                selectors = [
-                    'a:has-text("Round Results")',
-                    'a:has-text("Rounds")',
-                    'a[href*="RoundResults"]',
-                    'li:has-text("Round Results") a',
-                    'nav a:has-text("Round Results")',
-                    '.menu a:has-text("Round Results")',
-                    '.navigation a:has-text("Round Results")',
-                ]
-                
-                for selector in selectors:
-                    try:
-                        link = fr.locator(selector).first
-                        if link.count() > 0 and link.is_visible():
-                            logger.debug("found Round Results link with selector: %s", selector)
-                            link.click(timeout=5000)
-                            time.sleep(0.3)
-                            
-                            # Verify round selector appeared
-                            for check_fr in [page] + list(page.frames):
-                                try:
-                                    if check_fr.locator("select#roundIdBox").count() > 0:
-                                        logger.debug("SUCCESS: final fallback worked")
-                                        return True
-                                except Exception:
-                                    continue
-                    except Exception:
-                        continue
+                link = fr.locator(_ROUND_RESULTS_LINK_SELECTOR).first
+                if link.count() > 0:
+                    logger.debug("found Round Results link in %s", "main page" if fr is page else "frame")
+                    link.click(timeout=5000)
+                    
+                    # Verify round selector appeared
+                    if wait_for_selector_frame(page, "select#roundIdBox", timeout=1500) is not None:
+                        logger.debug("SUCCESS: final fallback worked")
+                        return True
             except Exception:
                 continue
     except Exception as e:
@@ -470,15 +837,8 @@ def goto_round_results(page: Any) -> bool:
 def ensure_round_results_view(page: Any) -> bool:
     """Ensure we're back on the Round Results selection (with select#roundIdBox visible)."""
     # If already visible, done
-    try:
-        for fr in [page] + list(page.frames):
-            try:
-                if fr.locator("select#roundIdBox").count() > 0:
-                    return True
-            except Exception:
-                continue
-    except Exception:
-        pass
+    if _has_round_selector(page):
+        return True
     
     # Try 'Back' controls
     try:
@@ -507,67 +867,50 @@ def ensure_round_results_view(page: Any) -> bool:
         pass
     
     # Check again
-    try:
-        for fr in [page] + list(page.frames):
-            try:
-                if fr.locator("select#roundIdBox").count() > 0:
-                    return True
-            except Exception:
-                continue
-    except Exception:
-        pass
-    
-    return False
+    return _has_round_selector(page)
 
 
 # ============================================================================
 # Playwright Helpers - Round Parsing
 # ============================================================================
 
+# (value, label) for each option with a non-empty value attribute in a <select>,
+# read straight off the select's options collection. The "All Rounds"
+# aggregate (value 0) is dropped here so it never crosses to Python.
+_ROUND_OPTIONS_JS = """
+(sel) => {
+    const opts = sel.options, out = [];
+    for (let i = 0; i < opts.length; i++) {
+        const o = opts[i];
+        if (!o.hasAttribute('value') || !o.value || o.value === '0') continue;
+        const label = o.text.trim();
+        if (label.toLowerCase() === 'all rounds') continue;
+        out.push([o.value, label]);
+    }
+    return out;
+}
+"""
+
+
 def parse_rounds(page: Any) -> List[Tuple[str, str]]:
     """
     Parse available rounds from the round selector dropdown.
     
-    Returns list of (round_id, label) tuples.
+    Returns list of (round_id, label) tuples, excluding the "All Rounds"
+    aggregate option.
     """
-    from playwright.sync_api import TimeoutError as PWTimeout
-
-    # Helper to extract from a select locator
-    def _extract_from_select(sel_loc) -> List[Tuple[str, str]]:
-        options = sel_loc.locator("option[value]")
-        cnt = options.count()
-        out: List[Tuple[str, str]] = []
-        for i in range(cnt):
-            value = options.nth(i).get_attribute("value") or ""
-            if not value:
-                continue
-            label = (options.nth(i).inner_text() or "").strip()
-            out.append((value, label))
-        return out
+    # Wait for the selector in the page or any frame, then read every option
+    # with one eval_on_selector call on whichever document holds it
+    fr = wait_for_selector_frame(page, "select#roundIdBox", timeout=4000)
+    if fr is None:
+        return []
 
-    # 1) Try on the page
     try:
-        select = page.locator("select#roundIdBox")
-        select.wait_for(timeout=4000)
-        rounds = _extract_from_select(select)
-        logger.debug("rounds select found on page; options=%s", len(rounds))
-        return rounds
-    except PWTimeout:
-        pass
-    
-    # 2) Look through frames
-    for fr in page.frames:
-        try:
-            sel = fr.locator("select#roundIdBox")
-            if sel.count() > 0:
-                try:
-                    sel.wait_for(timeout=3000)
-                except Exception:
-                    pass
-                rounds = _extract_from_select(sel)
-                logger.debug("rounds select found in frame; options=%s", len(rounds))
-                return rounds
-        except Exception:
-            continue
-    
-    return []
+        pairs = fr.eval_on_selector("select#roundIdBox", _ROUND_OPTIONS_JS)
+    except Exception as e:
+        logger.debug("failed reading round options: %s", e)
+        return []
+
+    rounds = [(value, label) for value, label in pairs]
+    logger.debug("rounds select found in %s; options=%s", "page" if fr is page else "frame", len(rounds))
+    return rounds
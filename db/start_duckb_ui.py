@@ -25,20 +25,24 @@ def main():
     main_db = db_files[0]
     print(f"Connecting to database: {main_db}")
     
+    conn = None
     try:
-        # Connect to DuckDB
-        conn = duckdb.connect(str(main_db))
+        # Connect to DuckDB (read-only, like the attached files; the UI only browses)
+        conn = duckdb.connect(str(main_db), read_only=True)
         
         # Attach all other .db files from output/ directory
         other_db_files = [f for f in db_files if f != main_db]
         if other_db_files:
             print(f"\nAttaching {len(other_db_files)} additional database file(s):")
             for db_file in other_db_files:
-                # Use the file name (without extension) as the database alias
+                # Use the file name (without extension) as the database alias,
+                # quoted so names with hyphens or leading digits still attach
                 db_name = db_file.stem
-                db_file_path = str(db_file)
+                alias = '"' + db_name.replace('"', '""') + '"'
+                db_file_path = str(db_file).replace("'", "''")
                 try:
-                    conn.execute(f"ATTACH '{db_file_path}' AS {db_name};")
+                    # Read-only: the UI only browses, so skip the write lock
+                    conn.execute(f"ATTACH '{db_file_path}' AS {alias} (READ_ONLY);")
                     print(f"  ✓ Attached: {db_file.name} as '{db_name}'")
                 except Exception as e:
                     print(f"  ✗ Failed to attach {db_file.name}: {e}")
@@ -49,19 +53,27 @@ def main():
         print("The web interface will open in your browser.")
         print("\nPress Enter to stop the UI and exit...")
         
-        # Start the DuckDB web UI
+        # Start the DuckDB web UI (the server runs in the background)
         conn.execute("CALL start_ui();")
         
-        # Wait for user input
-        input()
-        
-        # Close connection
-        conn.close()
-        print("Database connection closed.")
+        # Wait for user input; Ctrl-C or a closed stdin also means stop
+        try:
+            input()
+        except (KeyboardInterrupt, EOFError):
+            pass
         
     except Exception as e:
         print(f"Error: {e}")
         print("Make sure DuckDB is installed: uv add duckdb")
+    finally:
+        # Always stop the UI server and release the database files
+        if conn is not None:
+            try:
+                conn.execute("CALL stop_ui_server();")
+            except Exception:
+                pass
+            conn.close()
+            print("Database connection closed.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
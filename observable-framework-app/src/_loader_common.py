@@ -0,0 +1,83 @@
+"""
+Helpers shared by the Observable Framework parquet data loaders.
+
+Each loader puts src/ on sys.path and imports from here, so the DuckDB
+settings, stdout streaming and empty-output handling stay identical across
+loaders.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import shutil
+import tempfile
+import duckdb
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# One-shot COPY run alongside other loaders during a build: keep the thread
+# pool and memory small (same env overrides as the pipeline's connect_db)
+DUCKDB_CONFIG = {
+	"threads": int(os.getenv("DUCKDB_THREADS", str(min(4, os.cpu_count() or 4)))),
+	"memory_limit": os.getenv("DUCKDB_MEMORY_LIMIT", "2GB"),
+	"preserve_insertion_order": False,
+}
+
+# Seasons run Sept 1 to Aug 31. Group and sort on the starting year as a
+# SMALLINT; the '2024-2025' label is only built for the output column
+SEASON_MACRO_SQL = """--sql
+CREATE OR REPLACE TEMP MACRO season_start_of(d) AS
+  CAST(CASE WHEN MONTH(d) >= 9 THEN YEAR(d) ELSE YEAR(d) - 1 END AS SMALLINT);
+CREATE OR REPLACE TEMP MACRO season_label(s) AS
+  CAST(s AS VARCHAR) || '-' || CAST(s + 1 AS VARCHAR);
+"""
+
+
+def copy_to_stdout(con: duckdb.DuckDBPyConnection, sql: str) -> None:
+	"""Run a COPY ... TO ? statement with stdout as its target."""
+	if os.path.exists("/dev/stdout"):
+		# DuckDB writes the parquet straight to stdout, skipping the temp file copy
+		sys.stdout.flush()
+		con.execute(sql, ["/dev/stdout"])
+		return
+
+	# No /dev/stdout (e.g. Windows): write to a temp file and stream it out
+	parquet_tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".parquet")
+	parquet_tmp_name = parquet_tmp.name
+	parquet_tmp.close()  # DuckDB needs to open it for writing
+	try:
+		con.execute(sql, [parquet_tmp_name])
+
+		# Copy in 1 MiB chunks rather than reading the whole file into memory
+		with open(parquet_tmp_name, "rb", buffering=COPY_BUFFER_SIZE) as f:
+			shutil.copyfileobj(f, sys.stdout.buffer, length=COPY_BUFFER_SIZE)
+			sys.stdout.flush()
+	finally:
+		try:
+			os.unlink(parquet_tmp_name)
+		except Exception:
+			pass
+
+
+def write_empty_parquet(schema: list[tuple[str, str]]) -> None:
+	"""Write an empty parquet file with the given (name, DuckDB type) columns to stdout."""
+	# Typed NULLs from an in-memory DuckDB; no pyarrow needed
+	columns = ", ".join(f"CAST(NULL AS {col_type}) AS {name}" for name, col_type in schema)
+	con = duckdb.connect(config=DUCKDB_CONFIG)
+	try:
+		copy_to_stdout(con, f"COPY (SELECT {columns} LIMIT 0) TO ? (FORMAT 'parquet', USE_TMP_FILE false)")
+	finally:
+		con.close()
+
+
+def missing_tables(con: duckdb.DuckDBPyConnection, required: tuple[str, ...]) -> list[str]:
+	"""Return the required tables not present in the database."""
+	present = {
+		row[0]
+		for row in con.execute(
+			"SELECT table_name FROM information_schema.tables WHERE list_contains(?, table_name)",
+			[list(required)],
+		).fetchall()
+	}
+	return [t for t in required if t not in present]
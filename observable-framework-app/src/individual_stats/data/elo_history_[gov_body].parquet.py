@@ -7,12 +7,53 @@ from __future__ import annotations
 
 import os
 import sys
-import tempfile
 import logging
 import argparse
 import duckdb
 from pathlib import Path
 
+# Shared loader helpers live in src/_loader_common.py
+_SRC_DIR = str(Path(__file__).resolve().parents[2])
+if _SRC_DIR not in sys.path:
+	sys.path.insert(0, _SRC_DIR)
+
+from _loader_common import (
+	DUCKDB_CONFIG, copy_to_stdout, missing_tables, write_empty_parquet,
+)
+
+# Tables the query reads; if any is missing (DB not fully built yet) the
+# loader returns an empty dataset instead of failing
+REQUIRED_TABLES = ("wrestler_history", "tournaments", "tournament_rounds")
+
+# Output columns with the parquet types the COPY below writes (so an empty
+# dataset reads the same as a real one)
+OUTPUT_SCHEMA = [
+	("name", "VARCHAR"),
+	("event_id", "VARCHAR"),
+	("tournament_name", "VARCHAR"),
+	("round_label", "VARCHAR"),
+	("round_detail", "VARCHAR"),
+	("team", "VARCHAR"),
+	("role", "VARCHAR"),
+	("weight_class", "VARCHAR"),
+	("start_date", "DATE"),
+	("opponent_name", "VARCHAR"),
+	("opponent_team", "VARCHAR"),
+	("opponent_pre_elo", "DOUBLE"),
+	("opponent_post_elo", "DOUBLE"),
+	("decision_type", "VARCHAR"),
+	("decision_type_code", "VARCHAR"),
+	("bye", "BOOLEAN"),
+	("pre_elo", "DOUBLE"),
+	("post_elo", "DOUBLE"),
+	("adjustment", "DOUBLE"),
+	("expected_score", "DOUBLE"),
+	("margin", "INTEGER"),
+	("fall_seconds", "INTEGER"),
+	("last_updated", "TIMESTAMP"),
+	("elo_sequence", "BIGINT"),
+]
+
 
 def main() -> None:
 	logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s", stream=sys.stderr)
@@ -36,41 +77,7 @@ def main() -> None:
 	
 	if not db_file.exists():
 		log.warning("Database file not found: %s. Returning empty dataset.", db_file)
-		# Output an empty parquet file
-		import pyarrow as pa
-		import pyarrow.parquet as pq
-		schema = pa.schema([
-			('name', pa.string()),
-			('event_id', pa.int64()),
-			('tournament_name', pa.string()),
-			('round_label', pa.string()),
-			('round_detail', pa.string()),
-			('team', pa.string()),
-			('role', pa.string()),
-			('weight_class', pa.string()),
-			('start_date', pa.timestamp('us')),
-			('opponent_name', pa.string()),
-			('opponent_team', pa.string()),
-			('opponent_pre_elo', pa.float64()),
-			('opponent_post_elo', pa.float64()),
-			('decision_type', pa.string()),
-			('decision_type_code', pa.string()),
-			('bye', pa.bool_()),
-			('bye', pa.bool_()),
-			('pre_elo', pa.float64()),
-			('post_elo', pa.float64()),
-			('adjustment', pa.float64()),
-			('expected_score', pa.float64()),
-			('margin', pa.int64()),
-			('fall_seconds', pa.int64()),
-			('last_updated', pa.timestamp('us')),
-			('elo_sequence', pa.int64()),
-			('start_date_iso', pa.string()),
-			('last_updated_iso', pa.string())
-		])
-		empty_table = pa.table({field.name: pa.array([], type=field.type) for field in schema})
-		pq.write_table(empty_table, sys.stdout.buffer)
-		sys.stdout.flush()
+		write_empty_parquet(OUTPUT_SCHEMA)
 		return
 	
 	log.info("Found database: %s", db_file)
@@ -91,82 +98,32 @@ def main() -> None:
 		wh.pre_elo, wh.post_elo, wh.adjustment, wh.expected_score,
 		wh.margin, wh.fall_seconds,
 		wh.last_updated,
-		wh.elo_sequence,
-		-- ISO string projections to ease JSON consumption in front-ends
-		CAST(wh.start_date AS VARCHAR) AS start_date_iso,
-		CAST(wh.last_updated AS VARCHAR) AS last_updated_iso
+		wh.elo_sequence
 	  FROM wrestler_history wh
 	  LEFT JOIN tournaments t ON t.event_id = wh.event_id
 	  LEFT JOIN tournament_rounds tr ON tr.event_id = wh.event_id AND tr.round_id = wh.round_id
-	  ORDER BY wh.start_date NULLS LAST, wh.event_id, wh.round_order NULLS LAST, wh.elo_sequence NULLS LAST, wh.match_rowid, wh.role
-	) TO ? (FORMAT 'parquet')
+	  -- elo_sequence already follows the (date, event, round) order Elo was
+	  -- applied in, so it is the only tie-breaker needed within a day
+	  ORDER BY wh.start_date NULLS LAST, wh.elo_sequence NULLS LAST
+	) TO ? (FORMAT 'parquet', COMPRESSION 'zstd', ROW_GROUP_SIZE 100000, USE_TMP_FILE false)
 	"""
 
-	parquet_tmp = None
-	parquet_tmp_name: str | None = None
 	con = None
 	try:
-		con = duckdb.connect(str(db_file), read_only=True)
-		
-		parquet_tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".parquet")
-		parquet_tmp_name = parquet_tmp.name
-		parquet_tmp.close()  # DuckDB needs to open it for writing
-
-		con.execute(sql, [parquet_tmp_name])
-		
-		# Stream parquet file to stdout
-		with open(parquet_tmp_name, "rb") as f:
-			sys.stdout.buffer.write(f.read())
-			sys.stdout.flush()
+		con = duckdb.connect(str(db_file), read_only=True, config=DUCKDB_CONFIG)
+		missing = missing_tables(con, REQUIRED_TABLES)
+		if missing:
+			log.warning("Required tables not found: %s. Returning empty dataset.", ", ".join(missing))
+			write_empty_parquet(OUTPUT_SCHEMA)
+			return
+		copy_to_stdout(con, sql)
 		
 		log.info("Parquet file streamed to stdout successfully")
 		
 	except Exception as e:
-		# Check if error is due to missing table
-		if "wrestler_history" in str(e) or "tournaments" in str(e) or "tournament_rounds" in str(e):
-			log.warning("Required tables not found: %s. Returning empty dataset.", e)
-			# Output empty parquet
-			import pyarrow as pa
-			import pyarrow.parquet as pq
-			schema = pa.schema([
-				('name', pa.string()),
-				('event_id', pa.int64()),
-				('tournament_name', pa.string()),
-				('round_label', pa.string()),
-				('round_detail', pa.string()),
-				('team', pa.string()),
-				('role', pa.string()),
-				('weight_class', pa.string()),
-				('start_date', pa.timestamp('us')),
-				('opponent_name', pa.string()),
-				('opponent_team', pa.string()),
-				('opponent_pre_elo', pa.float64()),
-				('opponent_post_elo', pa.float64()),
-				('decision_type', pa.string()),
-				('decision_type_code', pa.string()),
-				('pre_elo', pa.float64()),
-				('post_elo', pa.float64()),
-				('adjustment', pa.float64()),
-				('expected_score', pa.float64()),
-				('margin', pa.int64()),
-				('fall_seconds', pa.int64()),
-				('last_updated', pa.timestamp('us')),
-				('elo_sequence', pa.int64()),
-				('start_date_iso', pa.string()),
-				('last_updated_iso', pa.string())
-			])
-			empty_table = pa.table({field.name: pa.array([], type=field.type) for field in schema})
-			pq.write_table(empty_table, sys.stdout.buffer)
-			sys.stdout.flush()
-		else:
-			log.error("Failed to export wrestler_history: %s", e)
-			sys.exit(1)
+		log.error("Failed to export wrestler_history: %s", e)
+		sys.exit(1)
 	finally:
-		try:
-			if parquet_tmp_name:
-				os.unlink(parquet_tmp_name)
-		except Exception:
-			pass
 		try:
 			if con:
 				con.close()
@@ -7,12 +7,44 @@ from __future__ import annotations
 
 import os
 import sys
-import tempfile
 import logging
 import argparse
 import duckdb
 from pathlib import Path
 
+# Shared loader helpers live in src/_loader_common.py
+_SRC_DIR = str(Path(__file__).resolve().parents[2])
+if _SRC_DIR not in sys.path:
+	sys.path.insert(0, _SRC_DIR)
+
+from _loader_common import (
+	DUCKDB_CONFIG, copy_to_stdout, missing_tables, write_empty_parquet,
+)
+
+# Tables the query reads; if any is missing (DB not fully built yet) the
+# loader returns an empty dataset instead of failing
+REQUIRED_TABLES = ("wrestlers",)
+
+# Output columns with the parquet types the COPY below writes (so an empty
+# dataset reads the same as a real one)
+OUTPUT_SCHEMA = [
+	("name", "VARCHAR"),
+	("matches_played", "INTEGER"),
+	("wins", "INTEGER"),
+	("losses", "INTEGER"),
+	("wins_fall", "INTEGER"),
+	("losses_fall", "INTEGER"),
+	("current_elo", "DOUBLE"),
+	("best_elo", "DOUBLE"),
+	("last_team", "VARCHAR"),
+	("last_opponent_name", "VARCHAR"),
+	("last_adjustment", "DOUBLE"),
+	("opponent_avg_elo", "DOUBLE"),
+	("last_updated", "TIMESTAMP"),
+	("best_date", "VARCHAR"),
+	("last_start_date", "VARCHAR"),
+]
+
 
 def main() -> None:
 	logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s", stream=sys.stderr)
@@ -36,30 +68,7 @@ def main() -> None:
 	
 	if not db_file.exists():
 		log.warning("Database file not found: %s. Returning empty dataset.", db_file)
-		# Output an empty parquet file
-		import pyarrow as pa
-		import pyarrow.parquet as pq
-		schema = pa.schema([
-			('name', pa.string()),
-			('matches_played', pa.int64()),
-			('wins', pa.int64()),
-			('losses', pa.int64()),
-			('wins_fall', pa.int64()),
-			('losses_fall', pa.int64()),
-			('current_elo', pa.float64()),
-			('best_elo', pa.float64()),
-			('last_team', pa.string()),
-			('last_opponent_name', pa.string()),
-			('last_adjustment', pa.float64()),
-			('opponent_avg_elo', pa.float64()),
-			('last_updated', pa.timestamp('us')),
-			('best_date', pa.string()),
-			('last_start_date', pa.string()),
-			('last_updated_iso', pa.string())
-		])
-		empty_table = pa.table({field.name: pa.array([], type=field.type) for field in schema})
-		pq.write_table(empty_table, sys.stdout.buffer)
-		sys.stdout.flush()
+		write_empty_parquet(OUTPUT_SCHEMA)
 		return
 	
 	log.info("Found database: %s", db_file)
@@ -83,69 +92,28 @@ def main() -> None:
 	    w.last_updated,
 	    -- ISO string projections
 	    CAST(w.best_date AS VARCHAR) AS best_date,
-	    CAST(w.last_start_date AS VARCHAR) AS last_start_date,
-	    CAST(w.last_updated AS VARCHAR) AS last_updated_iso
+	    CAST(w.last_start_date AS VARCHAR) AS last_start_date
 	  FROM wrestlers w
 	  ORDER BY w.name
-	) TO ? (FORMAT 'parquet')
+	) TO ? (FORMAT 'parquet', COMPRESSION 'zstd', ROW_GROUP_SIZE 100000, USE_TMP_FILE false)
 	"""
 
-	parquet_tmp = None
-	parquet_tmp_name: str | None = None
 	con = None
 	try:
-		con = duckdb.connect(str(db_file), read_only=True)
-		
-		parquet_tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".parquet")
-		parquet_tmp_name = parquet_tmp.name
-		parquet_tmp.close()  # DuckDB needs to open it for writing
-
-		con.execute(sql, [parquet_tmp_name])
-		
-		# Stream parquet file to stdout
-		with open(parquet_tmp_name, "rb") as f:
-			sys.stdout.buffer.write(f.read())
-			sys.stdout.flush()
+		con = duckdb.connect(str(db_file), read_only=True, config=DUCKDB_CONFIG)
+		missing = missing_tables(con, REQUIRED_TABLES)
+		if missing:
+			log.warning("Required tables not found: %s. Returning empty dataset.", ", ".join(missing))
+			write_empty_parquet(OUTPUT_SCHEMA)
+			return
+		copy_to_stdout(con, sql)
 		
 		log.info("Parquet file streamed to stdout successfully")
 		
 	except Exception as e:
-		# Check if error is due to missing table
-		if "wrestlers" in str(e).lower():
-			log.warning("Required tables not found: %s. Returning empty dataset.", e)
-			# Output empty parquet
-			import pyarrow as pa
-			import pyarrow.parquet as pq
-			schema = pa.schema([
-				('name', pa.string()),
-				('matches_played', pa.int64()),
-				('wins', pa.int64()),
-				('losses', pa.int64()),
-				('wins_fall', pa.int64()),
-				('losses_fall', pa.int64()),
-				('current_elo', pa.float64()),
-				('best_elo', pa.float64()),
-				('last_team', pa.string()),
-				('last_opponent_name', pa.string()),
-				('last_adjustment', pa.float64()),
-				('opponent_avg_elo', pa.float64()),
-				('last_updated', pa.timestamp('us')),
-				('best_date', pa.string()),
-				('last_start_date', pa.string()),
-				('last_updated_iso', pa.string())
-			])
-			empty_table = pa.table({field.name: pa.array([], type=field.type) for field in schema})
-			pq.write_table(empty_table, sys.stdout.buffer)
-			sys.stdout.flush()
-		else:
-			log.error("Failed to export wrestlers: %s", e)
-			sys.exit(1)
+		log.error("Failed to export wrestlers: %s", e)
+		sys.exit(1)
 	finally:
-		try:
-			if parquet_tmp_name:
-				os.unlink(parquet_tmp_name)
-		except Exception:
-			pass
 		try:
 			if con:
 				con.close()
@@ -7,12 +7,49 @@ from __future__ import annotations
 
 import os
 import sys
-import tempfile
 import logging
 import argparse
 import duckdb
+from datetime import date
 from pathlib import Path
 
+# Shared loader helpers live in src/_loader_common.py
+_SRC_DIR = str(Path(__file__).resolve().parents[2])
+if _SRC_DIR not in sys.path:
+	sys.path.insert(0, _SRC_DIR)
+
+from _loader_common import (
+	DUCKDB_CONFIG, SEASON_MACRO_SQL, copy_to_stdout, missing_tables, write_empty_parquet,
+)
+
+# Tables the query reads; if any is missing (DB not fully built yet) the
+# loader returns an empty dataset instead of failing
+REQUIRED_TABLES = ("wrestler_history", "wrestlers", "tournaments")
+
+# Output columns with the parquet types the COPY below writes (so an empty
+# dataset reads the same as a real one)
+# SUM() of INTEGER is HUGEINT, which parquet stores as DOUBLE
+OUTPUT_SCHEMA = [
+	("name", "VARCHAR"),
+	("team", "VARCHAR"),
+	("season", "VARCHAR"),
+	("matches_played", "BIGINT"),
+	("wins", "DOUBLE"),
+	("losses", "DOUBLE"),
+	("wins_fall", "DOUBLE"),
+	("highest_elo", "DOUBLE"),
+	("current_elo", "DOUBLE"),
+	("biggest_upset_win", "DOUBLE"),
+	("upset_event_id", "VARCHAR"),
+	("upset_date", "VARCHAR"),
+	("upset_tournament_name", "VARCHAR"),
+	("upset_opponent_name", "VARCHAR"),
+	("upset_opponent_team", "VARCHAR"),
+	("upset_result", "VARCHAR"),
+	("win_pct", "DOUBLE"),
+	("fall_pct", "DOUBLE"),
+]
+
 
 def main() -> None:
 	logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s", stream=sys.stderr)
@@ -21,6 +58,7 @@ def main() -> None:
 	# Parse command-line arguments
 	parser = argparse.ArgumentParser(description="Load individual leaderboards for a specific gov_body")
 	parser.add_argument("--gov_body", required=True, help="The governing body identifier (e.g., vhsl)")
+	parser.add_argument("--since_season", type=int, help="Only include seasons starting in or after this year (e.g., 2023 for 2023-2024)")
 	args = parser.parse_args()
 	
 	gov_body = args.gov_body
@@ -36,33 +74,7 @@ def main() -> None:
 	
 	if not db_file.exists():
 		log.warning("Database file not found: %s. Returning empty dataset.", db_file)
-		# Output an empty parquet file
-		import pyarrow as pa
-		import pyarrow.parquet as pq
-		schema = pa.schema([
-			('name', pa.string()),
-			('team', pa.string()),
-			('season', pa.string()),
-			('matches_played', pa.int64()),
-			('wins', pa.int64()),
-			('losses', pa.int64()),
-			('wins_fall', pa.int64()),
-			('highest_elo', pa.float64()),
-			('current_elo', pa.float64()),
-			('current_elo', pa.float64()),
-			('biggest_upset_win', pa.float64()),
-			('upset_event_id', pa.int64()),
-			('upset_date', pa.string()),
-			('upset_tournament_name', pa.string()),
-			('upset_opponent_name', pa.string()),
-			('upset_opponent_team', pa.string()),
-			('upset_result', pa.string()),
-			('win_pct', pa.float64()),
-			('fall_pct', pa.float64())
-		])
-		empty_table = pa.table({field.name: pa.array([], type=field.type) for field in schema})
-		pq.write_table(empty_table, sys.stdout.buffer)
-		sys.stdout.flush()
+		write_empty_parquet(OUTPUT_SCHEMA)
 		return
 	
 	log.info("Found database: %s", db_file)
@@ -79,64 +91,43 @@ def main() -> None:
 	      wh.role,
 	      wh.decision_type,
 	      wh.decision_type_code,
-	      wh.pre_elo,
 	      wh.post_elo,
 	      wh.adjustment,
-	      -- Calculate season: Sept 1 to Aug 31
-	      CASE 
-	        WHEN MONTH(wh.start_date) >= 9 
-	        THEN CAST(YEAR(wh.start_date) AS VARCHAR) || '-' || CAST(YEAR(wh.start_date) + 1 AS VARCHAR)
-	        ELSE CAST(YEAR(wh.start_date) - 1 AS VARCHAR) || '-' || CAST(YEAR(wh.start_date) AS VARCHAR)
-	      END AS season
+	      wh.opponent_name,
+	      wh.opponent_team,
+	      season_start_of(wh.start_date) AS season_start
 	    FROM wrestler_history wh
 	    WHERE wh.start_date IS NOT NULL
+	      AND wh.start_date >= getvariable('since_date')
 	      AND wh.bye = FALSE
 	  ),
 	  wrestler_stats AS (
 	    SELECT
 	      md.name,
 	      md.team,
-	      md.season,
+	      md.season_start,
 	      COUNT(*) as matches_played,
 	      SUM(CASE WHEN md.role IN ('W', 'winner') THEN 1 ELSE 0 END) as wins,
-	      SUM(CASE WHEN md.role IN ('W', 'winner') AND (LOWER(md.decision_type) LIKE '%fall%' OR md.decision_type_code IN ('FALL', 'PIN')) THEN 1 ELSE 0 END) as wins_fall,
+	      SUM(CASE WHEN md.role IN ('W', 'winner') AND (md.decision_type ILIKE '%fall%' OR md.decision_type_code IN ('FALL', 'PIN')) THEN 1 ELSE 0 END) as wins_fall,
 	      SUM(CASE WHEN md.role IN ('L', 'loser') THEN 1 ELSE 0 END) as losses,
 	      MAX(md.post_elo) as highest_elo,
-	      MAX(CASE WHEN md.role IN ('W', 'winner') AND md.adjustment > 0 THEN md.adjustment ELSE NULL END) as biggest_upset_win
+	      MAX(md.adjustment) FILTER (WHERE md.role IN ('W', 'winner') AND md.adjustment > 0) as biggest_upset_win,
+	      -- Details of that biggest upset, from the same aggregate pass; one
+	      -- struct keeps every field from the same match when adjustments tie
+	      arg_max({
+	        'event_id': md.event_id,
+	        'start_date': md.start_date,
+	        'decision_type': md.decision_type,
+	        'opponent_name': md.opponent_name,
+	        'opponent_team': md.opponent_team
+	      }, md.adjustment) FILTER (WHERE md.role IN ('W', 'winner') AND md.adjustment > 0) as upset
 	    FROM match_data md
-	    GROUP BY md.name, md.team, md.season
-	  ),
-	  upset_details AS (
-	    SELECT
-	      wh.name,
-	      wh.team,
-	      CASE 
-	        WHEN MONTH(wh.start_date) >= 9 
-	        THEN CAST(YEAR(wh.start_date) AS VARCHAR) || '-' || CAST(YEAR(wh.start_date) + 1 AS VARCHAR)
-	        ELSE CAST(YEAR(wh.start_date) - 1 AS VARCHAR) || '-' || CAST(YEAR(wh.start_date) AS VARCHAR)
-	      END AS season,
-	      wh.event_id,
-	      wh.start_date,
-	      wh.decision_type,
-	      wh.opponent_name,
-	      wh.opponent_team,
-	      wh.adjustment,
-	      ROW_NUMBER() OVER (PARTITION BY wh.name, wh.team, 
-	        CASE 
-	          WHEN MONTH(wh.start_date) >= 9 
-	          THEN CAST(YEAR(wh.start_date) AS VARCHAR) || '-' || CAST(YEAR(wh.start_date) + 1 AS VARCHAR)
-	          ELSE CAST(YEAR(wh.start_date) - 1 AS VARCHAR) || '-' || CAST(YEAR(wh.start_date) AS VARCHAR)
-	        END
-	        ORDER BY wh.adjustment DESC) as rn
-	    FROM wrestler_history wh
-	    WHERE wh.role IN ('W', 'winner') 
-	      AND wh.adjustment > 0
-	      AND wh.bye = FALSE
+	    GROUP BY md.name, md.team, md.season_start
 	  )
 	  SELECT
 	    ws.name,
 	    ws.team,
-	    ws.season,
+	    season_label(ws.season_start) AS season,
 	    ws.matches_played,
 	    ws.wins,
 	    ws.losses,
@@ -144,12 +135,12 @@ def main() -> None:
 	    ws.highest_elo,
 	    w.current_elo,
 	    ws.biggest_upset_win,
-	    ud.event_id as upset_event_id,
-	    CAST(ud.start_date AS VARCHAR) as upset_date,
+	    ws.upset.event_id as upset_event_id,
+	    CAST(ws.upset.start_date AS VARCHAR) as upset_date,
 	    t.name as upset_tournament_name,
-	    ud.opponent_name as upset_opponent_name,
-	    ud.opponent_team as upset_opponent_team,
-	    ud.decision_type as upset_result,
+	    ws.upset.opponent_name as upset_opponent_name,
+	    ws.upset.opponent_team as upset_opponent_team,
+	    ws.upset.decision_type as upset_result,
 	    CASE 
 	      WHEN ws.matches_played > 0 THEN CAST(ws.wins AS DOUBLE) / CAST(ws.matches_played AS DOUBLE) * 100
 	      ELSE 0
@@ -160,70 +151,32 @@ def main() -> None:
 	    END as fall_pct
 	  FROM wrestler_stats ws
 	  LEFT JOIN wrestlers w ON ws.name = w.name
-	  LEFT JOIN upset_details ud ON ws.name = ud.name AND ws.team = ud.team AND ws.season = ud.season AND ud.rn = 1
-	  LEFT JOIN tournaments t ON ud.event_id = t.event_id
+	  LEFT JOIN tournaments t ON ws.upset.event_id = t.event_id
 	  WHERE ws.matches_played > 0
-	  ORDER BY ws.season DESC, ws.matches_played DESC
-	) TO ? (FORMAT 'parquet')
+	  ORDER BY ws.season_start DESC, ws.matches_played DESC
+	) TO ? (FORMAT 'parquet', COMPRESSION 'zstd', ROW_GROUP_SIZE 100000, USE_TMP_FILE false)
 	"""
 
-	parquet_tmp = None
-	parquet_tmp_name: str | None = None
 	con = None
 	try:
-		con = duckdb.connect(str(db_file), read_only=True)
-		
-		parquet_tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".parquet")
-		parquet_tmp_name = parquet_tmp.name
-		parquet_tmp.close()  # DuckDB needs to open it for writing
-
-		con.execute(sql, [parquet_tmp_name])
-		
-		# Stream parquet file to stdout
-		with open(parquet_tmp_name, "rb") as f:
-			sys.stdout.buffer.write(f.read())
-			sys.stdout.flush()
+		con = duckdb.connect(str(db_file), read_only=True, config=DUCKDB_CONFIG)
+		missing = missing_tables(con, REQUIRED_TABLES)
+		if missing:
+			log.warning("Required tables not found: %s. Returning empty dataset.", ", ".join(missing))
+			write_empty_parquet(OUTPUT_SCHEMA)
+			return
+		con.execute(SEASON_MACRO_SQL)
+		# Seasons start Sept 1; without --since_season every season is included
+		since_date = date(args.since_season, 9, 1) if args.since_season else date.min
+		con.execute("SET VARIABLE since_date = ?", [since_date])
+		copy_to_stdout(con, sql)
 		
 		log.info("Parquet file streamed to stdout successfully")
 		
 	except Exception as e:
-		# Check if error is due to missing table
-		if "wrestler_history" in str(e) or "tournaments" in str(e):
-			log.warning("Required tables not found: %s. Returning empty dataset.", e)
-			# Output empty parquet
-			import pyarrow as pa
-			import pyarrow.parquet as pq
-			schema = pa.schema([
-				('name', pa.string()),
-				('team', pa.string()),
-				('season', pa.string()),
-				('matches_played', pa.int64()),
-				('wins', pa.int64()),
-				('losses', pa.int64()),
-				('wins_fall', pa.int64()),
-				('highest_elo', pa.float64()),
-				('biggest_upset_win', pa.float64()),
-				('upset_event_id', pa.int64()),
-				('upset_date', pa.string()),
-				('upset_tournament_name', pa.string()),
-				('upset_opponent_name', pa.string()),
-				('upset_opponent_team', pa.string()),
-				('upset_result', pa.string()),
-				('win_pct', pa.float64()),
-				('fall_pct', pa.float64())
-			])
-			empty_table = pa.table({field.name: pa.array([], type=field.type) for field in schema})
-			pq.write_table(empty_table, sys.stdout.buffer)
-			sys.stdout.flush()
-		else:
-			log.error("Failed to export individual leaderboards: %s", e)
-			sys.exit(1)
+		log.error("Failed to export individual leaderboards: %s", e)
+		sys.exit(1)
 	finally:
-		try:
-			if parquet_tmp_name:
-				os.unlink(parquet_tmp_name)
-		except Exception:
-			pass
 		try:
 			if con:
 				con.close()
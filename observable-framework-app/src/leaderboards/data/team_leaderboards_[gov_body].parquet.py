@@ -7,12 +7,39 @@ from __future__ import annotations
 
 import os
 import sys
-import tempfile
 import logging
 import argparse
 import duckdb
+from datetime import date
 from pathlib import Path
 
+# Shared loader helpers live in src/_loader_common.py
+_SRC_DIR = str(Path(__file__).resolve().parents[2])
+if _SRC_DIR not in sys.path:
+	sys.path.insert(0, _SRC_DIR)
+
+from _loader_common import (
+	DUCKDB_CONFIG, SEASON_MACRO_SQL, copy_to_stdout, missing_tables, write_empty_parquet,
+)
+
+# Tables the query reads; if any is missing (DB not fully built yet) the
+# loader returns an empty dataset instead of failing
+REQUIRED_TABLES = ("wrestler_history",)
+
+# Output columns with the parquet types the COPY below writes (so an empty
+# dataset reads the same as a real one)
+# SUM() of INTEGER is HUGEINT, which parquet stores as DOUBLE
+OUTPUT_SCHEMA = [
+	("team", "VARCHAR"),
+	("season", "VARCHAR"),
+	("matches_played", "BIGINT"),
+	("wins", "DOUBLE"),
+	("losses", "DOUBLE"),
+	("wins_fall", "DOUBLE"),
+	("win_pct", "DOUBLE"),
+	("fall_pct", "DOUBLE"),
+]
+
 
 def main() -> None:
 	logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s", stream=sys.stderr)
@@ -21,6 +48,7 @@ def main() -> None:
 	# Parse command-line arguments
 	parser = argparse.ArgumentParser(description="Load team leaderboards for a specific gov_body")
 	parser.add_argument("--gov_body", required=True, help="The governing body identifier (e.g., vhsl)")
+	parser.add_argument("--since_season", type=int, help="Only include seasons starting in or after this year (e.g., 2023 for 2023-2024)")
 	args = parser.parse_args()
 	
 	gov_body = args.gov_body
@@ -36,22 +64,7 @@ def main() -> None:
 	
 	if not db_file.exists():
 		log.warning("Database file not found: %s. Returning empty dataset.", db_file)
-		# Output an empty parquet file
-		import pyarrow as pa
-		import pyarrow.parquet as pq
-		schema = pa.schema([
-			('team', pa.string()),
-			('season', pa.string()),
-			('matches_played', pa.int64()),
-			('wins', pa.int64()),
-			('losses', pa.int64()),
-			('wins_fall', pa.int64()),
-			('win_pct', pa.float64()),
-			('fall_pct', pa.float64())
-		])
-		empty_table = pa.table({field.name: pa.array([], type=field.type) for field in schema})
-		pq.write_table(empty_table, sys.stdout.buffer)
-		sys.stdout.flush()
+		write_empty_parquet(OUTPUT_SCHEMA)
 		return
 	
 	log.info("Found database: %s", db_file)
@@ -66,31 +79,27 @@ def main() -> None:
 	      wh.role,
 	      wh.decision_type,
 	      wh.decision_type_code,
-	      -- Calculate season: Sept 1 to Aug 31
-	      CASE 
-	        WHEN MONTH(wh.start_date) >= 9 
-	        THEN CAST(YEAR(wh.start_date) AS VARCHAR) || '-' || CAST(YEAR(wh.start_date) + 1 AS VARCHAR)
-	        ELSE CAST(YEAR(wh.start_date) - 1 AS VARCHAR) || '-' || CAST(YEAR(wh.start_date) AS VARCHAR)
-	      END AS season
+	      season_start_of(wh.start_date) AS season_start
 	    FROM wrestler_history wh
 	    WHERE wh.start_date IS NOT NULL
+	      AND wh.start_date >= getvariable('since_date')
 	      AND wh.bye = FALSE
 	      AND wh.team IS NOT NULL
 	  ),
 	  team_stats AS (
 	    SELECT
 	      team,
-	      season,
+	      season_start,
 	      COUNT(*) as matches_played,
 	      SUM(CASE WHEN role IN ('W', 'winner') THEN 1 ELSE 0 END) as wins,
-	      SUM(CASE WHEN role IN ('W', 'winner') AND (LOWER(decision_type) LIKE '%fall%' OR decision_type_code IN ('FALL', 'PIN')) THEN 1 ELSE 0 END) as wins_fall,
+	      SUM(CASE WHEN role IN ('W', 'winner') AND (decision_type ILIKE '%fall%' OR decision_type_code IN ('FALL', 'PIN')) THEN 1 ELSE 0 END) as wins_fall,
 	      SUM(CASE WHEN role IN ('L', 'loser') THEN 1 ELSE 0 END) as losses
 	    FROM match_data
-	    GROUP BY team, season
+	    GROUP BY team, season_start
 	  )
 	  SELECT
 	    team,
-	    season,
+	    season_label(season_start) AS season,
 	    matches_played,
 	    wins,
 	    losses,
@@ -105,58 +114,30 @@ def main() -> None:
 	    END as fall_pct
 	  FROM team_stats
 	  WHERE matches_played > 0
-	  ORDER BY season DESC, matches_played DESC
-	) TO ? (FORMAT 'parquet')
+	  ORDER BY season_start DESC, matches_played DESC
+	) TO ? (FORMAT 'parquet', COMPRESSION 'zstd', ROW_GROUP_SIZE 100000, USE_TMP_FILE false)
 	"""
 
-	parquet_tmp = None
-	parquet_tmp_name: str | None = None
 	con = None
 	try:
-		con = duckdb.connect(str(db_file), read_only=True)
-		
-		parquet_tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".parquet")
-		parquet_tmp_name = parquet_tmp.name
-		parquet_tmp.close()  # DuckDB needs to open it for writing
-
-		con.execute(sql, [parquet_tmp_name])
-		
-		# Stream parquet file to stdout
-		with open(parquet_tmp_name, "rb") as f:
-			sys.stdout.buffer.write(f.read())
-			sys.stdout.flush()
+		con = duckdb.connect(str(db_file), read_only=True, config=DUCKDB_CONFIG)
+		missing = missing_tables(con, REQUIRED_TABLES)
+		if missing:
+			log.warning("Required tables not found: %s. Returning empty dataset.", ", ".join(missing))
+			write_empty_parquet(OUTPUT_SCHEMA)
+			return
+		con.execute(SEASON_MACRO_SQL)
+		# Seasons start Sept 1; without --since_season every season is included
+		since_date = date(args.since_season, 9, 1) if args.since_season else date.min
+		con.execute("SET VARIABLE since_date = ?", [since_date])
+		copy_to_stdout(con, sql)
 		
 		log.info("Parquet file streamed to stdout successfully")
 		
 	except Exception as e:
-		# Check if error is due to missing table
-		if "wrestler_history" in str(e):
-			log.warning("Required tables not found: %s. Returning empty dataset.", e)
-			# Output empty parquet
-			import pyarrow as pa
-			import pyarrow.parquet as pq
-			schema = pa.schema([
-				('team', pa.string()),
-				('season', pa.string()),
-				('matches_played', pa.int64()),
-				('wins', pa.int64()),
-				('losses', pa.int64()),
-				('wins_fall', pa.int64()),
-				('win_pct', pa.float64()),
-				('fall_pct', pa.float64())
-			])
-			empty_table = pa.table({field.name: pa.array([], type=field.type) for field in schema})
-			pq.write_table(empty_table, sys.stdout.buffer)
-			sys.stdout.flush()
-		else:
-			log.error("Failed to export team leaderboards: %s", e)
-			sys.exit(1)
+		log.error("Failed to export team leaderboards: %s", e)
+		sys.exit(1)
 	finally:
-		try:
-			if parquet_tmp_name:
-				os.unlink(parquet_tmp_name)
-		except Exception:
-			pass
 		try:
 			if con:
 				con.close()
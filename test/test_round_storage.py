@@ -0,0 +1,199 @@
+"""
+Test suite for tournament_rounds storage and results capture helpers.
+
+Covers upsert_rounds, the zstd HTML helpers, legacy TEXT -> BLOB migration,
+results fragment extraction and parse_match_text_many, against an in-memory
+DuckDB.
+
+Run with: uv run python test/test_round_storage.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import from code/ (ahead of the
+# stdlib 'code' module); skipped if a runner already put it there
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+import duckdb
+
+from code.shared_trackwrestling import (
+    compress_html,
+    compress_legacy_rounds,
+    decompress_html,
+    ensure_rounds_table,
+    extract_results_fragment,
+    get_round_html,
+    upsert_rounds,
+)
+from code.parse_round_html import parse_match_text, parse_match_text_many
+
+
+def _rounds_db() -> duckdb.DuckDBPyConnection:
+    """In-memory database with an empty tournament_rounds table."""
+    conn = duckdb.connect()
+    ensure_rounds_table(conn)
+    return conn
+
+
+def _insert_legacy_round(conn: duckdb.DuckDBPyConnection, event_id: str, round_id: str, raw_html: str) -> None:
+    """Insert a row the way it was stored before raw_html_zst existed."""
+    conn.execute(
+        """
+        INSERT INTO tournament_rounds (event_id, round_id, label, raw_html)
+        VALUES (?, ?, ?, ?)
+        """,
+        [event_id, round_id, round_id, raw_html],
+    )
+
+
+def test_compress_round_trip():
+    html = "<section class='tw-list'><h2>106</h2><ul><li>Zoë (Ñorth) over Li (Ōak) Fall 1:23</li></ul></section>"
+    blob = compress_html(html)
+    assert isinstance(blob, bytes)
+    assert decompress_html(blob) == html
+    assert decompress_html(None) is None
+
+
+def test_upsert_rounds_last_row_wins():
+    conn = _rounds_db()
+    merged = upsert_rounds(conn, [
+        ("1", "r1", "Round 1", "<p>first</p>"),
+        ("1", "r2", "Round 2", "<p>other</p>"),
+        ("1", "r1", "Round 1 (final)", "<p>second</p>"),
+    ])
+    assert merged == 3
+    rows = conn.execute("SELECT round_id, label FROM tournament_rounds ORDER BY round_id").fetchall()
+    assert rows == [("r1", "Round 1 (final)"), ("r2", "Round 2")], rows
+    assert get_round_html(conn, "1", "r1") == "<p>second</p>"
+
+
+def test_upsert_rounds_conflict_replaces_legacy_html():
+    conn = _rounds_db()
+    _insert_legacy_round(conn, "1", "r1", "<p>legacy</p>")
+    upsert_rounds(conn, [("1", "r1", "Round 1", "<p>recaptured</p>")])
+    raw_html, raw_html_zst, label = conn.execute(
+        "SELECT raw_html, raw_html_zst, label FROM tournament_rounds WHERE event_id = '1' AND round_id = 'r1'"
+    ).fetchone()
+    assert raw_html is None
+    assert decompress_html(raw_html_zst) == "<p>recaptured</p>"
+    assert label == "Round 1"
+    assert upsert_rounds(conn, []) == 0
+
+
+def test_compress_legacy_rounds():
+    conn = _rounds_db()
+    legacy = {f"r{i}": f"<p>round {i}</p>" for i in range(5)}
+    for round_id, html in legacy.items():
+        _insert_legacy_round(conn, "1", round_id, html)
+    upsert_rounds(conn, [("1", "new", "New", "<p>new</p>")])
+
+    # Smaller batches than rows exercises the batching loop
+    assert compress_legacy_rounds(conn, batch_size=2) == len(legacy)
+    assert compress_legacy_rounds(conn) == 0
+    remaining = conn.execute("SELECT COUNT(*) FROM tournament_rounds WHERE raw_html IS NOT NULL").fetchone()[0]
+    assert remaining == 0
+    for round_id, html in legacy.items():
+        assert get_round_html(conn, "1", round_id) == html
+    assert get_round_html(conn, "1", "new") == "<p>new</p>"
+
+
+def test_get_round_html_legacy_and_missing():
+    conn = _rounds_db()
+    _insert_legacy_round(conn, "1", "r1", "<p>legacy</p>")
+    assert get_round_html(conn, "1", "r1") == "<p>legacy</p>"
+    assert get_round_html(conn, "1", "missing") is None
+
+
+def test_ensure_rounds_table_backfills_zst_column():
+    conn = duckdb.connect()
+    conn.execute(
+        """
+        CREATE TABLE tournament_rounds (
+            event_id TEXT, round_id TEXT, label TEXT, raw_html TEXT, parsed_ok BOOLEAN,
+            first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (event_id, round_id)
+        )
+        """
+    )
+    ensure_rounds_table(conn)
+    cols = {r[0] for r in conn.execute("DESCRIBE tournament_rounds").fetchall()}
+    assert "raw_html_zst" in cols
+
+
+def test_extract_results_fragment():
+    page = (
+        "<html><head><script>var x = 1;</script></head><body><div id='pageContent'>"
+        "<div id='results'><section class='tw-list'><h2>106</h2><ul><li>a</li></ul></section></div>"
+        "<table class='tw-table'><tr><td>113</td></tr></table>"
+        "</div></body></html>"
+    )
+    fragment = extract_results_fragment(page)
+    # #results contains the section, so it appears once, as part of #results
+    assert fragment.count("tw-list") == 1, fragment
+    assert "tw-table" in fragment
+    assert "script" not in fragment
+    assert extract_results_fragment("<html><body><p>nothing here</p></body></html>") is None
+
+
+def test_parse_match_text_many():
+    texts = [
+        "Round 1 - Alex Martinez (Central) won by fall over Jordan Lee (Westside) (Fall 1:23)",
+        "Round 1 - Alex Martinez (Central) received a bye",
+        "Round 1 - Alex Martinez (Central) won by fall over Jordan Lee (Westside) (Fall 1:23)",
+    ]
+    results = parse_match_text_many(texts)
+    assert results == [parse_match_text(t) for t in texts]
+    # Each result is its own dict; mutating one must not leak into the cache
+    results[0]["winner_name"] = "changed"
+    assert results[2]["winner_name"] != "changed"
+    assert parse_match_text(texts[0])["winner_name"] != "changed"
+
+
+TESTS = [
+    test_compress_round_trip,
+    test_upsert_rounds_last_row_wins,
+    test_upsert_rounds_conflict_replaces_legacy_html,
+    test_compress_legacy_rounds,
+    test_get_round_html_legacy_and_missing,
+    test_ensure_rounds_table_backfills_zst_column,
+    test_extract_results_fragment,
+    test_parse_match_text_many,
+]
+
+
+def run_tests():
+    """Run all tests and report results."""
+    passed = 0
+    failed = 0
+
+    print(f"Running {len(TESTS)} tests...\n")
+    print("=" * 80)
+
+    for i, test in enumerate(TESTS, 1):
+        print(f"\n[{i}/{len(TESTS)}] {test.__name__}")
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ FAILED: {type(e).__name__}: {e}")
+            failed += 1
+        else:
+            print("✓ PASSED")
+            passed += 1
+
+    # Summary
+    print("\n" + "=" * 80)
+    print(f"\nResults: {passed} passed, {failed} failed out of {len(TESTS)} tests")
+
+    if failed == 0:
+        print("🎉 All tests passed!")
+        return 0
+    else:
+        print(f"⚠️  {failed} test(s) failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(run_tests())